@@ -0,0 +1,29 @@
+"""
+File: __init__.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Rolling Die Maze solver package. Importing the package only
+             loads the solver; plotting lives in rollingdie.plotting and
+             pulls in numpy and matplotlib on demand.
+"""
+
+from .dice import Dice
+from .maze import Maze, loadMaze
+from .node import Node
+from .priorityQueue import PriorityQueue
+from .heuristic import Heuristic
+from .search import Problem, aStarSearch
+from .checkpoint import SearchCheckpoint
+from .realtime import LRTAStar
+from .game import Game
+from .parallel import solveAll
+from .stream import readRecords, solveRecords, runStream
+from .cbs import ConflictBasedSearch
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+__all__ = ['Dice', 'Maze', 'loadMaze', 'Node', 'PriorityQueue', 'Heuristic',
+           'Problem', 'aStarSearch', 'SearchCheckpoint', 'LRTAStar', 'Game', 'solveAll',
+           'readRecords', 'solveRecords', 'runStream', 'ConflictBasedSearch']
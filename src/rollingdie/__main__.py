@@ -0,0 +1,306 @@
+"""
+File: __main__.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Command line entry point of the Rolling Die Maze solver, run as
+             "python -m rollingdie"
+"""
+
+import argparse
+
+from .checkpoint import INTERVAL
+from .game import Game
+from .priorityQueue import TieBreaking
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+HEURISTICS = ['fancy_manhattan', 'manhattan', 'euclidean', 'diagonal', 'die_distance']
+
+ENGINES = ['astar', 'fringe', 'graph']
+
+
+def parseArguments(argv=None):
+    """
+    Parse the command line arguments.
+    :param argv: list of arguments, defaults to sys.argv[1:]
+    :return: argparse namespace
+    """
+    parser = argparse.ArgumentParser(prog='rollingdie',
+                                     description='Solve a rolling-die maze with A* search.')
+    parser.add_argument('layout', nargs='?',
+                        help="maze's filename, e.g. map1.txt, or with --stream a file of "
+                             "maze records, standard input when omitted or '-'")
+    parser.add_argument('heuristic', nargs='?',
+                        help="heuristic name, e.g. manhattan, or auto to run the heuristic "
+                             "and engine expected to be the fastest on the maze. All "
+                             "heuristics are run when omitted")
+    parser.add_argument('--no-plot', dest='plot', action='store_false',
+                        help='do not plot the performance graph (numpy and '
+                             'matplotlib are then never imported)')
+    parser.add_argument('--cache-size', type=int, default=None,
+                        help='bound the per-search heuristic cache to this many '
+                             'states (unbounded by default)')
+    parser.add_argument('--tie-breaking', default='none', choices=TieBreaking.names(),
+                        help='how the fringe orders nodes with equal F cost')
+    parser.add_argument('--contract', action='store_true',
+                        help='prune dead ends and collapse corridors before the search')
+    parser.add_argument('--trace', metavar='FILE', default=None,
+                        help='record a binary trace of the search to FILE, suffixed '
+                             'with the heuristic name when running all heuristics')
+    parser.add_argument('--trace-capacity', type=positiveInt, default=1 << 16,
+                        help='number of trace records kept, older ones are overwritten')
+    parser.add_argument('--trace-pushes', action='store_true',
+                        help='also record the nodes pushed and updated, not only the '
+                             'expansions')
+    parser.add_argument('--checkpoint', metavar='FILE', default=None,
+                        help='snapshot the A* search to FILE from time to time and resume '
+                             'from FILE when it exists, suffixed with the heuristic name '
+                             'when running all heuristics')
+    parser.add_argument('--checkpoint-interval', type=float, default=INTERVAL,
+                        help='fewest seconds between two snapshots, which also never take '
+                             'more than 5%% of the search time')
+    parser.add_argument('--closed-set', choices=['set', 'bitset'], default='set',
+                        help='keep the visited states in a set of nodes or in a bitset of '
+                             'one bit per state, memory-mapped for very large mazes')
+    parser.add_argument('--engine', choices=ENGINES, default=None,
+                        help='search with A* on a priority queue ( default ), with Fringe '
+                             'Search on a linked list or with A* on the state graph of the '
+                             'maze compiled into arrays ( needs numpy )')
+    parser.add_argument('--realtime', type=int, metavar='TRIALS', default=None,
+                        help='run the real-time LRTA* agent for at most TRIALS trials '
+                             'instead of a full A* search')
+    parser.add_argument('--max-steps', type=int, default=None,
+                        help='moves after which a trial of the real-time agent gives up, '
+                             '4 per state ( location, orientation ) of the maze by default')
+    parser.add_argument('--lookahead', type=int, default=1,
+                        help='rolls the real-time agent looks ahead before every move')
+    parser.add_argument('--time-budget-ms', type=float, default=None,
+                        help='time per move after which the real-time agent stops '
+                             'deepening its lookahead')
+    parser.add_argument('--waypoint', metavar='X,Y', action='append', type=parseCell,
+                        help='visit the location ( 0,0 being bottom left ) before the '
+                             'goal, may be repeated')
+    parser.add_argument('--any-order', dest='ordered', action='store_false',
+                        help='visit the waypoints in the order with the fewest moves '
+                             'instead of the given order')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='processes counting the moves between waypoints or solving '
+                             'the mazes of a stream, one per CPU by default')
+    parser.add_argument('--agent', metavar='X,Y:X,Y', action='append', type=parseAgent,
+                        help='add a dice rolling from the first to the second location at '
+                             'the same time as the dice of the maze, may be repeated')
+    parser.add_argument('--suboptimality', type=float, default=1.0,
+                        help='factor of the fewest total moves the dice may exceed when '
+                             'planning several dice, e.g. 1.1 for dozens of dice')
+    parser.add_argument('--stream', action='store_true',
+                        help='solve the mazes of a stream of records separated by blank '
+                             'lines, each optionally headed by "> id", and write a result '
+                             'line per maze in the order of the records ( die_distance by '
+                             'default )')
+    return parser.parse_args(argv)
+
+
+def positiveInt(text):
+    """
+    Parse a count of the command line that must be at least 1.
+    :param text: string of the count
+    :return: int
+    """
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected an integer but got '%s'" % text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("expected at least 1 but got %d" % value)
+    return value
+
+
+def parseCell(text):
+    """
+    Parse a location of the command line.
+    :param text: string "x,y"
+    :return: tuple ( x-coordinate, y-coordinate )
+    """
+    try:
+        x, y = text.split(',')
+        return int(x), int(y)
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected X,Y but got '%s'" % text)
+
+
+def parseAgent(text):
+    """
+    Parse the starting and goal location of a dice of the command line.
+    :param text: string "x,y:x,y"
+    :return: tuple of tuples ( x-coordinate, y-coordinate )
+    """
+    try:
+        start, goal = text.split(':')
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected X,Y:X,Y but got '%s'" % text)
+    return parseCell(start), parseCell(goal)
+
+
+def selectHeuristic(args, layout):
+    """
+    Select the heuristic and engine expected to be the fastest on a maze,
+    among the engines the command line options allow, and print the choice.
+    :param args: parsed command line arguments
+    :param layout: maze's filename
+    :return: tuple ( heuristic, engine, predicted search time in
+             milliseconds )
+    """
+    # Imported here so that the calibration table is only read when asked for
+    from .maze import Maze, loadMaze
+    from .selector import HeuristicSelector
+
+    engines = [args.engine] if args.engine is not None else list(ENGINES)
+    if args.checkpoint is not None:
+        engines = [engine for engine in engines if engine == 'astar']
+    if args.contract or args.closed_set != 'set' or args.trace is not None:
+        engines = [engine for engine in engines if engine != 'graph']
+    heuristic, engine, predicted, features = \
+        HeuristicSelector.load().select(Maze(loadMaze(layout)), engines)
+    print("Maze features: " + ", ".join("%s %g" % (name, features[name])
+                                        for name in sorted(features)))
+    print("Selected heuristic", heuristic, "with the", engine, "engine, predicted search "
+          "time %.2f ms" % predicted)
+    return heuristic, engine, predicted
+
+
+def runSearch(args, layout, heuristic, traceFile, checkpointFile):
+    """
+    Run the search for one heuristic with the options given on the command
+    line.
+    :param args: parsed command line arguments
+    :param layout: maze's filename
+    :param heuristic: heuristic name, 'auto' for the heuristic and engine
+                      selected for the maze
+    :param traceFile: file receiving the trace of the search, None for no trace
+    :param checkpointFile: file of the snapshots of the search, None for no
+                           snapshots
+    :return: the result list of Game.run
+    """
+    engine = args.engine or 'astar'
+    predictedTime = None
+    if heuristic == 'auto':
+        heuristic, engine, predictedTime = selectHeuristic(args, layout)
+    return Game.run(layout, heuristic, cacheSize=args.cache_size, tieBreaking=args.tie_breaking,
+                    contract=args.contract, traceFile=traceFile,
+                    traceCapacity=args.trace_capacity, tracePushes=args.trace_pushes,
+                    closedSet=args.closed_set, engine=engine,
+                    checkpointFile=checkpointFile, checkpointInterval=args.checkpoint_interval,
+                    predictedTime=predictedTime)
+
+
+def runRealtime(args):
+    """
+    Run the real-time agent for the heuristics requested on the command line.
+    :param args: parsed command line arguments
+    :return: None
+    """
+    layout = args.layout
+    if layout is None:
+        layout = input("Please enter the filename( e.g: map1.txt ): ")
+    heuristics = [args.heuristic] if args.heuristic is not None else HEURISTICS
+    timeBudget = args.time_budget_ms / 1000 if args.time_budget_ms is not None else None
+    for heuristic in heuristics:
+        Game.runRealtime(layout, heuristic, args.realtime, args.lookahead, timeBudget,
+                         args.max_steps)
+
+
+def runStream(args):
+    """
+    Solve the maze records of a file or of the standard input and write their
+    results to the standard output.
+    :param args: parsed command line arguments
+    :return: None
+    """
+    import os
+    import sys
+
+    from .heuristic import Heuristic
+    from .stream import runStream as solveStream
+
+    heuristic = args.heuristic or 'die_distance'
+    if heuristic != 'auto' and not hasattr(Heuristic, heuristic):
+        raise ValueError("unknown heuristic '%s'" % heuristic)
+    try:
+        if args.layout is None or args.layout == '-':
+            solveStream(sys.stdin, sys.stdout, heuristic, args.engine, args.workers)
+        else:
+            with open(args.layout) as inputFile:
+                solveStream(inputFile, sys.stdout, heuristic, args.engine, args.workers)
+    except BrokenPipeError:
+        # The reader of the results is gone, e.g. "| head". The standard
+        # output is pointed to the null device so that its last flush at exit
+        # does not fail again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+
+def runCommand(args):
+    """
+    Run the search, real-time agent or route planning asked on the command
+    line.
+    :param args: parsed command line arguments
+    :return: the result lists of Game.run, to plot
+    """
+    if args.stream:
+        runStream(args)
+        return []
+    if args.realtime is not None:
+        runRealtime(args)
+        return []
+    if args.waypoint:
+        layout = args.layout
+        if layout is None:
+            layout = input("Please enter the filename( e.g: map1.txt ): ")
+        Game.runWaypoints(layout, args.waypoint, args.ordered, args.workers)
+        return []
+    if args.agent:
+        layout = args.layout
+        if layout is None:
+            layout = input("Please enter the filename( e.g: map1.txt ): ")
+        Game.runAgents(layout, args.agent, args.suboptimality)
+        return []
+
+    results = []
+    if args.layout is not None and args.heuristic is not None:
+        results.append(runSearch(args, args.layout, args.heuristic, args.trace, args.checkpoint))
+    elif args.layout is not None:
+        for heuristic in HEURISTICS:
+            traceFile = args.trace + '.' + heuristic if args.trace is not None else None
+            checkpointFile = args.checkpoint + '.' + heuristic \
+                if args.checkpoint is not None else None
+            results.append(runSearch(args, args.layout, heuristic, traceFile, checkpointFile))
+    else:
+        layout = input("Please enter the filename( e.g: map1.txt ): ")
+        heuristic = input("Please enter the heuristic( 'fancy_manhattan', 'manhattan', 'euclidean', 'diagonal', 'die_distance', 'auto' ): ")
+        results.append(runSearch(args, layout, heuristic, args.trace, args.checkpoint))
+    return results
+
+
+def main(argv=None):
+    """
+    A main method which takes the parameter from the user and perform a star
+    algorithm
+    :param argv: list of arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+    args = parseArguments(argv)
+    try:
+        results = runCommand(args)
+    except ValueError as error:
+        # Invalid maze files, waypoints, dice locations and checkpoints
+        raise SystemExit(error)
+
+    if args.plot and results:
+        # Imported here so that numpy and matplotlib stay off the start-up path
+        from .plotting import plots
+        plots(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,927 @@
+"""
+File: benchmark.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Benchmarks for the Rolling Die Maze solver, run as
+             "python -m rollingdie.benchmark <command>"
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import subprocess
+import sys
+import time
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+HEURISTICS = ['fancy_manhattan', 'manhattan', 'euclidean', 'diagonal', 'forecast_manhattan',
+              'die_distance']
+
+# Modules which must never be loaded by a plain "import rollingdie"
+HEAVY_MODULES = ('numpy', 'matplotlib')
+
+IMPORT_PROBE = """
+import sys, time
+start = time.perf_counter()
+import rollingdie
+elapsed = time.perf_counter() - start
+heavy = [name for name in %r if name in sys.modules]
+print(elapsed, ','.join(heavy))
+""" % (HEAVY_MODULES,)
+
+
+def measureImportTime(repeat):
+    """
+    Import the package in fresh interpreters and measure the cold-start
+    import time.
+    :param repeat: number of fresh interpreters to start
+    :return: tuple of best import time in seconds and the list of heavy
+             modules that got imported along the way
+    """
+    packageRoot = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = packageRoot + os.pathsep + env.get('PYTHONPATH', '')
+    env['PYTHONDONTWRITEBYTECODE'] = ''
+    best = None
+    heavy = []
+    for counter in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', IMPORT_PROBE],
+                                         env=env, universal_newlines=True)
+        elapsed, loaded = output.split(' ', 1)
+        elapsed = float(elapsed)
+        if best is None or elapsed < best:
+            best = elapsed
+        heavy = [name for name in loaded.strip().split(',') if name]
+    return best, heavy
+
+
+def importsCommand(args):
+    """
+    Guard the cold-start latency of "import rollingdie".
+    :param args: parsed command line arguments
+    :return: exit status, 0 if the import is within budget else 1
+    """
+    best, heavy = measureImportTime(args.repeat)
+    print("Cold import of rollingdie (best of %d)   : %.2f ms" % (args.repeat, best * 1000))
+    print("Import budget                           : %.2f ms" % args.budget_ms)
+    status = 0
+    if heavy:
+        print("FAILURE: importing rollingdie loaded", ', '.join(heavy))
+        status = 1
+    if best * 1000 > args.budget_ms:
+        print("FAILURE: import time is over budget")
+        status = 1
+    if status == 0:
+        print("SUCCESS")
+    return status
+
+
+def defaultMazes():
+    """
+    The maze files shipped next to the package.
+    :return: sorted list of maze filenames
+    """
+    packageRoot = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return sorted(glob.glob(os.path.join(packageRoot, 'map*.txt')))
+
+
+def solve(layoutText, heuristic, tieBreaking='none', trace=None, engine='astar'):
+    """
+    Run one search without printing anything.
+    :param layoutText: The 2-D array of the maze
+    :param heuristic: Name of the heuristic
+    :param tieBreaking: Name of the TieBreaking policy of the fringe
+    :param trace: TraceRecorder for the search, None for no trace
+    :param engine: 'astar' for the heap based A*, 'fringe' for Fringe Search,
+                   'graph' for the A* on the compiled state graph
+    :return: tuple of number of moves, nodes put on the queue and nodes
+             visited
+    """
+    from .maze import Maze
+
+    return solveMaze(Maze(layoutText), heuristic, tieBreaking, trace, engine)
+
+
+def solveMaze(aMaze, heuristic, tieBreaking='none', trace=None, engine='astar'):
+    """
+    Run one search on a maze without printing anything.
+    :param aMaze: The maze
+    :param heuristic: Name of the heuristic
+    :param tieBreaking: Name of the TieBreaking policy of the fringe
+    :param trace: TraceRecorder for the search, None for no trace
+    :param engine: 'astar' for the heap based A*, 'fringe' for Fringe Search,
+                   'graph' for the A* on the compiled state graph
+    :return: tuple of number of moves, nodes put on the queue and nodes
+             visited
+    """
+    from .fringeSearch import FringeList, fringeSearch
+    from .priorityQueue import PriorityQueue
+    from .search import Problem, aStarSearch
+
+    if engine == 'fringe':
+        fringe, search = FringeList(), fringeSearch
+    elif engine == 'graph':
+        from .stateGraph import GraphFringe, graphSearch
+        fringe, search = GraphFringe(tieBreaking), graphSearch
+    else:
+        fringe, search = PriorityQueue(tieBreaking), aStarSearch
+    visitedNodes = set()
+    with contextlib.redirect_stdout(io.StringIO()):
+        goal = search(Problem(aMaze), heuristic, fringe, visitedNodes, trace)
+    moves = -1
+    while goal is not None:
+        moves += 1
+        goal = goal.getParent()
+    return moves, fringe.nodesPutOnQueue, len(visitedNodes)
+
+
+def tieBreakCommand(args):
+    """
+    Print the nodes visited by every heuristic under every tie-breaking policy.
+    :param args: parsed command line arguments
+    :return: exit status
+    """
+    from .maze import loadMaze
+    from .priorityQueue import TieBreaking
+
+    policies = TieBreaking.names()
+    for fileName in args.mazes or defaultMazes():
+        layoutText = loadMaze(fileName)
+        print("|------------- %s: nodes visited --------------|" % os.path.basename(fileName))
+        print("%-20s" % "heuristic" + "".join("%16s" % policy for policy in policies))
+        for heuristic in HEURISTICS:
+            row = [solve(layoutText, heuristic, policy)[2] for policy in policies]
+            print("%-20s" % heuristic + "".join("%16d" % visited for visited in row))
+        print()
+    return 0
+
+
+def bestTime(function, repeat):
+    """
+    The best wall clock time of several calls.
+    :param function: function called without arguments
+    :param repeat: number of calls
+    :return: best time in seconds
+    """
+    best = None
+    for counter in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def traceCommand(args):
+    """
+    Print the overhead of recording a trace of the search. The plain and
+    traced searches are run in turn, so that the load of the machine weighs
+    on both alike, and the overhead is the median of the ratios of the pairs.
+    :param args: parsed command line arguments
+    :return: exit status
+    """
+    import random
+    import statistics
+
+    from .maze import Maze, loadMaze
+    from .trace import TraceRecorder
+
+    mazes = [(os.path.basename(fileName), loadMaze(fileName))
+             for fileName in args.mazes or defaultMazes()]
+    if args.size:
+        # The shipped maps take well under a millisecond and their expansions
+        # are cheap; a larger maze gives the overhead of a longer search
+        layout = [list(row) for row in randomLayout(random.Random(args.seed), args.size,
+                                                    args.density)]
+        layout[-1][0], layout[0][-1] = 'S', 'G'
+        mazes.append(("%dx%d" % (args.size, args.size), [''.join(row) for row in layout]))
+    print("%-12s%-20s%10s%14s%14s%10s" % ("maze", "heuristic", "records", "plain (ms)",
+                                          "traced (ms)", "overhead"))
+    for name, layoutText in mazes:
+        # The buffer is preallocated once, as it would be for a long search
+        trace = TraceRecorder(Maze(layoutText), args.capacity)
+        for heuristic in ['manhattan', 'die_distance']:
+            trace.flush()
+            records = trace.count
+            solve(layoutText, heuristic, trace=trace)
+            trace.flush()
+            records = trace.count - records
+            plain, traced = list(), list()
+            for counter in range(args.repeat):
+                # Every other pair starts with the traced search
+                for tracing in (counter % 2 == 1, counter % 2 == 0):
+                    times = traced if tracing else plain
+                    times.append(bestTime(lambda: solve(layoutText, heuristic,
+                                                        trace=trace if tracing else None), 1))
+            overhead = statistics.median(tracedTime / plainTime
+                                         for plainTime, tracedTime in zip(plain, traced)) - 1
+            print("%-12s%-20s%10d%14.3f%14.3f%9.1f%%" % (name, heuristic, records,
+                                                       min(plain) * 1000, min(traced) * 1000,
+                                                       overhead * 100))
+    return 0
+
+
+def enginesCommand(args):
+    """
+    Compare Fringe Search with the heap based A* on every maze and heuristic.
+    :param args: parsed command line arguments
+    :return: exit status, 1 if the engines disagree on a solution length
+    """
+    from .maze import loadMaze
+
+    status = 0
+    print("%-12s%-20s%8s%12s%13s%13s%14s" % ("maze", "heuristic", "moves", "astar (ms)",
+                                             "fringe (ms)", "astar nodes", "fringe nodes"))
+    for fileName in args.mazes or defaultMazes():
+        layoutText = loadMaze(fileName)
+        for heuristic in HEURISTICS:
+            aStarResult = solve(layoutText, heuristic)
+            fringeResult = solve(layoutText, heuristic, engine='fringe')
+            aStarTime = bestTime(lambda: solve(layoutText, heuristic), args.repeat)
+            fringeTime = bestTime(lambda: solve(layoutText, heuristic, engine='fringe'),
+                                  args.repeat)
+            print("%-12s%-20s%8d%12.3f%13.3f%13d%14d" % (os.path.basename(fileName), heuristic,
+                                                         aStarResult[0], aStarTime * 1000,
+                                                         fringeTime * 1000, aStarResult[2],
+                                                         fringeResult[2]))
+            if aStarResult[0] != fringeResult[0]:
+                print("FAILURE: fringe search found %d moves" % fringeResult[0])
+                status = 1
+    return status
+
+
+def landmarksCommand(args):
+    """
+    Compare the ALT heuristic with manhattan and die_distance on random start
+    and goal queries, the landmarks being computed once per maze.
+    :param args: parsed command line arguments
+    :return: exit status, 1 if the heuristics disagree on a solution length
+    """
+    import random
+
+    from .maze import Maze, loadMaze
+
+    heuristics = ['manhattan', 'die_distance', 'alt']
+    status = 0
+    print("%-12s%12s%10s" % ("maze", "setup (ms)", "solved") +
+          "".join("%14s" % heuristic for heuristic in heuristics))
+    for fileName in args.mazes or defaultMazes():
+        aMaze = Maze(loadMaze(fileName))
+        start = time.perf_counter()
+        aMaze.getLandmarks()
+        setup = time.perf_counter() - start
+
+        randomGenerator = random.Random(args.seed)
+        cells = [(x, y) for x in range(aMaze.width) for y in range(aMaze.height)
+                 if not aMaze.obstacles[x][y]]
+        visited = dict.fromkeys(heuristics, 0)
+        solved = 0
+        for query in range(args.queries if len(cells) > 1 else 0):
+            startPos, goalPos = randomGenerator.sample(cells, 2)
+            results = [solveMaze(aMaze.withEndpoints(startPos, goalPos), heuristic)
+                       for heuristic in heuristics]
+            if len({result[0] for result in results}) > 1:
+                print("FAILURE: solution lengths", [result[0] for result in results],
+                      "from", startPos, "to", goalPos)
+                status = 1
+            # Unsolvable queries visit the whole reachable part of the maze
+            # whatever the heuristic, they are left out of the totals
+            if results[0][0] >= 0:
+                solved += 1
+                for heuristic, result in zip(heuristics, results):
+                    visited[heuristic] += result[2]
+        print("%-12s%12.3f%10d" % (os.path.basename(fileName), setup * 1000, solved) +
+              "".join("%14d" % visited[heuristic] for heuristic in heuristics))
+    return status
+
+
+def graphCommand(args):
+    """
+    Compare the A* search on the compiled state graph with the heap based A*
+    on random start and goal queries, the graph being compiled once per maze.
+    :param args: parsed command line arguments
+    :return: exit status, 1 if the engines disagree on a solution length
+    """
+    import random
+
+    from .maze import Maze, loadMaze
+
+    status = 0
+    print("%-14s%10s%10s%14s%10s%14s%14s" % ("maze", "states", "rolls", "compile (ms)",
+                                             "solved", "astar (ms)", "graph (ms)"))
+    mazes = [(os.path.basename(fileName), Maze(loadMaze(fileName)))
+             for fileName in args.mazes or defaultMazes()]
+    if args.size:
+        layout = randomLayout(random.Random(args.seed), args.size, args.density)
+        mazes.append(("%dx%d" % (args.size, args.size), Maze(layout)))
+    for name, aMaze in mazes:
+        start = time.perf_counter()
+        graph = aMaze.getStateGraph()
+        compiled = time.perf_counter() - start
+
+        randomGenerator = random.Random(args.seed)
+        cells = [(x, y) for x in range(aMaze.width) for y in range(aMaze.height)
+                 if not aMaze.obstacles[x][y]]
+        solved = 0
+        aStarTime = graphTime = 0.0
+        for query in range(args.queries if len(cells) > 1 else 0):
+            startPos, goalPos = randomGenerator.sample(cells, 2)
+            queryMaze = aMaze.withEndpoints(startPos, goalPos)
+            start = time.perf_counter()
+            aStarResult = solveMaze(queryMaze, args.heuristic)
+            aStarTime += time.perf_counter() - start
+            start = time.perf_counter()
+            graphResult = solveMaze(queryMaze, args.heuristic, engine='graph')
+            graphTime += time.perf_counter() - start
+            if aStarResult[0] != graphResult[0]:
+                print("FAILURE: solution lengths", aStarResult[0], graphResult[0],
+                      "from", startPos, "to", goalPos)
+                status = 1
+            solved += aStarResult[0] >= 0
+        print("%-14s%10d%10d%14.1f%10d%14.1f%14.1f" % (name, len(graph), graph.getEdgeCount(),
+                                                       compiled * 1000, solved,
+                                                       aStarTime * 1000, graphTime * 1000))
+    return status
+
+
+def threadsCommand(args):
+    """
+    Compare solving random start and goal queries one after the other with
+    solving them from a thread pool sharing the maze.
+    :param args: parsed command line arguments
+    :return: exit status, 1 if the concurrent paths differ from the
+             sequential ones
+    """
+    import random
+
+    from .maze import Maze, loadMaze
+    from .parallel import solveAll, solveQuery
+
+    status = 0
+    print("%-12s%10s%18s%18s" % ("maze", "queries", "sequential (ms)",
+                                 "%d threads (ms)" % args.workers))
+    for fileName in args.mazes or defaultMazes():
+        aMaze = Maze(loadMaze(fileName))
+        randomGenerator = random.Random(args.seed)
+        cells = [(x, y) for x in range(aMaze.width) for y in range(aMaze.height)
+                 if not aMaze.obstacles[x][y]]
+        if len(cells) < 2:
+            continue
+        queries = [tuple(randomGenerator.sample(cells, 2)) for query in range(args.queries)]
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            sequential = [solveQuery(aMaze, startPos, goalPos, args.heuristic)
+                          for startPos, goalPos in queries]
+            sequentialTime = time.perf_counter() - start
+            start = time.perf_counter()
+            concurrent = solveAll(aMaze, queries, args.heuristic, args.workers)
+            concurrentTime = time.perf_counter() - start
+
+        print("%-12s%10d%18.3f%18.3f" % (os.path.basename(fileName), len(queries),
+                                         sequentialTime * 1000, concurrentTime * 1000))
+        for query, path, expected in zip(queries, concurrent, sequential):
+            if [node.getPos() for node in path] != [node.getPos() for node in expected]:
+                print("FAILURE: concurrent path differs from", query[0], "to", query[1])
+                status = 1
+    return status
+
+
+def randomLayout(randomGenerator, size, density):
+    """
+    A square maze without starting and goal position.
+    :param randomGenerator: random.Random
+    :param size: width and height of the maze
+    :param density: probability of a location being an obstacle
+    :return: The 2-D array of the maze
+    """
+    return [''.join('*' if randomGenerator.random() < density else '.' for x in range(size))
+            for y in range(size)]
+
+
+def corridorLayout(randomGenerator, size, openings):
+    """
+    A square maze of one-cell-wide corridors carved by a randomized depth
+    first search, with some of the walls left between the corridors opened.
+    :param randomGenerator: random.Random
+    :param size: width and height of the maze
+    :param openings: probability of a wall between two corridors being opened
+    :return: The 2-D array of the maze, as lists of characters
+    """
+    grid = [['*'] * size for y in range(size)]
+    grid[0][0] = '.'
+    stack = [(0, 0)]
+    while stack:
+        x, y = stack[-1]
+        following = [(x + dx, y + dy) for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                     if 0 <= x + dx < size and 0 <= y + dy < size and
+                     grid[y + dy][x + dx] == '*']
+        if not following:
+            stack.pop()
+            continue
+        nextX, nextY = randomGenerator.choice(following)
+        grid[(y + nextY) // 2][(x + nextX) // 2] = '.'
+        grid[nextY][nextX] = '.'
+        stack.append((nextX, nextY))
+    for y in range(size):
+        for x in range(size):
+            if grid[y][x] == '*' and (x % 2 or y % 2) and randomGenerator.random() < openings:
+                grid[y][x] = '.'
+    return grid
+
+
+def calibrationMaze(randomGenerator, maxSize):
+    """
+    A random maze for the calibration table, open with scattered obstacles
+    or made of corridors, with its starting and goal position on random open
+    locations.
+    :param randomGenerator: random.Random
+    :param maxSize: largest width and height
+    :return: The 2-D array of the maze
+    """
+    size = randomGenerator.randint(6, maxSize)
+    if randomGenerator.random() < 0.5:
+        grid = [list(row) for row in
+                randomLayout(randomGenerator, size, randomGenerator.uniform(0.0, 0.35))]
+    else:
+        grid = corridorLayout(randomGenerator, size, randomGenerator.uniform(0.0, 0.5))
+    cells = [(x, y) for y in range(size) for x in range(size) if grid[y][x] == '.']
+    (startX, startY), (goalX, goalY) = randomGenerator.sample(cells, 2)
+    grid[startY][startX] = 'S'
+    grid[goalY][goalX] = 'G'
+    return [''.join(row) for row in grid]
+
+
+def calibrateCommand(args):
+    """
+    Measure the search time of every heuristic and engine on random mazes
+    and write the calibration table of the HeuristicSelector. The selection
+    is checked by leaving every maze out of the table in turn and comparing
+    the time of the heuristic and engine selected for it with the fastest.
+    :param args: parsed command line arguments
+    :return: exit status
+    """
+    import json
+    import math
+    import random
+
+    from .maze import Maze
+    from .selector import CALIBRATION_FILE, HeuristicSelector, getFeatures
+
+    output = args.output or CALIBRATION_FILE
+    candidates = [heuristic + '/' + engine for engine in args.engines
+                  for heuristic in args.heuristics]
+    randomGenerator = random.Random(args.seed)
+    samples = list()
+    print("%5s%8s%10s%10s%10s%8s   %-28s%10s" % ("maze", "open", "density", "corridor",
+                                                 "distance", "parity", "fastest", "time (ms)"))
+    for counter in range(args.mazes):
+        layoutText = calibrationMaze(randomGenerator, args.max_size)
+        times = {}
+        for candidate in candidates:
+            heuristic, engine = candidate.split('/')
+            # A fresh maze every time, so that the state graph and the
+            # landmarks are built as in a single run
+            times[candidate] = bestTime(lambda: solveMaze(Maze(layoutText), heuristic,
+                                                          engine=engine), args.repeat) * 1000
+        features = getFeatures(Maze(layoutText))
+        samples.append({'features': features, 'times': times})
+        fastest = min(candidates, key=times.get)
+        print("%5d%8d%10.2f%10.2f%10d%8d   %-28s%10.2f" % (
+            counter, features['openCells'], features['density'], features['corridorRatio'],
+            features['distance'], features['parityRolls'], fastest, times[fastest]))
+
+    table = {'candidates': candidates, 'samples': samples}
+    with open(output, 'w') as tableFile:
+        json.dump(table, tableFile, indent=1, sort_keys=True)
+    print("Calibration table of %d mazes written to %s" % (len(samples), output))
+
+    # Leave one out: time lost by the selection against the fastest candidate,
+    # and against always using the candidate fastest over all the mazes
+    fixed = min(candidates, key=lambda candidate: sum(math.log(sample['times'][candidate])
+                                                      for sample in samples))
+    selectedRatio = fixedRatio = 0.0
+    for index, sample in enumerate(samples):
+        others = {'candidates': candidates, 'samples': samples[:index] + samples[index + 1:]}
+        if not others['samples']:
+            break
+        predictions = HeuristicSelector(others).predict(sample['features'])
+        selected = predictions[0][1] + '/' + predictions[0][2]
+        best = min(sample['times'].values())
+        selectedRatio += math.log(sample['times'][selected] / best)
+        fixedRatio += math.log(sample['times'][fixed] / best)
+    print("Selected / fastest time, geometric mean over the mazes left out: %.2f" %
+          math.exp(selectedRatio / len(samples)))
+    print("Always %s / fastest time: %.2f" % (fixed, math.exp(fixedRatio / len(samples))))
+    return 0
+
+
+def randomAgents(aMaze, count, randomGenerator):
+    """
+    Starting and goal positions of dice that can each reach their goal on
+    their own.
+    :param aMaze: The maze
+    :param count: Number of dice
+    :param randomGenerator: random.Random
+    :return: list of tuples ( starting position, goal position )
+    """
+    from .cbs import goalDistances
+
+    cells = [(x, y) for x in range(aMaze.width) for y in range(aMaze.height)
+             if not aMaze.obstacles[x][y]]
+    agents = list()
+    starts, goals = set(), set()
+    for attempt in range(100 * count):
+        if len(agents) == count:
+            break
+        startPos, goalPos = randomGenerator.sample(cells, 2)
+        if startPos in starts or goalPos in goals:
+            continue
+        if startPos + (0,) in goalDistances(aMaze.withEndpoints(startPos, goalPos)):
+            agents.append((startPos, goalPos))
+            starts.add(startPos)
+            goals.add(goalPos)
+    return agents
+
+
+def agentsCommand(args):
+    """
+    Plan many dice on random mazes with Conflict-Based Search for several
+    suboptimality factors.
+    :param args: parsed command line arguments
+    :return: exit status, 1 if a solution has dice meeting
+    """
+    import random
+
+    from .cbs import ConflictBasedSearch, getConflicts, getCost
+    from .maze import Maze
+
+    status = 0
+    print("%-14s%8s%10s%10s%12s%14s%12s" % ("maze", "dice", "factor", "solved", "moves",
+                                           "nodes", "time (ms)"))
+    for counter in range(args.mazes):
+        randomGenerator = random.Random(args.seed + counter)
+        aMaze = Maze(randomLayout(randomGenerator, args.size, args.density))
+        agents = randomAgents(aMaze, args.dice, randomGenerator)
+        for suboptimality in args.suboptimality:
+            search = ConflictBasedSearch(aMaze, agents, suboptimality, args.max_nodes)
+            start = time.perf_counter()
+            paths = search.solve()
+            elapsed = time.perf_counter() - start
+            if paths is not None and getConflicts(paths):
+                print("FAILURE: dice meet in the solution")
+                status = 1
+            print("%-14s%8d%10.2f%10s%12s%14d%12.1f" % (
+                "%dx%d #%d" % (args.size, args.size, counter), len(agents), suboptimality,
+                paths is not None, getCost(paths) if paths is not None else '-',
+                search.expanded, elapsed * 1000))
+    return status
+
+
+class InterruptedSearch(Exception):
+    """
+    Raised to stop a search half way, as if its process had been killed.
+    """
+
+
+def checkpointCommand(args):
+    """
+    Print the cost of snapshotting searches on random mazes, and check that
+    a search stopped after its first snapshot and resumed from it ends like
+    the search run in one go.
+    :param args: parsed command line arguments
+    :return: exit status, 1 if a resumed search ends differently
+    """
+    import random
+    import tempfile
+
+    from .checkpoint import SearchCheckpoint
+    from .maze import Maze
+    from .priorityQueue import PriorityQueue
+    from .search import Problem, aStarSearch
+
+    class StoppingCheckpoint(SearchCheckpoint):
+        """
+        A checkpoint stopping the search after its first snapshot.
+        """
+        __slots__ = ()
+
+        def save(self, problem, fringe, visitedNodes):
+            SearchCheckpoint.save(self, problem, fringe, visitedNodes)
+            raise InterruptedSearch()
+
+    def search(aMaze, checkpoint=None):
+        aProblem = Problem(aMaze)
+        fringe = PriorityQueue()
+        visitedNodes = set()
+        with contextlib.redirect_stdout(io.StringIO()):
+            goal = aStarSearch(aProblem, args.heuristic, fringe, visitedNodes, None, checkpoint)
+        path = [(node.getPos(), node.dice.top) for node in aProblem.getPath(goal)]
+        return path, fringe.nodesPutOnQueue, len(visitedNodes)
+
+    status = 0
+    fileName = os.path.join(tempfile.mkdtemp(), 'search.checkpoint')
+    print("%-12s%10s%12s%14s%12s%14s%10s%10s" % ("maze", "visited", "plain (ms)",
+                                                 "snapshot (ms)", "size (kB)", "saving (ms)",
+                                                 "overhead", "resumed"))
+    for counter in range(args.mazes):
+        randomGenerator = random.Random(args.seed + counter)
+        layout = [list(row) for row in randomLayout(randomGenerator, args.size, args.density)]
+        layout[0][0], layout[-1][-1] = 'G', 'S'
+        aMaze = Maze([''.join(row) for row in layout])
+
+        start = time.perf_counter()
+        expected = search(aMaze)
+        plain = time.perf_counter() - start
+
+        checkpoint = SearchCheckpoint(fileName, args.interval)
+        start = time.perf_counter()
+        search(aMaze, checkpoint)
+        saving = time.perf_counter() - start
+
+        # Stopped half way through its expansions
+        stopping = StoppingCheckpoint(fileName, 0, 1.0, max(expected[2] // 2, 1))
+        try:
+            search(aMaze, stopping)
+            size, resumed = 0, '-'
+        except InterruptedSearch:
+            size = os.path.getsize(fileName)
+            resumed = search(aMaze, SearchCheckpoint(fileName)) == expected
+            if not resumed:
+                print("FAILURE: the resumed search ends differently")
+                status = 1
+        print("%-12s%10d%12.1f%14.1f%12.1f%14.1f%9.1f%%%10s" % (
+            "%dx%d #%d" % (args.size, args.size, counter), expected[2], plain * 1000,
+            stopping.saveTime * 1000, size / 1024, saving * 1000, (saving - plain) / plain * 100,
+            resumed))
+    return status
+
+
+def streamCommand(args):
+    """
+    Compare solving random mazes in a new process per maze file with solving
+    them as a stream of records, in one process and from a process pool, and
+    check that the pool gives the results of the single process in the same
+    order.
+    :param args: parsed command line arguments
+    :return: exit status, 1 if the results of the pool differ
+    """
+    import random
+    import tempfile
+
+    from .stream import solveRecords
+
+    randomGenerator = random.Random(args.seed)
+    records = list()
+    for counter in range(args.mazes):
+        layout = [list(row) for row in randomLayout(randomGenerator, args.size, args.density)]
+        (startX, startY), (goalX, goalY) = randomGenerator.sample(
+            [(x, y) for x in range(args.size) for y in range(args.size)], 2)
+        layout[startY][startX], layout[goalY][goalX] = 'S', 'G'
+        records.append(('maze-%d' % counter, [''.join(row) for row in layout]))
+
+    # A new interpreter per maze file, as many as asked and the rest
+    # extrapolated from their mean
+    packageRoot = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = packageRoot + os.pathsep + env.get('PYTHONPATH', '')
+    directory = tempfile.mkdtemp()
+    spawned = min(args.spawn, len(records))
+    start = time.perf_counter()
+    for recordId, layout in records[:spawned]:
+        fileName = os.path.join(directory, recordId + '.txt')
+        with open(fileName, 'w') as mazeFile:
+            mazeFile.write('\n'.join(layout) + '\n')
+        subprocess.check_output([sys.executable, '-m', 'rollingdie', fileName, args.heuristic,
+                                 '--no-plot'], env=env)
+    perProcess = (time.perf_counter() - start) / max(spawned, 1)
+
+    start = time.perf_counter()
+    expected = list(solveRecords(iter(records), args.heuristic))
+    inline = time.perf_counter() - start
+    start = time.perf_counter()
+    pooled = list(solveRecords(iter(records), args.heuristic, workers=args.workers))
+    pool = time.perf_counter() - start
+
+    print("%-24s%10s%14s" % ("%d mazes %dx%d" % (len(records), args.size, args.size),
+                             "total (s)", "per maze (ms)"))
+    for name, elapsed in (("process per maze", perProcess * len(records)),
+                          ("stream", inline),
+                          ("stream, %s workers" % (args.workers or 'CPU'), pool)):
+        print("%-24s%10.2f%14.2f" % (name, elapsed, elapsed / len(records) * 1000))
+    if pooled != expected:
+        print("FAILURE: the process pool gives other results or another order")
+        return 1
+    return 0
+
+
+def heuristicsCommand(args):
+    """
+    Check that the die_distance bound never drops by more than one roll and
+    never exceeds the exact open grid distance, inside and around its table,
+    and that A* with the table based heuristics finds as few moves as a
+    breadth first search on random mazes.
+    :param args: parsed command line arguments
+    :return: exit status, 1 if a bound or a search is wrong
+    """
+    import importlib.util
+    import random
+
+    from .dieDistance import DieDistanceTable, getTable
+    from .maze import Maze
+    from .orientation import NUM_ORIENTATIONS, ROLLS, TOPS
+    from .waypoints import rollDistances
+
+    status = 0
+    table = getTable()
+    # Exact distances well beyond the radius of the table
+    exact = DieDistanceTable(table.radius + args.beyond)
+    extent = table.radius + args.beyond - 1
+    steep = overestimated = 0
+    for dx in range(-extent, extent + 1):
+        for dy in range(-extent, extent + 1):
+            for orientation in range(NUM_ORIENTATIONS):
+                if TOPS[orientation] == 6:
+                    continue
+                bound = table.getDistance(dx, dy, orientation)
+                if bound > exact.getDistance(dx, dy, orientation):
+                    overestimated += 1
+                for (x, y), roll in ROLLS.items():
+                    if TOPS[roll[orientation]] != 6 and \
+                            bound > table.getDistance(dx + x, dy + y, roll[orientation]) + 1:
+                        steep += 1
+    print("Rolls dropping die_distance by more than 1    : ", steep)
+    print("States where die_distance exceeds the distance: ", overestimated)
+    if steep or overestimated:
+        print("FAILURE: die_distance is not consistent")
+        status = 1
+
+    heuristics = ['die_distance']
+    if importlib.util.find_spec('numpy') is not None:
+        heuristics.append('alt')
+    engines = ['astar', 'fringe', 'graph'] if 'alt' in heuristics else ['astar', 'fringe']
+    randomGenerator = random.Random(args.seed)
+    wrong = searches = 0
+    for counter in range(args.mazes):
+        width = randomGenerator.randint(args.size // 2, args.size)
+        height = randomGenerator.randint(args.size // 2, args.size)
+        layout = [list(row) for row in randomLayout(randomGenerator, max(width, height),
+                                                    args.density)[:height]]
+        layout = [row[:width] for row in layout]
+        # Far apart, the table alone does not cover the offsets
+        startX = randomGenerator.randrange(width // 4)
+        startY = randomGenerator.randrange(height // 4)
+        goalX = randomGenerator.randrange(width // 2, width)
+        goalY = randomGenerator.randrange(height // 2, height)
+        layout[height - 1 - startY][startX] = 'S'
+        layout[height - 1 - goalY][goalX] = 'G'
+        aMaze = Maze([''.join(row) for row in layout])
+        reached = rollDistances(aMaze, (startX, startY, 0), [(goalX, goalY)])[(goalX, goalY)]
+        expected = min(reached.values()) if reached else -1
+        for heuristic in heuristics:
+            for engine in engines:
+                searches += 1
+                moves = solveMaze(aMaze, heuristic, engine=engine)[0]
+                if moves != expected:
+                    wrong += 1
+                    print("FAILURE: %s with the %s engine finds %d moves instead of %d on maze "
+                          "#%d" % (heuristic, engine, moves, expected, counter))
+    print("Searches with more moves than breadth first   : ", wrong, "of", searches)
+    if wrong:
+        status = 1
+    return status
+
+
+def parseArguments(argv=None):
+    """
+    Parse the command line arguments.
+    :param argv: list of arguments, defaults to sys.argv[1:]
+    :return: argparse namespace
+    """
+    parser = argparse.ArgumentParser(prog='rollingdie.benchmark')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    imports = commands.add_parser('imports', help='guard the cold-start import time')
+    imports.add_argument('--repeat', type=int, default=5)
+    imports.add_argument('--budget-ms', type=float, default=50.0)
+    imports.set_defaults(func=importsCommand)
+
+    tieBreak = commands.add_parser('tiebreak', help='nodes visited per tie-breaking policy')
+    tieBreak.add_argument('mazes', nargs='*', help='maze files, defaults to the shipped maps')
+    tieBreak.set_defaults(func=tieBreakCommand)
+
+    traceOverhead = commands.add_parser('trace', help='overhead of recording a search trace')
+    traceOverhead.add_argument('mazes', nargs='*', help='maze files, defaults to the shipped maps')
+    traceOverhead.add_argument('--repeat', type=int, default=50)
+    traceOverhead.add_argument('--capacity', type=int, default=1 << 16)
+    traceOverhead.add_argument('--size', type=int, default=40,
+                               help='also trace a random maze of this size, 0 for none')
+    traceOverhead.add_argument('--density', type=float, default=0.2)
+    traceOverhead.add_argument('--seed', type=int, default=0)
+    traceOverhead.set_defaults(func=traceCommand)
+
+    engines = commands.add_parser('engines', help='Fringe Search against the heap based A*')
+    engines.add_argument('mazes', nargs='*', help='maze files, defaults to the shipped maps')
+    engines.add_argument('--repeat', type=int, default=10)
+    engines.set_defaults(func=enginesCommand)
+
+    landmarks = commands.add_parser('landmarks', help='ALT heuristic on random queries')
+    landmarks.add_argument('mazes', nargs='*', help='maze files, defaults to the shipped maps')
+    landmarks.add_argument('--queries', type=int, default=50)
+    landmarks.add_argument('--seed', type=int, default=0)
+    landmarks.set_defaults(func=landmarksCommand)
+
+    graph = commands.add_parser('graph', help='A* on the compiled state graph of the maze')
+    graph.add_argument('mazes', nargs='*', help='maze files, defaults to the shipped maps')
+    graph.add_argument('--queries', type=int, default=20)
+    graph.add_argument('--heuristic', default='die_distance')
+    graph.add_argument('--size', type=int, default=60,
+                       help='also query a random maze of this size, 0 for none')
+    graph.add_argument('--density', type=float, default=0.2)
+    graph.add_argument('--seed', type=int, default=0)
+    graph.set_defaults(func=graphCommand)
+
+    threads = commands.add_parser('threads', help='concurrent searches sharing one maze')
+    threads.add_argument('mazes', nargs='*', help='maze files, defaults to the shipped maps')
+    threads.add_argument('--queries', type=int, default=50)
+    threads.add_argument('--workers', type=int, default=4)
+    threads.add_argument('--heuristic', default='manhattan')
+    threads.add_argument('--seed', type=int, default=0)
+    threads.set_defaults(func=threadsCommand)
+
+    agents = commands.add_parser('agents', help='Conflict-Based Search for many dice')
+    agents.add_argument('--size', type=int, default=20)
+    agents.add_argument('--density', type=float, default=0.15)
+    agents.add_argument('--dice', type=int, default=20)
+    agents.add_argument('--mazes', type=int, default=3)
+    agents.add_argument('--suboptimality', type=float, nargs='+', default=[1.0, 1.1])
+    agents.add_argument('--max-nodes', type=int, default=2000)
+    agents.add_argument('--seed', type=int, default=0)
+    agents.set_defaults(func=agentsCommand)
+
+    calibrate = commands.add_parser('calibrate',
+                                    help='calibration table of the heuristic selection')
+    calibrate.add_argument('--mazes', type=int, default=60)
+    calibrate.add_argument('--max-size', type=int, default=48)
+    calibrate.add_argument('--heuristics', nargs='+', default=HEURISTICS + ['alt'])
+    calibrate.add_argument('--engines', nargs='+', default=['astar', 'fringe', 'graph'])
+    calibrate.add_argument('--repeat', type=int, default=3)
+    calibrate.add_argument('--seed', type=int, default=0)
+    calibrate.add_argument('--output', default=None,
+                           help='table file, defaults to the one shipped with the package')
+    calibrate.set_defaults(func=calibrateCommand)
+
+    checkpoint = commands.add_parser('checkpoint', help='snapshots and resumed searches')
+    checkpoint.add_argument('--size', type=int, default=100)
+    checkpoint.add_argument('--density', type=float, default=0.2)
+    checkpoint.add_argument('--mazes', type=int, default=3)
+    checkpoint.add_argument('--heuristic', default='manhattan')
+    checkpoint.add_argument('--interval', type=float, default=1.0,
+                            help='fewest seconds between two snapshots')
+    checkpoint.add_argument('--seed', type=int, default=0)
+    checkpoint.set_defaults(func=checkpointCommand)
+
+    heuristics = commands.add_parser('heuristics',
+                                     help='consistency of die_distance and A* against BFS')
+    heuristics.add_argument('--mazes', type=int, default=30)
+    heuristics.add_argument('--size', type=int, default=48)
+    heuristics.add_argument('--density', type=float, default=0.05)
+    heuristics.add_argument('--beyond', type=int, default=8,
+                            help='offsets checked beyond the radius of the table')
+    heuristics.add_argument('--seed', type=int, default=0)
+    heuristics.set_defaults(func=heuristicsCommand)
+
+    stream = commands.add_parser('stream', help='a stream of mazes against a process per maze')
+    stream.add_argument('--mazes', type=int, default=200)
+    stream.add_argument('--size', type=int, default=20)
+    stream.add_argument('--density', type=float, default=0.2)
+    stream.add_argument('--heuristic', default='die_distance')
+    stream.add_argument('--workers', type=int, default=None,
+                        help='processes of the pool, one per CPU by default')
+    stream.add_argument('--spawn', type=int, default=20,
+                        help='mazes run in a process of their own, the others extrapolated')
+    stream.add_argument('--seed', type=int, default=0)
+    stream.set_defaults(func=streamCommand)
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Run the requested benchmark.
+    :param argv: list of arguments, defaults to sys.argv[1:]
+    :return: None
+    """
+    args = parseArguments(argv)
+    sys.exit(args.func(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,505 @@
+"""
+File: cbs.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Conflict-Based Search for several dice rolling on one Rolling Die
+             Maze at the same time. Every dice is planned alone by a time
+             aware A* search that obeys a table of constraints, and the
+             conflicts between the paths are resolved by a best first search
+             over the constraints, optimal or bounded suboptimal to plan
+             dozens of dice.
+             The low level is a search of its own rather than aStarSearch
+             on a Problem: its states carry the time step and are expanded
+             again when reached earlier, a focal list ordered by conflicts
+             sits next to the f cost order, which a PriorityQueue with a
+             single sort key cannot hold, and it runs for every dice of
+             every high level node, up to thousands of times per plan, on
+             tuples instead of Node and Dice objects. The rolls and legal
+             states are those of orientation.py and Maze.isLegalState, as in
+             the single dice search.
+"""
+
+import heapq
+from collections import deque
+from itertools import count
+
+from .orientation import ROLL_LIST, TOPS
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+# Largest number of high level nodes expanded before giving up, conflicts
+# between dice may have no solution at all
+MAX_NODES = 10000
+
+
+def goalDistances(maze):
+    """
+    Breadth first search from the goal states counting the rolls from every
+    state to the goal. A roll is undone by the opposite roll and the rules
+    only depend on the states, so the rolls to the goal are the rolls from it.
+    :param maze: The maze of the dice, with its goal position
+    :return: dictionary ( x-coordinate, y-coordinate, orientation index ) ->
+             number of rolls, for the states that can reach the goal
+    """
+    x, y = maze.getGoalPos()
+    distances = {(x, y, orientation): 0 for orientation in range(len(TOPS))
+                 if maze.isLegalState(x, y, orientation)}
+    frontier = deque(distances)
+    while frontier:
+        state = frontier.popleft()
+        x, y, orientation = state
+        distance = distances[state] + 1
+        for dx, dy, roll in ROLL_LIST:
+            nextState = (x + dx, y + dy, roll[orientation])
+            if nextState not in distances and maze.isLegalState(*nextState):
+                distances[nextState] = distance
+                frontier.append(nextState)
+    return distances
+
+
+def exitDistances(distances, goalPos, blockedCells):
+    """
+    The rolls from every state to the nearest state from which the goal can
+    be reached without going over some cells. A dice forbidden on these cells
+    from some time step on must be on such a state by then.
+    :param distances: goalDistances of the maze of the dice
+    :param goalPos: tuple ( x-coordinate, y-coordinate ) of the goal
+    :param blockedCells: set of tuples ( x-coordinate, y-coordinate )
+    :return: dictionary ( x-coordinate, y-coordinate, orientation index ) ->
+             number of rolls, for the states that can reach such a state
+    """
+    if goalPos in blockedCells:
+        return {}
+    # States reaching the goal without the blocked cells, then the states
+    # reaching them
+    exits = {state: 0 for state, distance in distances.items() if distance == 0}
+    for avoidBlocked in (True, False):
+        frontier = deque(exits)
+        while frontier:
+            state = frontier.popleft()
+            x, y, orientation = state
+            distance = exits[state] + (0 if avoidBlocked else 1)
+            for dx, dy, roll in ROLL_LIST:
+                nextState = (x + dx, y + dy, roll[orientation])
+                if nextState in distances and nextState not in exits and \
+                        not (avoidBlocked and nextState[:2] in blockedCells):
+                    exits[nextState] = distance
+                    frontier.append(nextState)
+    return exits
+
+
+class ConstraintTable:
+    """
+    The class ConstraintTable holds the constraints of one dice: the
+    locations it may not be on at some time steps ( vertex constraints ), the
+    rolls it may not make between two time steps ( edge constraints ), the
+    locations it may not be on from some time step on ( block constraints )
+    and the time step before which it may not stay on its goal for good.
+    Tables are never modified once built, a child of the high level search
+    gets a new one, so they are shared between the high level nodes.
+    """
+    __slots__ = 'vertices', 'edges', 'blocks', 'arrival', 'lastTime'
+
+    def __init__(self, vertices=frozenset(), edges=frozenset(), blocks=None, arrival=0):
+        """
+        Initializes the table.
+        :param vertices: set of tuples ( x-coordinate, y-coordinate, time )
+        :param edges: set of tuples ( x-coordinate, y-coordinate, next
+                      x-coordinate, next y-coordinate, time ) of the rolls
+                      from time to time + 1
+        :param blocks: dictionary ( x-coordinate, y-coordinate ) -> time from
+                       which the location is forbidden
+        :param arrival: first time the dice may stay on its goal for good
+        """
+        self.vertices = vertices
+        self.edges = edges
+        self.blocks = blocks or {}
+        self.arrival = arrival
+        # Time from which the constraints do not change any more
+        self.lastTime = max([vertex[2] + 1 for vertex in vertices] +
+                            [edge[4] + 1 for edge in edges] +
+                            list(self.blocks.values()) + [arrival])
+
+    def withConstraint(self, constraint):
+        """
+        The table with one more constraint.
+        :param constraint: tuple ( 'vertex', x-coordinate, y-coordinate, time ),
+                           ( 'edge', x-coordinate, y-coordinate, next
+                           x-coordinate, next y-coordinate, time ), ( 'block',
+                           x-coordinate, y-coordinate, time ) or ( 'arrival',
+                           time )
+        :return: ConstraintTable
+        """
+        kind, values = constraint[0], constraint[1:]
+        if kind == 'vertex':
+            return ConstraintTable(self.vertices | {values}, self.edges, self.blocks,
+                                   self.arrival)
+        if kind == 'edge':
+            return ConstraintTable(self.vertices, self.edges | {values}, self.blocks,
+                                   self.arrival)
+        if kind == 'block':
+            blocks = dict(self.blocks)
+            cell = values[:2]
+            blocks[cell] = min(blocks.get(cell, values[2]), values[2])
+            return ConstraintTable(self.vertices, self.edges, blocks, self.arrival)
+        return ConstraintTable(self.vertices, self.edges, self.blocks,
+                               max(self.arrival, values[0]))
+
+    def getGoalTime(self, goalPos):
+        """
+        The first time the dice may stay on its goal for good.
+        :param goalPos: tuple ( x-coordinate, y-coordinate ) of the goal
+        :return: time step, None if the goal is blocked for good
+        """
+        if goalPos in self.blocks:
+            return None
+        x, y = goalPos
+        return max([time + 1 for vx, vy, time in self.vertices if (vx, vy) == (x, y)] +
+                   [self.arrival])
+
+
+def timedAStar(maze, distances, constraints, avoid=None, parked=None, exits=None,
+               suboptimality=1.0):
+    """
+    Focal search of the path of one dice over ( location, orientation, time )
+    states. The dice rolls or waits one time step at a time, avoiding the
+    locations and rolls of its constraint table, and stays on its goal once
+    there. The f cost of a state is its time plus the rolls to the goal
+    ignoring the constraints, or the time steps left before the dice may stay
+    on its goal when more. Among the states whose f cost is within
+    suboptimality times the lowest one, the state meeting the fewest planned
+    paths of the other dice is expanded first; with a suboptimality of 1
+    this is A* preferring the paths meeting the fewest other dice. After the
+    last constraint the time does not matter any more, so a state is then
+    only expanded again when reached earlier. With block constraints, the
+    states too far from the states that reach the goal without the blocked
+    cells are pruned.
+    :param maze: The maze of the dice, with its starting and goal position
+    :param distances: goalDistances of the maze
+    :param constraints: ConstraintTable of the dice
+    :param avoid: dictionary ( x-coordinate, y-coordinate, time ) -> number
+                  of the other dice there, None to ignore the other dice
+    :param parked: dictionary ( x-coordinate, y-coordinate ) -> time from
+                   which another dice stays there, None to ignore them
+    :param exits: exitDistances of the blocked cells of the constraint table,
+                  None when it has no block constraint
+    :param suboptimality: Factor of the fewest moves the path may exceed
+    :return: tuple of the list of the states ( x-coordinate, y-coordinate,
+             orientation index ), one per time step, and a lower bound of the
+             moves of the dice under its constraints, None if there is no path
+    """
+    x, y = maze.getStartPos()
+    start = (x, y, 0)
+    if start not in distances:
+        return None
+    goalPos = maze.getGoalPos()
+    goalTime = constraints.getGoalTime(goalPos)
+    if goalTime is None:
+        return None
+    vertices, edges, blocks = constraints.vertices, constraints.edges, constraints.blocks
+    lastTime = constraints.lastTime
+    avoid = avoid or {}
+    parked = parked or {}
+    # The dice has to be on a state of exits by the time all the blocks apply
+    blockTime = max(blocks.values()) if exits is not None else None
+    if blockTime is not None and exits.get(start, blockTime + 1) > blockTime:
+        return None
+
+    tieBreaker = count()
+    order = next(tieBreaker)
+    startCost = max(distances[start], goalTime)
+    # ( state, time ) -> ( conflicts, insertion order, parent ( state, time ) )
+    # of the best way found to the state
+    entries = {(start, 0): (0, order, None)}
+    # Every state generated and not expanded yet is in costs, and either in
+    # focal, when its f cost is within suboptimality times the lowest f cost,
+    # or in waiting. Entries replaced by a better way are skipped.
+    # ( f cost, insertion order )
+    costs = [(startCost, order)]
+    # ( f cost, insertion order, conflicts, - time, state, time )
+    waiting = [(startCost, order, 0, 0, start, 0)]
+    # ( conflicts, f cost, - time, insertion order, state, time )
+    focal = list()
+    # Insertion orders of the entries expanded or replaced
+    removed = set()
+    # ( state, time or lastTime when later ) -> time it was expanded at
+    closed = dict()
+    while True:
+        while costs and costs[0][1] in removed:
+            heapq.heappop(costs)
+        if not costs:
+            return None
+        lowerBound = costs[0][0]
+        bound = lowerBound * suboptimality
+        while waiting and waiting[0][0] <= bound:
+            fCost, order, conflicts, negativeTime, state, time = heapq.heappop(waiting)
+            heapq.heappush(focal, (conflicts, fCost, negativeTime, order, state, time))
+        conflicts, fCost, negativeTime, order, state, time = heapq.heappop(focal)
+        if order in removed:
+            continue
+        removed.add(order)
+
+        x, y, orientation = state
+        if (x, y) == goalPos and time >= goalTime:
+            path = list()
+            key = (state, time)
+            while key is not None:
+                path.append(key[0])
+                key = entries[key][2]
+            path.reverse()
+            return path, lowerBound
+
+        closedKey = (state, min(time, lastTime))
+        if closed.get(closedKey, time + 1) <= time:
+            continue
+        closed[closedKey] = time
+
+        nextTime = time + 1
+        closedTime = min(nextTime, lastTime)
+        successors = [state]
+        for dx, dy, roll in ROLL_LIST:
+            nextState = (x + dx, y + dy, roll[orientation])
+            if nextState in distances and (x, y, nextState[0], nextState[1], time) not in edges:
+                successors.append(nextState)
+        for nextState in successors:
+            nextX, nextY = nextState[0], nextState[1]
+            if closed.get((nextState, closedTime), nextTime + 1) <= nextTime or \
+                    (nextX, nextY, nextTime) in vertices or \
+                    (blocks and blocks.get((nextX, nextY), nextTime + 1) <= nextTime):
+                continue
+            if blockTime is not None and \
+                    exits.get(nextState, blockTime + 1) > max(blockTime - nextTime, 0):
+                continue
+            nextConflicts = conflicts + avoid.get((nextX, nextY, nextTime), 0)
+            if parked.get((nextX, nextY), nextTime + 1) <= nextTime:
+                nextConflicts += 1
+            key = (nextState, nextTime)
+            if key not in entries or nextConflicts < entries[key][0]:
+                if key in entries:
+                    removed.add(entries[key][1])
+                nextOrder = next(tieBreaker)
+                entries[key] = (nextConflicts, nextOrder, (state, time))
+                nextCost = max(nextTime + distances[nextState], goalTime)
+                heapq.heappush(costs, (nextCost, nextOrder))
+                if nextCost <= bound:
+                    heapq.heappush(focal, (nextConflicts, nextCost, -nextTime, nextOrder,
+                                           nextState, nextTime))
+                else:
+                    heapq.heappush(waiting, (nextCost, nextOrder, nextConflicts, -nextTime,
+                                             nextState, nextTime))
+
+
+def getConflicts(paths):
+    """
+    The conflicts between the paths of the dice, the earliest first. Two
+    dice on the same location at the same time is a vertex conflict, two
+    dice swapping their locations between two time steps an edge conflict.
+    A dice stays on its goal after the end of its path, and a vertex conflict
+    with a dice staying there is a goal conflict: either that dice arrives
+    for good later, or the other dice never comes there again.
+    :param paths: list of the paths, lists of states ( x-coordinate,
+                  y-coordinate, orientation index )
+    :return: list of tuples ( time, dice, other dice, constraint of the dice,
+             constraint of the other dice ) where the constraints are as in
+             ConstraintTable.withConstraint
+    """
+    conflicts = list()
+    horizon = max(len(path) for path in paths) if paths else 0
+    for time in range(horizon):
+        cells = dict()
+        moves = dict()
+        for agent, path in enumerate(paths):
+            x, y = path[min(time, len(path) - 1)][:2]
+            other = cells.setdefault((x, y), agent)
+            if other != agent:
+                if time >= len(paths[other]) - 1:
+                    conflicts.append((time, other, agent, ('arrival', time + 1),
+                                      ('block', x, y, time)))
+                elif time >= len(path) - 1:
+                    conflicts.append((time, agent, other, ('arrival', time + 1),
+                                      ('block', x, y, time)))
+                else:
+                    conflicts.append((time, other, agent, ('vertex', x, y, time),
+                                      ('vertex', x, y, time)))
+            if time + 1 < len(path):
+                nextX, nextY = path[time + 1][:2]
+                if (nextX, nextY) != (x, y):
+                    moves[(x, y, nextX, nextY)] = agent
+                    other = moves.get((nextX, nextY, x, y))
+                    if other is not None:
+                        conflicts.append((time, other, agent,
+                                          ('edge', nextX, nextY, x, y, time),
+                                          ('edge', x, y, nextX, nextY, time)))
+    return conflicts
+
+
+class ConflictBasedSearch:
+    """
+    The class ConflictBasedSearch plans the paths of several dice on one
+    maze so that no two dice are ever on the same location or swap their
+    locations, with the fewest moves in total ( a wait counts as a move
+    until the dice stays on its goal for good ). Every high level node holds
+    a constraint table and a path per dice. The node with the fewest moves
+    is expanded: if its paths are free of conflicts they are the solution,
+    otherwise the earliest conflict is resolved in two children, each
+    forbidding the conflict to one of the two dice and planning that dice
+    again.
+    With a suboptimality above 1 the search is bounded suboptimal ( ECBS ):
+    both levels expand, among the nodes within suboptimality times their
+    lower bound of moves, the one with the fewest conflicts, and the total
+    moves stay within suboptimality times the fewest.
+    """
+    __slots__ = 'maze', 'agents', 'mazes', 'distances', 'exits', 'suboptimality', \
+        'maxNodes', 'expanded', 'generated', 'searches'
+
+    def __init__(self, maze, agents, suboptimality=1.0, maxNodes=MAX_NODES):
+        """
+        Initializes the search.
+        :param maze: The maze shared by the dice
+        :param agents: list of tuples ( starting position, goal position ) of
+                       the dice, all starting with 1 on top, 2 facing north and
+                       3 facing east
+        :param suboptimality: Factor of the fewest moves the solution may
+                              exceed, 1 for the fewest moves
+        :param maxNodes: Largest number of high level nodes expanded
+        """
+        starts = [tuple(start) for start, goal in agents]
+        goals = [tuple(goal) for start, goal in agents]
+        for cell in starts + goals:
+            if not maze.isPosInMaze(cell) or maze.isObstacle(cell):
+                raise ValueError('%s is not a free location of the maze' % (cell,))
+        if len(set(starts)) < len(starts) or len(set(goals)) < len(goals):
+            raise ValueError('two dice cannot start or end on the same location')
+        self.maze = maze
+        self.agents = list(zip(starts, goals))
+        self.mazes = [maze.withEndpoints(start, goal) for start, goal in self.agents]
+        self.distances = [goalDistances(aMaze) for aMaze in self.mazes]
+        # ( dice, blocked cells ) -> exitDistances
+        self.exits = {}
+        self.suboptimality = suboptimality
+        self.maxNodes = maxNodes
+        # Number of high level nodes expanded and generated, and of low level
+        # searches run
+        self.expanded = 0
+        self.generated = 0
+        self.searches = 0
+
+    def planAgent(self, agent, constraints, paths):
+        """
+        Plans the path of one dice, preferring the paths that meet the fewest
+        planned paths of the other dice.
+        :param agent: index of the dice
+        :param constraints: ConstraintTable of the dice
+        :param paths: list of the paths of the dice, None where not planned yet
+        :return: tuple of the path of the dice and a lower bound of its moves,
+                 None if there is no path
+        """
+        avoid = dict()
+        parked = dict()
+        for other, path in enumerate(paths):
+            if other == agent or path is None:
+                continue
+            for time, state in enumerate(path):
+                key = (state[0], state[1], time)
+                avoid[key] = avoid.get(key, 0) + 1
+            parked[path[-1][:2]] = len(path)
+        exits = None
+        if constraints.blocks:
+            key = (agent, frozenset(constraints.blocks))
+            if key not in self.exits:
+                self.exits[key] = exitDistances(self.distances[agent], self.agents[agent][1],
+                                                key[1])
+            exits = self.exits[key]
+        self.searches += 1
+        return timedAStar(self.mazes[agent], self.distances[agent], constraints, avoid, parked,
+                          exits, self.suboptimality)
+
+    def solve(self):
+        """
+        Runs the high level search.
+        :return: list of the paths of the dice, lists of states ( x-coordinate,
+                 y-coordinate, orientation index ) one per time step, None if
+                 there is no solution within maxNodes high level nodes
+        """
+        constraints = [ConstraintTable() for agent in self.agents]
+        paths = [None] * len(self.agents)
+        lowerBounds = [0] * len(self.agents)
+        for agent in range(len(self.agents)):
+            result = self.planAgent(agent, constraints[agent], paths)
+            if result is None:
+                return None
+            paths[agent], lowerBounds[agent] = result
+
+        tieBreaker = count()
+        conflicts = getConflicts(paths)
+        # ( lower bound, moves, conflicts, insertion order, constraint tables,
+        # paths, lower bounds, conflicts )
+        root = (sum(lowerBounds), getCost(paths), len(conflicts), next(tieBreaker), constraints,
+                paths, lowerBounds, conflicts)
+        # Every node generated and not expanded yet is in costs, and either in
+        # focal, when its moves are within suboptimality times the lowest
+        # lower bound of the nodes, or in waiting
+        # ( lower bound, insertion order )
+        costs = [(root[0], root[3])]
+        # ( moves, insertion order, node )
+        waiting = [(root[1], root[3], root)]
+        # ( conflicts, moves, insertion order, node )
+        focal = list()
+        expandedOrders = set()
+        self.generated = 1
+        while self.expanded < self.maxNodes:
+            while costs and costs[0][1] in expandedOrders:
+                heapq.heappop(costs)
+            if not costs:
+                break
+            bound = costs[0][0] * self.suboptimality
+            while waiting and waiting[0][0] <= bound:
+                cost, order, node = heapq.heappop(waiting)
+                heapq.heappush(focal, (node[2], cost, order, node))
+            lowerBound, cost, numConflicts, order, constraints, paths, lowerBounds, conflicts = \
+                heapq.heappop(focal)[3]
+            expandedOrders.add(order)
+            self.expanded += 1
+            if not conflicts:
+                return paths
+
+            time, first, second, firstConstraint, secondConstraint = conflicts[0]
+            children = list()
+            for agent, constraint in ((first, firstConstraint), (second, secondConstraint)):
+                childConstraints = list(constraints)
+                childConstraints[agent] = constraints[agent].withConstraint(constraint)
+                result = self.planAgent(agent, childConstraints[agent], paths)
+                if result is None:
+                    continue
+                childPaths = list(paths)
+                childLowerBounds = list(lowerBounds)
+                childPaths[agent], childLowerBounds[agent] = result
+                childConflicts = getConflicts(childPaths)
+                childCost = getCost(childPaths)
+                if childCost <= cost and len(childConflicts) < len(conflicts):
+                    # Bypass: the new path is no longer and meets fewer dice,
+                    # it also satisfies the constraints of the node, which
+                    # takes it instead of splitting
+                    children = [(lowerBound, childCost, len(childConflicts), next(tieBreaker),
+                                 constraints, childPaths, lowerBounds, childConflicts)]
+                    break
+                children.append((sum(childLowerBounds), childCost, len(childConflicts),
+                                 next(tieBreaker), childConstraints, childPaths,
+                                 childLowerBounds, childConflicts))
+            for child in children:
+                heapq.heappush(costs, (child[0], child[3]))
+                heapq.heappush(waiting, (child[1], child[3], child))
+            self.generated += len(children)
+        return None
+
+
+def getCost(paths):
+    """
+    The number of moves of all the dice, waits included, until every dice
+    stays on its goal.
+    :param paths: list of the paths
+    :return: sum of the moves
+    """
+    return sum(len(path) - 1 for path in paths)
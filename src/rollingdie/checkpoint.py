@@ -0,0 +1,296 @@
+"""
+File: checkpoint.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Snapshots of a running A* search. The fringe, the closed set
+             and every node of the search with its g cost, f cost and parent
+             are written to a compact binary file from time to time, so a
+             search killed half way can resume from its last snapshot and
+             end as if it had never stopped.
+"""
+
+import math
+import os
+import struct
+import time
+import zlib
+
+from .dice import Dice
+from .node import Node
+from .orientation import NUM_ORIENTATIONS, ORIENTATIONS, getStateId
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+# The header is ( magic, version, width, height, checksum of the maze,
+# nodes, fringe length, corridor links, nodes put on the queue, nodes taken
+# off the queue, insertion counter of the queue, length of the options ). The
+# options of the search follow the header as UTF-8 text.
+HEADER = struct.Struct('<12q')
+MAGIC = 0x52444d43
+VERSION = 2
+
+# A node is ( state id, parent state id or -1, g cost or -1, f cost or NaN,
+# flags ), the flags holding the name and whether the node was visited
+NODE = struct.Struct('<qqqdB')
+NAMES = ['.', 'S', 'G']
+VISITED = 4
+
+# A fringe entry is ( state id, length of the sort key, sort key padded to
+# three values ), in the order of the heap
+FRINGE = struct.Struct('<qBddd')
+SORT_KEY_SIZE = 3
+
+# A corridor link of a contracted search is ( parent state id, state id,
+# index of the corridor among those leaving the parent junction )
+LINK = struct.Struct('<qqq')
+
+# Snapshots are written at least this many seconds apart
+INTERVAL = 60.0
+
+# Largest fraction of the search time spent writing snapshots
+MAX_OVERHEAD = 0.05
+
+# Number of expansions between two looks at the clock
+CHECK_EVERY = 1024
+
+
+def getChecksum(maze):
+    """
+    A checksum of the maze, its starting and goal position and the
+    orientations allowed on every location, so that a snapshot is never
+    resumed on another maze.
+    :param maze: The maze
+    :return: unsigned 32-bit checksum
+    """
+    return zlib.crc32(repr((maze.width, maze.height, maze.getStartPos(), maze.getGoalPos(),
+                            maze.masks)).encode())
+
+
+def getOptions(problem, fringe, heuristic):
+    """
+    The options of a search that decide the order of its expansions, which a
+    resumed search must share with the search that wrote the snapshot.
+    :param problem: The Problem of the search, a ContractedProblem for a
+                    search on the contracted maze
+    :param fringe: The PriorityQueue of the search
+    :param heuristic: The HeuristicCache of the search
+    :return: string "heuristic=name tie-breaking=name contract=yes|no"
+    """
+    function = heuristic.heuristic if hasattr(heuristic, 'heuristic') else heuristic
+    return 'heuristic=%s tie-breaking=%s contract=%s' % (
+        getattr(function, '__name__', function), fringe.tieBreaking.__name__,
+        'yes' if hasattr(problem, 'contraction') else 'no')
+
+
+class SearchCheckpoint:
+    """
+    The class SearchCheckpoint saves the state of an aStarSearch to a file
+    and restores it. A snapshot costs time in proportion to the nodes of the
+    search, so they are written at most every interval seconds and never
+    sooner than needed to keep the time spent writing them below maxOverhead
+    of the search time. The file is replaced atomically, a search killed
+    while writing keeps the previous snapshot.
+    """
+    __slots__ = 'fileName', 'interval', 'maxOverhead', 'checkEvery', 'countdown', \
+                'lastSave', 'saveTime', 'saves', 'resumed', 'options'
+
+    def __init__(self, fileName, interval=INTERVAL, maxOverhead=MAX_OVERHEAD,
+                 checkEvery=CHECK_EVERY):
+        """
+        Initializes the checkpoint.
+        :param fileName: File of the snapshots, resumed from when it exists
+        :param interval: Fewest seconds between two snapshots
+        :param maxOverhead: Largest fraction of the search time spent writing
+                            snapshots
+        :param checkEvery: Number of expansions between two looks at the clock
+        """
+        self.fileName = fileName
+        self.interval = interval
+        self.maxOverhead = maxOverhead
+        self.checkEvery = checkEvery
+        self.countdown = checkEvery
+        self.lastSave = time.perf_counter()
+        self.saveTime = 0.0
+        self.saves = 0
+        self.resumed = False
+        self.options = ''
+
+    def resume(self, problem, fringe, visitedNodes, heuristic):
+        """
+        Restores the search from the snapshot file if there is one. Called by
+        the search before it starts.
+        :param problem: The fresh Problem of the search
+        :param fringe: The empty PriorityQueue of the search
+        :param visitedNodes: The empty closed set of the search
+        :param heuristic: The HeuristicCache of the search
+        :return: True if the search was restored else False
+        """
+        self.lastSave = time.perf_counter()
+        self.options = getOptions(problem, fringe, heuristic)
+        if not os.path.exists(self.fileName):
+            return False
+        with open(self.fileName, 'rb') as snapshotFile:
+            loadSnapshot(snapshotFile.read(), problem, fringe, visitedNodes, self.options)
+        self.resumed = True
+        self.lastSave = time.perf_counter()
+        return True
+
+    def tick(self, problem, fringe, visitedNodes):
+        """
+        Writes a snapshot when one is due. Called by the search between two
+        expansions.
+        :param problem: The Problem of the search
+        :param fringe: The PriorityQueue of the search
+        :param visitedNodes: The closed set of the search
+        :return: True if a snapshot was written else False
+        """
+        self.countdown -= 1
+        if self.countdown > 0:
+            return False
+        self.countdown = self.checkEvery
+        now = time.perf_counter()
+        if now - self.lastSave < max(self.interval, self.saveTime / self.maxOverhead):
+            return False
+        self.save(problem, fringe, visitedNodes)
+        return True
+
+    def save(self, problem, fringe, visitedNodes):
+        """
+        Writes a snapshot of the search.
+        :param problem: The Problem of the search
+        :param fringe: The PriorityQueue of the search
+        :param visitedNodes: The closed set of the search
+        :return: None
+        """
+        start = time.perf_counter()
+        temporary = self.fileName + '.tmp'
+        with open(temporary, 'wb') as snapshotFile:
+            writeSnapshot(snapshotFile, problem, fringe, visitedNodes, self.options)
+            snapshotFile.flush()
+            os.fsync(snapshotFile.fileno())
+        os.replace(temporary, self.fileName)
+        self.saves += 1
+        self.lastSave = time.perf_counter()
+        self.saveTime = self.lastSave - start
+
+    def finish(self):
+        """
+        Deletes the snapshot file once the search is over.
+        :return: None
+        """
+        if os.path.exists(self.fileName):
+            os.remove(self.fileName)
+
+
+def writeSnapshot(snapshotFile, problem, fringe, visitedNodes, options=''):
+    """
+    Writes the state of a search to a binary file.
+    :param snapshotFile: File opened for writing bytes
+    :param problem: The Problem of the search
+    :param fringe: The PriorityQueue of the search
+    :param visitedNodes: The closed set of the search, a set of nodes or a
+                         StateBitset
+    :param options: The getOptions string of the search
+    :return: None
+    """
+    maze = problem.maze
+    height = maze.height
+    # Only the nodes keyed by ( x, y, top, right, north ), one per state
+    nodes = [node for key, node in problem.nodeMap.items() if len(key) == 5]
+    links = getattr(problem, 'links', {})
+
+    snapshotFile.write(HEADER.pack(MAGIC, VERSION, maze.width, height, getChecksum(maze),
+                                   len(nodes), len(fringe.queue), len(links),
+                                   fringe.nodesPutOnQueue, fringe.nodesTakenOff,
+                                   fringe.counter, len(options.encode())))
+    snapshotFile.write(options.encode())
+    records = list()
+    for node in nodes:
+        parent = node.getParent()
+        gCost, fCost = node.getGCost(), node.getFCost()
+        records.append(NODE.pack(getStateId(node, height),
+                                 getStateId(parent, height) if parent is not None else -1,
+                                 gCost if gCost is not None else -1,
+                                 fCost if fCost is not None else math.nan,
+                                 NAMES.index(node.getName()) |
+                                 (VISITED if node in visitedNodes else 0)))
+    snapshotFile.write(b''.join(records))
+
+    records = list()
+    for node in fringe.queue:
+        sortKey = tuple(node.sortKey)
+        records.append(FRINGE.pack(getStateId(node, height), len(sortKey),
+                                   *(sortKey + (0,) * (SORT_KEY_SIZE - len(sortKey)))))
+    snapshotFile.write(b''.join(records))
+
+    records = list()
+    for (parent, node), corridor in links.items():
+        corridors = problem.contraction.getCorridors(parent.getPos())
+        records.append(LINK.pack(getStateId(parent, height), getStateId(node, height),
+                                 corridors.index(corridor)))
+    snapshotFile.write(b''.join(records))
+
+
+def loadSnapshot(data, problem, fringe, visitedNodes, options=''):
+    """
+    Restores the state of a search written by writeSnapshot.
+    :param data: bytes of the snapshot file
+    :param problem: The fresh Problem of the search, on the same maze
+    :param fringe: The empty PriorityQueue of the search
+    :param visitedNodes: The empty closed set of the search
+    :param options: The getOptions string of the search, which must be the
+                    one of the search that wrote the snapshot
+    :return: None
+    """
+    maze = problem.maze
+    if len(data) < HEADER.size:
+        raise ValueError('not a search checkpoint')
+    magic, version, width, height, checksum, nodeCount, fringeCount, linkCount, \
+        nodesPutOnQueue, nodesTakenOff, counter, optionsLength = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('not a search checkpoint')
+    if checksum != getChecksum(maze):
+        raise ValueError('the checkpoint was written for another maze')
+    written = bytes(data[HEADER.size:HEADER.size + optionsLength]).decode()
+    if written != options:
+        raise ValueError('the checkpoint was written with %s, not with %s' % (written, options))
+
+    data = memoryview(data)
+    offset = HEADER.size + optionsLength
+    nodes = {}
+    parents = list()
+    for stateId, parentId, gCost, fCost, flags in \
+            NODE.iter_unpack(data[offset:offset + nodeCount * NODE.size]):
+        cell, index = divmod(stateId, NUM_ORIENTATIONS)
+        x, y = divmod(cell, height)
+        top, right, north = ORIENTATIONS[index]
+        aNode = Node(maze, Dice(top, right, north), NAMES[flags & (VISITED - 1)],
+                     gCost if gCost >= 0 else None, fCost if not math.isnan(fCost) else None,
+                     x, y, None)
+        problem.nodeMap[(x, y, top, right, north)] = aNode
+        nodes[stateId] = aNode
+        parents.append((aNode, parentId))
+        if flags & VISITED:
+            visitedNodes.add(aNode)
+    for aNode, parentId in parents:
+        if parentId >= 0:
+            aNode.setParent(nodes[parentId])
+    offset += nodeCount * NODE.size
+
+    for stateId, size, *sortKey in \
+            FRINGE.iter_unpack(data[offset:offset + fringeCount * FRINGE.size]):
+        aNode = nodes[stateId]
+        aNode.sortKey = tuple(sortKey[:size])
+        fringe.queue.append(aNode)
+    offset += fringeCount * FRINGE.size
+    fringe.nodesPutOnQueue = nodesPutOnQueue
+    fringe.nodesTakenOff = nodesTakenOff
+    fringe.counter = counter
+
+    for parentId, stateId, index in \
+            LINK.iter_unpack(data[offset:offset + linkCount * LINK.size]):
+        parent = nodes[parentId]
+        problem.links[(parent, nodes[stateId])] = \
+            problem.contraction.getCorridors(parent.getPos())[index]
@@ -0,0 +1,97 @@
+"""
+File: closedSet.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Closed set of the A* search stored as one bit per state of the
+             maze, in memory or in a memory-mapped file for mazes whose state
+             space does not fit in memory.
+"""
+
+import mmap
+import tempfile
+
+from .orientation import NUM_ORIENTATIONS, getStateId
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+# Bitsets larger than this many bytes are memory-mapped to a temporary file
+MEMORY_LIMIT = 1 << 26
+
+
+class StateBitset:
+    """
+    The class StateBitset can be used in place of the set of visited nodes.
+    It holds one bit for every ( cell, orientation ) of the maze, i.e.
+    width * height * 24 bits or 3 bytes per cell, whatever the number of
+    states visited.
+    """
+    __slots__ = 'height', 'bits', 'count', 'file'
+
+    def __init__(self, maze, memoryLimit=MEMORY_LIMIT, directory=None):
+        """
+        Allocates the cleared bitset.
+        :param maze: The maze being searched
+        :param memoryLimit: Largest bitset in bytes kept in memory, larger ones
+                            are memory-mapped to a temporary file
+        :param directory: Directory of the temporary file, None for the system
+                          default
+        """
+        self.height = maze.height
+        self.count = 0
+        self.file = None
+        size = (maze.width * maze.height * NUM_ORIENTATIONS + 7) // 8
+        if size <= memoryLimit:
+            self.bits = bytearray(size)
+        else:
+            self.file = tempfile.TemporaryFile(dir=directory)
+            self.file.truncate(size)
+            self.bits = mmap.mmap(self.file.fileno(), size)
+
+    def add(self, node):
+        """
+        Marks the state of a node as visited.
+        :param node: A node object
+        :return: None
+        """
+        stateId = getStateId(node, self.height)
+        mask = 1 << (stateId & 7)
+        byte = self.bits[stateId >> 3]
+        if not byte & mask:
+            self.bits[stateId >> 3] = byte | mask
+            self.count += 1
+
+    def __contains__(self, node):
+        """
+        Checks whether the state of a node was visited.
+        :param node: A node object
+        :return: True if visited else False
+        """
+        stateId = getStateId(node, self.height)
+        return bool(self.bits[stateId >> 3] & (1 << (stateId & 7)))
+
+    def __len__(self):
+        """
+        The number of visited states.
+        :return: number of states
+        """
+        return self.count
+
+    def isMapped(self):
+        """
+        Checks whether the bitset lives in a memory-mapped file.
+        :return: True if memory-mapped else False
+        """
+        return self.file is not None
+
+    def close(self):
+        """
+        Releases a memory-mapped bitset and deletes its file.
+        :return: None
+        """
+        if self.file is not None:
+            self.bits.close()
+            self.file.close()
+            self.file = None
+            self.bits = None
@@ -0,0 +1,274 @@
+"""
+File: contraction.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Contraction of the maze graph before the search. Dead-end
+             pockets are pruned and one-cell-wide corridors are collapsed
+             into macro-edges, so the A* search only expands the junctions.
+"""
+
+from .dice import Dice, MOVES
+from .node import Node
+from .orientation import ORIENTATION_BITS, ORIENTATION_INDEX, ORIENTATIONS, ROLLS
+from .search import Problem
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+
+class Corridor:
+    """
+    A macro-edge of the contracted maze. It leads from a junction through a
+    one-cell-wide corridor to the next junction. The dice has to roll the
+    whole corridor once it enters it: rolling part of the way in and back
+    again leaves the dice as it was, so it never shortens a path.
+    """
+    __slots__ = 'start', 'cells', 'moves', 'masks', 'transforms'
+
+    def __init__(self, start, cells, moves, masks):
+        """
+        Initializes the corridor.
+        :param start: position of the junction the corridor leaves from
+        :param cells: positions rolled over, ending with the next junction
+        :param moves: dice move names, one per cell
+        :param masks: masks of the orientations allowed on the cells
+        """
+        self.start = start
+        self.cells = cells
+        self.moves = moves
+        self.masks = masks
+        # ( top, right, north ) on entry -> ( top, right, north ) on exit, or
+        # None when a cell of the corridor does not allow the orientation
+        self.transforms = {}
+
+    def getEnd(self):
+        """
+        The junction the corridor leads to.
+        :return: tuple ( x-coordinate, y-coordinate )
+        """
+        return self.cells[-1]
+
+    def getLength(self):
+        """
+        The number of rolls needed to pass the corridor.
+        :return: length of the corridor
+        """
+        return len(self.cells)
+
+    def roll(self, dice):
+        """
+        The orientation of the dice at the end of the corridor. The dice is not
+        changed.
+        :param dice: dice configuration at the start of the corridor
+        :return: tuple ( top, right, north ) at the end of the corridor or None
+                 if a cell of the corridor does not allow the orientation the
+                 dice rolls into, e.g. 6 on top
+        """
+        orientation = (dice.top, dice.right, dice.north)
+        if orientation not in self.transforms:
+            index = ORIENTATION_INDEX[orientation]
+            for (dx, dy), mask in zip(self.deltas(), self.masks):
+                index = ROLLS[(dx, dy)][index]
+                if not mask & ORIENTATION_BITS[index]:
+                    index = None
+                    break
+            self.transforms[orientation] = None if index is None else ORIENTATIONS[index]
+        return self.transforms[orientation]
+
+    def deltas(self):
+        """
+        The ( dx, dy ) of the rolls through the corridor.
+        :return: list of tuples ( dx, dy ), one per cell
+        """
+        return [(x1 - x0, y1 - y0) for (x0, y0), (x1, y1)
+                in zip([self.start] + self.cells, self.cells)]
+
+    def expand(self, dice):
+        """
+        The dice configurations on every cell of the corridor.
+        :param dice: dice configuration at the start of the corridor
+        :return: list of tuples ( x-coordinate, y-coordinate, Dice )
+        """
+        aDice = Dice(dice.top, dice.right, dice.north)
+        cells = list()
+        for (x, y), moveName in zip(self.cells, self.moves):
+            aDice.move(moveName)
+            cells.append((x, y, Dice(aDice.top, aDice.right, aDice.north)))
+        return cells
+
+
+class MazeContraction:
+    """
+    The contracted graph of a maze. Cells that cannot be part of a shortest
+    path are pruned: a dead-end pocket without the start or goal can only be
+    entered and left the same way, which leaves the dice unchanged. Among the
+    remaining cells, the junctions ( cells with other than two open
+    neighbours, the start and the goal ) are connected by corridors.
+    """
+    __slots__ = 'pruned', 'junctions', 'corridors'
+
+    def __init__(self, maze):
+        """
+        Contracts the maze.
+        :param maze: The maze to contract
+        """
+        self.pruned = set()
+        self.junctions = set()
+        self.corridors = {}
+        self.__contract(maze)
+
+    @staticmethod
+    def getOpenNeighbors(maze, pos, removed):
+        """
+        The open cells next to a position.
+        :param maze: The maze
+        :param pos: tuple ( x-coordinate, y-coordinate )
+        :param removed: cells pruned so far
+        :return: list of positions
+        """
+        x, y = pos
+        neighbors = list()
+        for dx, dy in MOVES:
+            neighbor = (x + dx, y + dy)
+            if maze.isPosInMaze(neighbor) and not maze.isObstacle(neighbor) \
+                    and neighbor not in removed:
+                neighbors.append(neighbor)
+        return neighbors
+
+    def __contract(self, maze):
+        """
+        Prunes the dead ends and collapses the corridors.
+        :param maze: The maze to contract
+        :return: None
+        """
+        keep = {maze.getStartPos(), maze.getGoalPos()}
+        cells = [(x, y) for x in range(maze.width) for y in range(maze.height)
+                 if not maze.isObstacle((x, y))]
+
+        degree = {cell: len(MazeContraction.getOpenNeighbors(maze, cell, self.pruned))
+                  for cell in cells}
+        deadEnds = [cell for cell in cells if degree[cell] <= 1 and cell not in keep]
+        while deadEnds:
+            cell = deadEnds.pop()
+            if cell in self.pruned:
+                continue
+            self.pruned.add(cell)
+            for neighbor in MazeContraction.getOpenNeighbors(maze, cell, self.pruned):
+                degree[neighbor] -= 1
+                if degree[neighbor] <= 1 and neighbor not in keep:
+                    deadEnds.append(neighbor)
+
+        self.junctions = {cell for cell in cells
+                          if cell not in self.pruned and (degree[cell] != 2 or cell in keep)}
+
+        for junction in self.junctions:
+            corridors = list()
+            for neighbor in MazeContraction.getOpenNeighbors(maze, junction, self.pruned):
+                previous, current = junction, neighbor
+                path = [current]
+                moves = [MOVES[(current[0] - previous[0], current[1] - previous[1])]]
+                while current not in self.junctions:
+                    following = [cell for cell in
+                                 MazeContraction.getOpenNeighbors(maze, current, self.pruned)
+                                 if cell != previous]
+                    previous, current = current, following[0]
+                    path.append(current)
+                    moves.append(MOVES[(current[0] - previous[0], current[1] - previous[1])])
+                corridors.append(Corridor(junction, path, moves,
+                                          [maze.getMask(x, y) for x, y in path]))
+            self.corridors[junction] = corridors
+
+    def getCorridors(self, pos):
+        """
+        The corridors leaving a junction.
+        :param pos: tuple ( x-coordinate, y-coordinate ) of a junction
+        :return: list of Corridor
+        """
+        return self.corridors.get(pos, [])
+
+    def getCorridorCells(self):
+        """
+        The number of cells that were collapsed into corridors.
+        :return: number of cells
+        """
+        cells = set()
+        for corridors in self.corridors.values():
+            for corridor in corridors:
+                cells.update(corridor.cells[:-1])
+        return len(cells)
+
+
+class ContractedProblem(Problem):
+    """
+    The search problem on the contracted maze. The states are the junction
+    states and the successors are reached through whole corridors, whose
+    length is the cost of the roll sequence.
+    """
+
+    __slots__ = 'contraction', 'links'
+
+    def __init__(self, maze):
+        """
+        Initializes the problem with the contraction of the maze.
+        :param maze: Default Maze representation.
+        """
+        Problem.__init__(self, maze)
+        self.contraction = maze.getContraction()
+        # ( parent state, state ) -> shortest corridor between them
+        self.links = {}
+
+    def getSuccessors(self, state):
+        """
+        :param state: Search state
+
+        Returns the junction states reachable through one corridor from the
+        given junction state.
+        """
+        successors = list()
+        for corridor in self.contraction.getCorridors(state.getPos()):
+            orientation = corridor.roll(state.dice)
+            if orientation is None:
+                continue
+            x, y = corridor.getEnd()
+            top, right, north = orientation
+            key = (x, y, top, right, north)
+            if key not in self.nodeMap:
+                name = 'G' if self.maze.isGoal(x, y, top) else '.'
+                self.nodeMap[key] = Node(self.maze, Dice(top, right, north), name,
+                                         None, None, x, y, state)
+            successor = self.nodeMap[key]
+            link = (state, successor)
+            if link not in self.links:
+                successors.append(successor)
+            elif corridor.getLength() >= self.links[link].getLength():
+                continue
+            self.links[link] = corridor
+        return successors
+
+    def getCostOfActions(self, actions = None):
+        """
+        Returns the gCost of rolling through the corridor between two states.
+        :param actions: tuple ( state, successor state )
+        """
+        return self.links[actions].getLength()
+
+    def getPath(self, goal):
+        """
+        Returns the cell by cell path from the start state to the given state,
+        expanding every corridor the search went through.
+        :param goal: Search state reached by the search, may be None
+        :return: list of the states on the path, empty if goal is None
+        """
+        junctions = Problem.getPath(self, goal)
+        if not junctions:
+            return junctions
+        path = [junctions[0]]
+        for parent, state in zip(junctions, junctions[1:]):
+            corridor = self.links[(parent, state)]
+            gCost = path[-1].getGCost()
+            for x, y, dice in corridor.expand(parent.dice):
+                gCost += 1
+                name = state.getName() if (x, y) == state.getPos() else '.'
+                path.append(Node(self.maze, dice, name, gCost, None, x, y, path[-1]))
+        return path
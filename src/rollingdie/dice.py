@@ -10,6 +10,9 @@ Description: Representation of the dice configuration and
 
 __author__ = "Karan Jariwala, Aravindh Kuppusamy, and Deepak Sharma"
 
+# Name of the dice move for every ( dx, dy ) of a roll
+MOVES = {(-1, 0): 'moveLeft', (1, 0): 'moveRight', (0, -1): 'moveSouth', (0, 1): 'moveNorth'}
+
 
 class Dice:
     """
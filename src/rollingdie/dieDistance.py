@@ -0,0 +1,145 @@
+"""
+File: dieDistance.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Table of the exact number of rolls needed on an open grid,
+             without obstacles but never showing 6 on top, to bring the
+             dice from any orientation at any offset to the goal with 1 on
+             top. It backs the die_distance heuristic.
+"""
+
+from collections import deque
+
+from .orientation import NUM_ORIENTATIONS, ROLLS, TOPS
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+# Offsets up to RADIUS in both directions are looked up in the table
+RADIUS = 16
+
+# The breadth first search runs on a grid this much larger than the table so
+# that paths leaving the table radius are accounted for. Shortest paths on
+# the open grid never need more than 4 extra rolls, and leaving the radius
+# by MARGIN cells and coming back costs 2 * MARGIN extra rolls.
+MARGIN = 4
+
+UNREACHABLE = 255
+
+
+class DieDistanceTable:
+    """
+    The class DieDistanceTable holds the exact open grid distances for all
+    offsets ( dx, dy ) = state position - goal position with |dx|, |dy| <=
+    RADIUS and all orientations in a bytearray. The search never reopens a
+    closed node, so the bound must be consistent, dropping by at most 1 on a
+    roll, and not only admissible. Beyond the radius the exact distance is
+    unknown and only the Manhattan distance is left, so the extra rolls of
+    the table over the Manhattan distance are capped by the number of cells
+    between the offset and the border of the table: the Manhattan distance
+    and the cap change by 1 on a roll, the exact distance too, and the
+    bound min( exact, Manhattan + cap ) falls to the Manhattan distance on
+    the border without any step larger than 1.
+    """
+    __slots__ = 'radius', 'side', 'distances'
+
+    def __init__(self, radius=RADIUS, margin=MARGIN):
+        """
+        Computes the table with a breadth first search from the goal states.
+        Rolls can be undone, so the distances from the goal are the distances
+        to the goal.
+        :param radius: largest offset stored in the table
+        :param margin: extra cells searched around the table
+        """
+        self.radius = radius
+        self.side = 2 * radius + 1
+        extent = radius + margin
+        side = 2 * extent + 1
+
+        distances = bytearray([UNREACHABLE]) * (side * side * NUM_ORIENTATIONS)
+        frontier = deque()
+        for orientation in range(NUM_ORIENTATIONS):
+            if TOPS[orientation] == 1:
+                index = ((extent * side) + extent) * NUM_ORIENTATIONS + orientation
+                distances[index] = 0
+                frontier.append((extent, extent, orientation))
+
+        rolls = list(ROLLS.items())
+        while frontier:
+            x, y, orientation = frontier.popleft()
+            distance = distances[(x * side + y) * NUM_ORIENTATIONS + orientation] + 1
+            for (dx, dy), roll in rolls:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < side and 0 <= ny < side):
+                    continue
+                nextOrientation = roll[orientation]
+                if TOPS[nextOrientation] == 6:
+                    continue
+                index = (nx * side + ny) * NUM_ORIENTATIONS + nextOrientation
+                if distances[index] == UNREACHABLE:
+                    distances[index] = distance
+                    frontier.append((nx, ny, nextOrientation))
+
+        self.distances = bytearray(self.side * self.side * NUM_ORIENTATIONS)
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                source = ((dx + extent) * side + dy + extent) * NUM_ORIENTATIONS
+                target = ((dx + radius) * self.side + dy + radius) * NUM_ORIENTATIONS
+                self.distances[target:target + NUM_ORIENTATIONS] = \
+                    distances[source:source + NUM_ORIENTATIONS]
+
+    def getDistance(self, dx, dy, orientation):
+        """
+        The lower bound on the number of rolls to the goal.
+        :param dx: x-coordinate of the state minus x-coordinate of the goal
+        :param dy: y-coordinate of the state minus y-coordinate of the goal
+        :param orientation: orientation index of the dice
+        :return: exact open grid distance well within the radius, consistent
+                 lower bound closer to the border and beyond it
+        """
+        manhattan = abs(dx) + abs(dy)
+        # Cells between the offset and the border of the table
+        room = self.radius - max(abs(dx), abs(dy))
+        if room <= 0:
+            return manhattan
+        distance = self.distances[((dx + self.radius) * self.side + dy + self.radius) *
+                                  NUM_ORIENTATIONS + orientation]
+        return min(distance, manhattan + room)
+
+    def getDistances(self, dx, dy, orientations):
+        """
+        The lower bounds of getDistance for many states at once.
+        :param dx: NumPy array of the x-coordinates of the states minus the
+                   x-coordinate of the goal
+        :param dy: NumPy array of the y-coordinates of the states minus the
+                   y-coordinate of the goal
+        :param orientations: NumPy array of the orientation indexes
+        :return: NumPy array of int64
+        """
+        import numpy as np
+
+        radius = self.radius
+        manhattan = np.abs(dx) + np.abs(dy)
+        room = radius - np.maximum(np.abs(dx), np.abs(dy))
+        inside = room > 0
+        index = ((np.where(inside, dx, 0) + radius) * self.side + np.where(inside, dy, 0) +
+                 radius) * NUM_ORIENTATIONS + orientations
+        table = np.frombuffer(bytes(self.distances), dtype=np.uint8)
+        return np.where(inside, np.minimum(table[index], manhattan + room),
+                        manhattan).astype(np.int64)
+
+
+_table = None
+
+
+def getTable():
+    """
+    The shared table, built on first use so that importing the package stays
+    cheap.
+    :return: DieDistanceTable
+    """
+    global _table
+    if _table is None:
+        _table = DieDistanceTable()
+    return _table
@@ -0,0 +1,177 @@
+"""
+File: fringeSearch.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Fringe Search ( Bjornsson, Enzenberger, Holte and Schaeffer,
+             2005 ) for the Rolling Die Maze. It finds the same optimal
+             paths as A* but keeps its open nodes in a doubly linked list
+             swept with an increasing f threshold, so there is no heap to
+             maintain.
+"""
+
+from .heuristic import HeuristicCache
+from .trace import EXPAND, GOAL
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+
+class FringeList:
+    """
+    This class represents the fringe of the Fringe Search as a doubly linked
+    list of nodes. The part of the list behind the node being visited holds
+    the nodes for the next iteration ( later ), the part in front of it the
+    nodes still to be visited in this iteration ( now ).
+    """
+    __slots__ = 'head', 'tail', 'nextNode', 'prevNode', 'nodesPutOnQueue', 'nodesTakenOff'
+
+    def __init__(self):
+        """
+        A parameterless constructor which initializes the empty list, number
+        of nodes added into the list, and number of nodes removed from the
+        list.
+        """
+        self.head = None
+        self.tail = None
+        self.nextNode = {}
+        self.prevNode = {}
+        self.nodesPutOnQueue = 0
+        self.nodesTakenOff = 0
+
+    def insertAfter(self, node, newNode):
+        """
+        Inserts a node right after another one, or at the end of the list.
+        :param node: A node in the list, None to append at the end
+        :param newNode: The node to insert
+        :return: None
+        """
+        if node is None:
+            node = self.tail
+        following = self.nextNode[node] if node is not None else None
+        self.prevNode[newNode] = node
+        self.nextNode[newNode] = following
+        if node is None:
+            self.head = newNode
+        else:
+            self.nextNode[node] = newNode
+        if following is None:
+            self.tail = newNode
+        else:
+            self.prevNode[following] = newNode
+        self.nodesPutOnQueue += 1
+
+    def remove(self, node):
+        """
+        Removes a node from the list.
+        :param node: A node in the list
+        :return: None
+        """
+        previous = self.prevNode.pop(node)
+        following = self.nextNode.pop(node)
+        if previous is None:
+            self.head = following
+        else:
+            self.nextNode[previous] = following
+        if following is None:
+            self.tail = previous
+        else:
+            self.prevNode[following] = previous
+        self.nodesTakenOff += 1
+
+    def getNext(self, node):
+        """
+        The node following a node in the list.
+        :param node: A node in the list
+        :return: the next node, None at the end of the list
+        """
+        return self.nextNode[node]
+
+    def __contains__(self, node):
+        """
+        Checks whether a node is in the list.
+        :param node: A node object
+        :return: True if in the list else False
+        """
+        return node in self.nextNode
+
+    def isEmpty(self):
+        """
+        It checks whether the list is empty or not
+        :return: True if empty else False
+        """
+        return self.head is None
+
+
+def fringeSearch(problem, heuristicName, fringe, visitedNodes, trace=None):
+    """
+    Sweeps the fringe list visiting the nodes whose fCost is within the
+    current threshold. Nodes over the threshold stay in the list for the
+    next sweep, whose threshold is the smallest fCost seen over it. The gCost
+    of every state reached is cached, so a state is only put on the list
+    again when a cheaper path to it is found.
+    :param problem: A problem consist of initial state, goal test, successor
+                    functions and a path cost
+    :param heuristicName: The heuristic which is to be used, either the name
+           of a Heuristic method, a heuristic function or a HeuristicCache.
+           The heuristic of a node is needed on every sweep, so it is always
+           memoized.
+    :param fringe: FringeList in which the nodes have been put up
+    :param visitedNodes: States that has been visited once. i.e., states whose
+           children have been generated
+    :param trace: TraceRecorder receiving a record for every node expanded,
+                  None for no trace
+    :return: the goal state, None if there is no path
+    """
+    startState = problem.getStartState()
+    heuristic = HeuristicCache.create(heuristicName)
+    # state -> gCost of the cheapest path found so far
+    gCosts = {startState: 0}
+    startState.setGCost(0)
+    startState.setFCost(heuristic(startState, problem))
+    fringe.insertAfter(None, startState)
+    fLimit = startState.getFCost()
+
+    while not fringe.isEmpty():
+        fMin = float('inf')
+        curState = fringe.head
+        while curState is not None:
+            gCost = gCosts[curState]
+            fCost = gCost + heuristic(curState, problem)
+            if fCost > fLimit:
+                fMin = min(fMin, fCost)
+                curState = fringe.getNext(curState)
+                continue
+
+            curState.setGCost(gCost)
+            curState.setFCost(fCost)
+            if problem.isGoalState(curState):
+                print('SUCCESS')
+                visitedNodes.add(curState)
+                if trace is not None:
+                    trace.record(GOAL, curState, gCost, fCost, curState.getParent())
+                return curState
+
+            visitedNodes.add(curState)
+            if trace is not None:
+                trace.record(EXPAND, curState, gCost, fCost, curState.getParent())
+
+            # Children go right after the current node so they are visited
+            # in this same sweep if they are within the threshold
+            for childState in reversed(problem.getSuccessors(curState)):
+                childStateGCost = gCost + problem.getCostOfActions((curState, childState))
+                if childState in gCosts and childStateGCost >= gCosts[childState]:
+                    continue
+                if childState in fringe:
+                    fringe.remove(childState)
+                fringe.insertAfter(curState, childState)
+                gCosts[childState] = childStateGCost
+                childState.setParent(curState)
+
+            nextState = fringe.getNext(curState)
+            fringe.remove(curState)
+            curState = nextState
+        fLimit = fMin
+
+    print("FAILURE")
+    return None
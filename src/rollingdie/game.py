@@ -0,0 +1,297 @@
+"""
+File: game.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Rolling Die Maze game which runs the A* search on a maze file
+             and prints the solution on the console
+"""
+
+import time
+
+from .maze import Maze, loadMaze
+from .priorityQueue import PriorityQueue
+from .heuristic import HeuristicCache
+from .search import Problem, aStarSearch
+from .realtime import LRTAStar, getMaxSteps
+from .contraction import ContractedProblem
+from .trace import TraceRecorder
+from .checkpoint import SearchCheckpoint, INTERVAL
+from .closedSet import StateBitset
+from .fringeSearch import FringeList, fringeSearch
+from .waypoints import WaypointPlanner
+from .cbs import ConflictBasedSearch, getCost
+from .orientation import TOPS
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+
+class Game:
+    """
+    The game class consist of initializing the parameters and run the a star
+    search algorithm on the provided maze file and print the output on the
+    console.
+    """
+    @staticmethod
+    def run(layout, heuristic, cacheSize=None, tieBreaking='none', contract=False,
+            traceFile=None, traceCapacity=1 << 16, tracePushes=False, closedSet='set',
+            engine='astar', checkpointFile=None, checkpointInterval=INTERVAL,
+            predictedTime=None):
+        """
+        It initialize the configuration parameters and run the a star
+        algorithm on the maze data and gets the output.
+        :param layout: Two dimensional array of maze configuration
+        :param heuristic: Type of heuristic
+        :param cacheSize: Maximum number of states in the heuristic cache,
+                          None for unbounded
+        :param tieBreaking: Name of the TieBreaking policy of the fringe
+        :param contract: Search the maze with its dead ends pruned and its
+                         corridors collapsed
+        :param traceFile: File receiving a binary trace of the search, None
+                          for no trace
+        :param traceCapacity: Number of records kept in the trace
+        :param tracePushes: Also trace the nodes pushed and updated
+        :param closedSet: 'set' to keep the visited nodes in a set, 'bitset'
+                          to keep one bit per state in a StateBitset
+        :param engine: 'astar' for the A* search on a priority queue, 'fringe'
+                       for the Fringe Search on a linked list, 'graph' for
+                       the A* search on the compiled state graph of the maze
+        :param checkpointFile: File the A* search snapshots its state to and
+                               resumes from when it exists, None for no
+                               snapshots
+        :param checkpointInterval: Fewest seconds between two snapshots
+        :param predictedTime: Search time in milliseconds predicted by the
+                              HeuristicSelector, printed next to the actual
+                              one, None to print neither
+        :return: return a list which contains heuristic name, number of moves
+                 it took, number of node generated and visited
+        """
+        if checkpointFile is not None and engine != 'astar':
+            raise ValueError('only the astar engine can be checkpointed')
+        if engine == 'graph' and (contract or closedSet != 'set'):
+            raise ValueError('the graph engine searches the whole state graph with its own '
+                             'closed set')
+        layoutText = loadMaze(layout)
+        aMaze = Maze(layoutText)
+        aProblem = ContractedProblem(aMaze) if contract else Problem(aMaze)
+
+        if engine == 'fringe':
+            fringe = FringeList()
+            search = fringeSearch
+        elif engine == 'graph':
+            # Imported here so that numpy stays off the start-up path
+            from .stateGraph import GraphFringe, graphSearch
+            fringe = GraphFringe(tieBreaking)
+            search = graphSearch
+        else:
+            fringe = PriorityQueue(tieBreaking)
+            search = aStarSearch
+        visitedNodes = StateBitset(aMaze) if closedSet == 'bitset' else set()
+
+        heuristicCache = HeuristicCache.create(heuristic, cacheSize)
+
+        trace = None
+        if traceFile is not None:
+            trace = TraceRecorder(aMaze, traceCapacity, traceFile, tracePushes)
+
+        start = time.perf_counter()
+        if checkpointFile is not None:
+            checkpoint = SearchCheckpoint(checkpointFile, checkpointInterval)
+            goal = search(aProblem, heuristicCache, fringe, visitedNodes, trace, checkpoint)
+        else:
+            goal = search(aProblem, heuristicCache, fringe, visitedNodes, trace)
+        searchTime = time.perf_counter() - start
+        if trace is not None:
+            trace.close()
+        if closedSet == 'bitset':
+            visitedNodes.close()
+        path = aProblem.getPath(goal)
+        numberOfMoves = len(path)
+
+        print("For Heuristics: ", heuristic)
+        Game.printPath(aMaze, path)
+
+        print("\n|---------------- PERFORMANCE METRICS -----------------|\n")
+        print("No. of moves in the solution                    : ", numberOfMoves - 1)
+        print("No. of nodes put on the queue                   : ", fringe.nodesPutOnQueue)
+        print("No. of nodes visited / removed from the queue   : ", len(visitedNodes))
+        if contract:
+            contraction = aMaze.getContraction()
+            print("No. of junctions / corridor cells / pruned cells: ", len(contraction.junctions), "/",
+                  contraction.getCorridorCells(), "/", len(contraction.pruned))
+        if trace is not None:
+            print("No. of trace records written to " + traceFile + ": ", trace.count)
+        if checkpointFile is not None:
+            print("No. of snapshots written / resumed from snapshot: ", checkpoint.saves, "/",
+                  "yes" if checkpoint.resumed else "no")
+        print("Heuristic cache hits / misses / evictions       : ", heuristicCache.hits, "/",
+              heuristicCache.misses, "/", heuristicCache.evictions)
+        if predictedTime is not None:
+            print("Search time predicted / actual ( ms )           :  %.2f / %.2f" %
+                  (predictedTime, searchTime * 1000))
+        print("\n|------------------------------------------------------|\n")
+
+        result = [heuristic, numberOfMoves - 1, fringe.nodesPutOnQueue, len(visitedNodes)]
+        return result
+
+    @staticmethod
+    def printPath(aMaze, path, marks=None):
+        """
+        It prints the maze and the dice after every move of a path.
+        :param aMaze: The maze the path is in
+        :param path: list of the nodes on the path
+        :param marks: dictionary ( x-coordinate, y-coordinate ) -> symbol
+                      shown on the maze until the path goes through it
+        :return: None
+        """
+        move = 0
+        # ( x-coordinate, y-coordinate ) -> symbol tracking the path
+        marks = dict(marks) if marks is not None else dict()
+        if len(path) > 0:
+            print("|------------- STARTING MAZE--------------|\n")
+            marks[path[0].getPos()] = "S"
+            aMaze.printMaze(marks)
+            print("\n|------------- STARTING DICE ORIENTATION--------------|\n")
+            path[0].dice.display()
+
+        for currentNode in path:
+
+            print("\n|==================== MOVE: " + str(move) + "====================|\n")
+            print("|------------- MAZE--------------|\n")
+            marks[currentNode.getPos()] = '#'
+            aMaze.printMaze(marks)
+            print("\n|------------- DICE--------------|\n")
+            currentNode.dice.display()
+            move += 1
+
+    @staticmethod
+    def runWaypoints(layout, waypoints, ordered=True, workers=None):
+        """
+        It plans the route through waypoints to the goal on the maze data and
+        prints it like run does.
+        :param layout: Two dimensional array of maze configuration
+        :param waypoints: list of tuples ( x-coordinate, y-coordinate ), the
+                          bottom left location being ( 0, 0 )
+        :param ordered: True to visit the waypoints in the given order, False
+                        to choose the order with the fewest rolls
+        :param workers: Number of processes counting the rolls between the
+                        waypoints, None for the number of CPUs
+        :return: return a list which contains the visiting order, number of
+                 moves it took and number of one-to-many searches run
+        """
+        aMaze = Maze(loadMaze(layout))
+        planner = WaypointPlanner(aMaze, workers)
+        plan = planner.plan(waypoints, ordered)
+        path = planner.getPath(plan[2]) if plan is not None else list()
+        order = [waypoints[index] for index in plan[0]] if plan is not None else None
+
+        print("For Waypoints: ", " ".join("(%d,%d)" % tuple(cell) for cell in waypoints),
+              "( in the given order )" if ordered else "( in the best order )")
+        Game.printPath(aMaze, path, {tuple(cell): 'W' for cell in waypoints})
+
+        print("\n|---------------- PERFORMANCE METRICS -----------------|\n")
+        print("Order of the waypoints                          : ",
+              " ".join("(%d,%d)" % tuple(cell) for cell in order) if order is not None else None)
+        print("No. of moves in the solution                    : ", len(path) - 1)
+        print("No. of one-to-many searches between waypoints   : ", planner.searches)
+        print("\n|------------------------------------------------------|\n")
+
+        return [order, len(path) - 1, planner.searches]
+
+    @staticmethod
+    def runAgents(layout, agents, suboptimality=1.0):
+        """
+        It plans the paths of several dice rolling on the maze at the same
+        time with Conflict-Based Search and prints them. The dice from the
+        starting to the goal position of the maze comes first.
+        :param layout: Two dimensional array of maze configuration
+        :param agents: list of tuples ( starting position, goal position ) of
+                       the other dice, the bottom left location being ( 0, 0 )
+        :param suboptimality: Factor of the fewest moves the solution may
+                              exceed, 1 for the fewest moves
+        :return: return a list which contains the paths, the total number of
+                 moves, the number of high level nodes expanded and the
+                 number of low level searches
+        """
+        aMaze = Maze(loadMaze(layout))
+        agents = [(aMaze.getStartPos(), aMaze.getGoalPos())] + list(agents)
+        search = ConflictBasedSearch(aMaze, agents, suboptimality)
+        paths = search.solve()
+        names = [chr(ord('A') + index % 26) for index in range(len(agents))]
+
+        print("For Dice: ", " ".join("%s (%d,%d)->(%d,%d)" % ((name,) + tuple(start) + tuple(goal))
+                                     for name, (start, goal) in zip(names, agents)))
+        for title, end in (("STARTING POSITIONS", 0), ("GOAL POSITIONS", 1)):
+            # The dice letters replace the S and G of the maze
+            marks = {aMaze.getStartPos(): '.', aMaze.getGoalPos(): '.'}
+            marks.update((tuple(agent[end]), name) for name, agent in zip(names, agents))
+            print("|------------- " + title + "--------------|\n")
+            aMaze.printMaze(marks)
+            print()
+        for name, path in zip(names, paths or []):
+            print("Dice %s ( %d moves ): " % (name, len(path) - 1),
+                  " ".join("(%d,%d)%d" % (x, y, TOPS[orientation]) for x, y, orientation in path))
+
+        cost = getCost(paths) if paths is not None else -1
+        print("\n|---------------- PERFORMANCE METRICS -----------------|\n")
+        if paths is None and search.expanded >= search.maxNodes:
+            print("No solution within", search.maxNodes, "high level nodes")
+        print("Total moves of all the dice ( sum of costs )    : ", cost)
+        print("Moves until every dice is on its goal           : ",
+              max(len(path) - 1 for path in paths) if paths is not None else -1)
+        print("No. of high level nodes expanded / generated    : ", search.expanded, "/",
+              search.generated)
+        print("No. of low level searches                       : ", search.searches)
+        print("\n|------------------------------------------------------|\n")
+
+        return [paths, cost, search.expanded, search.searches]
+
+    @staticmethod
+    def runRealtime(layout, heuristic, trials, lookahead=1, timeBudget=None, maxSteps=None):
+        """
+        It runs repeated real-time ( LRTA* ) trials on the maze data and
+        prints the moves the agent made in every trial.
+        :param layout: Two dimensional array of maze configuration
+        :param heuristic: Type of heuristic used as initial estimate
+        :param trials: Maximum number of trials, training stops earlier once
+                       the learned values no longer change
+        :param lookahead: Number of rolls looked ahead before every move
+        :param timeBudget: Time in seconds per move after which the lookahead
+                           stops deepening, None for no limit
+        :param maxSteps: Maximum number of moves per trial, None for the
+                         getMaxSteps limit of the maze
+        :return: return a list which contains heuristic name, number of moves
+                 of the last trial, number of trials and number of learned
+                 states
+        """
+        aMaze = Maze(loadMaze(layout))
+        agent = LRTAStar(aMaze, heuristic, lookahead, timeBudget)
+        if maxSteps is None:
+            maxSteps = getMaxSteps(aMaze)
+
+        print("For Heuristics: ", heuristic, " ( real-time, lookahead", lookahead, ")")
+        moves = -1
+        trial = 0
+        for trial in range(1, trials + 1):
+            before = dict(agent.table)
+            path, reached = agent.trial(maxSteps)
+            moves = len(path) if reached else -1
+            print("\n|==================== TRIAL: " + str(trial) + "====================|\n")
+            print("Moves: ", " ".join(moveName for moveName, aNode in path))
+            if len(path) >= maxSteps and not reached:
+                print("FAILURE: no goal within", maxSteps, "moves")
+            elif not reached:
+                print("FAILURE: the dice is stuck")
+            print("Goal reached                                    : ", reached)
+            print("No. of moves in the trial                       : ", len(path))
+            if reached and before == agent.table:
+                break
+
+        print("\n|---------------- PERFORMANCE METRICS -----------------|\n")
+        print("No. of moves in the last trial                  : ", moves)
+        print("No. of trials                                   : ", trial)
+        print("No. of states with a learned heuristic          : ", len(agent.table))
+        print("\n|------------------------------------------------------|\n")
+
+        return [heuristic, moves, trial, len(agent.table)]
@@ -10,6 +10,10 @@ Description: Various heuristic functions that returns the heuristic distance
 
 import copy
 import math
+from collections import OrderedDict
+
+from .orientation import getIndex, getStateId
+from .dieDistance import getTable
 
 __author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
 
@@ -136,6 +140,39 @@ class Heuristic:
 
         return manhattanDist + min(rewardA, rewardB)
 
+    @staticmethod
+    def die_distance(curState, problem):
+        """The dice distance heuristic for the current state.
+        :param curState: The current search state
+        :param problem: The A* search problem instance for this maze
+        :return: The number of rolls from the current state to the goal
+                 position with 1 on top on an open grid without obstacles,
+                 looked up in the precomputed DieDistanceTable: exact close
+                 to the goal, capped towards the Manhattan distance near the
+                 border of the table so that it stays consistent
+        """
+        pos1 = curState.getPos()
+        pos2 = problem.getGoalPosition()
+        return getTable().getDistance(pos1[0] - pos2[0], pos1[1] - pos2[1],
+                                      getIndex(curState.getDice()))
+
+    @staticmethod
+    def alt(curState, problem):
+        """The ALT ( landmark ) heuristic for the current state.
+        :param curState: The current search state
+        :param problem: The A* search problem instance for this maze
+        :return: The largest triangle inequality bound on the number of rolls
+                 to the goal over the landmarks of the maze's LandmarkTable,
+                 which is computed once per maze and needs numpy. Landmarks
+                 bound poorly the states close to the goal, so the bound is
+                 never below the die_distance one; the maximum of the two
+                 stays admissible and consistent.
+        """
+        maze = problem.maze
+        landmarkDistance = maze.getLandmarks().getDistance(getStateId(curState, maze.height),
+                                                           problem.getGoalPosition())
+        return max(landmarkDistance, Heuristic.die_distance(curState, problem))
+
     @staticmethod
     def forecast_manhattan(curState, problem):
         """The Forecast Manhattan distance heuristic for the current state.
@@ -170,4 +207,96 @@ class Heuristic:
         # else:
         #     totalPenalty = 1 + childPenalty * .2
 
-        return manhattanDist + totalPenalty
\ No newline at end of file
+        return manhattanDist + totalPenalty
+
+
+class HeuristicCache:
+    """
+    Memoizes a heuristic function for the duration of one search. The cache
+    is keyed by the search state ( x-coordinate, y-coordinate, dice top,
+    dice right, dice north ), so a state reached again through another parent
+    is only evaluated once. With a maxSize the least recently used entries are
+    evicted once the cache is full.
+    """
+    __slots__ = 'heuristic', 'maxSize', 'cache', 'hits', 'misses', 'evictions'
+
+    def __init__(self, heuristic, maxSize=None):
+        """
+        Wraps a heuristic function.
+        :param heuristic: A function taking ( search state, problem ) like the
+                          static methods of Heuristic
+        :param maxSize: Maximum number of cached states, None for unbounded
+        """
+        self.heuristic = heuristic
+        self.maxSize = maxSize
+        self.cache = OrderedDict() if maxSize is not None else {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def stateKey(curState):
+        """
+        The key under which the heuristic value of a state is cached.
+        :param curState: The current search state
+        :return: tuple ( x-coordinate, y-coordinate, dice top, dice right,
+                 dice north )
+        """
+        dice = curState.getDice()
+        return curState.getxCoordinate(), curState.getyCoordinate(), \
+            dice.top, dice.right, dice.north
+
+    def __call__(self, curState, problem):
+        """
+        Returns the cached heuristic value of the state, computing it on a miss.
+        :param curState: The current search state
+        :param problem: The A* search problem instance for this maze
+        :return: The heuristic distance of the state
+        """
+        key = HeuristicCache.stateKey(curState)
+        cache = self.cache
+        if key in cache:
+            self.hits += 1
+            if self.maxSize is not None:
+                cache.move_to_end(key)
+            return cache[key]
+
+        self.misses += 1
+        value = self.heuristic(curState, problem)
+        cache[key] = value
+        if self.maxSize is not None and len(cache) > self.maxSize:
+            cache.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def clear(self):
+        """
+        Drops all the cached values and resets the statistics.
+        :return: None
+        """
+        self.cache.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def hitRate(self):
+        """
+        The fraction of lookups that were answered from the cache.
+        :return: hit rate between 0 and 1
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def create(heuristic, maxSize=None):
+        """
+        Builds a cache for a heuristic given by name, by function or as an
+        existing cache, which is returned unchanged.
+        :param heuristic: Name of a Heuristic static method, a heuristic
+                          function or a HeuristicCache
+        :param maxSize: Maximum number of cached states, None for unbounded
+        :return: HeuristicCache instance
+        """
+        if isinstance(heuristic, HeuristicCache):
+            return heuristic
+        if not callable(heuristic):
+            heuristic = getattr(Heuristic, heuristic)
+        return HeuristicCache(heuristic, maxSize)
@@ -0,0 +1,221 @@
+"""
+File: landmarks.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: ALT ( A*, Landmarks, Triangle inequality ) heuristic for the
+             Rolling Die Maze. The exact distances between a few landmark
+             states and every state of the maze are precomputed once, and
+             serve as a lower bound for any start and goal on that maze.
+"""
+
+import numpy as np
+
+from .orientation import NUM_ORIENTATIONS, ROLLS, TOPS
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+# Number of landmarks selected when none is asked for
+DEFAULT_LANDMARKS = 8
+
+
+class LandmarkTable:
+    """
+    The class LandmarkTable holds the number of rolls between each landmark
+    and every state ( cell, orientation ) of a maze, as a ( landmarks, states )
+    array indexed by state id. Distances are taken on the maze without the
+    goal rule, i.e. with the masks of allowed orientations of the maze where
+    the goal location allows as much as any other, which makes them valid
+    whatever the goal. Rolls can be undone, so the distances
+    from a landmark are also the distances to it. States that cannot reach a
+    landmark hold the largest value of the array type.
+    By the triangle inequality, | d( L, goal ) - d( L, state ) | is a lower
+    bound of the number of rolls from the state to the goal for every
+    landmark L.
+    """
+    __slots__ = 'height', 'successors', 'landmarks', 'distances', 'unreachable', 'goals'
+
+    def __init__(self, maze, count=DEFAULT_LANDMARKS):
+        """
+        Selects the landmarks and computes their distances.
+        :param maze: The maze
+        :param count: Number of landmarks
+        """
+        self.height = maze.height
+        numStates = maze.width * maze.height * NUM_ORIENTATIONS
+        dtype = np.uint16 if numStates < np.iinfo(np.uint16).max else np.uint32
+        self.unreachable = np.iinfo(dtype).max
+        self.successors = LandmarkTable.buildSuccessors(maze)
+        self.landmarks = list()
+        self.distances = np.zeros((0, numStates), dtype=dtype)
+        # goal position -> distances of the goal states to the landmarks
+        self.goals = {}
+
+        seed = self.largestComponentState()
+        if seed is None:
+            return
+
+        # Farthest point selection over the cells of the largest connected
+        # component: the first landmark is in the cell farthest from a state
+        # of the component, every next one in the cell farthest from all the
+        # landmarks selected so far. Spreading the landmarks over orientations
+        # of the same cell would add little.
+        seedDistances = self.breadthFirstSearch(seed, dtype)
+        nearest = seedDistances.astype(np.int64)
+        nearest[seedDistances == self.unreachable] = -1
+        rows = list()
+        for counter in range(count):
+            cells = nearest.reshape(-1, NUM_ORIENTATIONS)
+            reachedCells = cells >= 0
+            cellDistances = np.where(reachedCells, cells, np.iinfo(np.int64).max).min(axis=1)
+            cellDistances[~reachedCells.any(axis=1)] = -1
+            cell = int(np.argmax(cellDistances))
+            if cellDistances[cell] <= 0:
+                break
+            landmark = cell * NUM_ORIENTATIONS + int(np.argmax(cells[cell]))
+            distances = self.breadthFirstSearch(landmark, dtype)
+            self.landmarks.append(landmark)
+            rows.append(distances)
+            reached = distances != self.unreachable
+            nearest = np.where(reached, np.minimum(nearest, distances), nearest)
+        if rows:
+            self.distances = np.vstack(rows)
+
+    @staticmethod
+    def buildSuccessors(maze):
+        """
+        The successors of every state, ignoring the goal rule.
+        :param maze: The maze
+        :return: ( states, 4 ) array of the successor state ids, -1 where the
+                 roll is not allowed
+        """
+        width, height = maze.width, maze.height
+        shape = (width, height, NUM_ORIENTATIONS)
+        ids = np.arange(width * height * NUM_ORIENTATIONS).reshape(shape)
+        masks = np.array([[maze.getBaseMask(x, y) for y in range(height)]
+                          for x in range(width)], dtype=np.int64).reshape(width, height)
+        valid = (masks[:, :, None] >> np.arange(NUM_ORIENTATIONS)) & 1 == 1
+
+        successors = np.full(shape + (len(ROLLS),), -1, dtype=np.int64)
+        for move, (dx, dy) in enumerate(sorted(ROLLS)):
+            roll = np.array(ROLLS[(dx, dy)])
+            # cells ( x, y ) whose neighbor ( x + dx, y + dy ) is in the maze
+            xs = slice(max(0, -dx), width - max(0, dx))
+            ys = slice(max(0, -dy), height - max(0, dy))
+            nxs = slice(max(0, dx), width - max(0, -dx))
+            nys = slice(max(0, dy), height - max(0, -dy))
+            targets = ids[nxs, nys][:, :, roll]
+            allowed = valid[xs, ys] & valid[nxs, nys][:, :, roll]
+            successors[xs, ys, :, move] = np.where(allowed, targets, -1)
+        return successors.reshape(-1, len(ROLLS))
+
+    def largestComponentState(self):
+        """
+        A state of the largest set of states connected by rolls, where
+        landmarks are useful to the most queries.
+        :return: state id, None if the maze has no state
+        """
+        hasSuccessors = (self.successors >= 0).any(axis=1)
+        labelled = ~hasSuccessors
+        remaining = int(hasSuccessors.sum())
+        best, bestSize = None, 0
+        source = 0
+        # No other component can be larger once the largest one found holds
+        # as many states as remain
+        while remaining > bestSize:
+            source += int(np.argmin(labelled[source:]))
+            frontier = np.array([source])
+            labelled[source] = True
+            size = 1
+            while frontier.size:
+                neighbors = self.successors[frontier].ravel()
+                neighbors = neighbors[neighbors >= 0]
+                frontier = np.unique(neighbors[~labelled[neighbors]])
+                labelled[frontier] = True
+                size += frontier.size
+            remaining -= size
+            if size > bestSize:
+                best, bestSize = source, size
+        return best
+
+    def breadthFirstSearch(self, source, dtype):
+        """
+        The number of rolls from a state to every state.
+        :param source: state id
+        :param dtype: array type of the distances
+        :return: array indexed by state id
+        """
+        distances = np.full(len(self.successors), self.unreachable, dtype=dtype)
+        distances[source] = 0
+        frontier = np.array([source])
+        level = 0
+        while frontier.size:
+            level += 1
+            neighbors = self.successors[frontier].ravel()
+            neighbors = neighbors[neighbors >= 0]
+            neighbors = np.unique(neighbors[distances[neighbors] == self.unreachable])
+            distances[neighbors] = level
+            frontier = neighbors
+        return distances
+
+    def getGoalDistances(self, goalPos):
+        """
+        The distances of the goal states, i.e. the goal position with 1 on
+        top, to the landmarks. They are computed once per goal position.
+        :param goalPos: tuple ( x-coordinate, y-coordinate ) of the goal
+        :return: ( landmarks, 4 ) array
+        """
+        if goalPos not in self.goals:
+            x, y = goalPos
+            cell = (x * self.height + y) * NUM_ORIENTATIONS
+            states = [cell + orientation for orientation in range(NUM_ORIENTATIONS)
+                      if TOPS[orientation] == 1]
+            self.goals[goalPos] = self.distances[:, states].astype(np.int64)
+        return self.goals[goalPos]
+
+    def getDistance(self, stateId, goalPos):
+        """
+        The lower bound on the number of rolls from a state to the goal, the
+        largest triangle inequality bound over the landmarks for the nearest
+        goal orientation. A state and a goal that are not connected to the
+        same landmarks get a bound larger than any path, which is admissible
+        as there is no path between them.
+        :param stateId: state id of the current state
+        :param goalPos: tuple ( x-coordinate, y-coordinate ) of the goal
+        :return: admissible and consistent estimate
+        """
+        if not self.landmarks:
+            return 0
+        goal = self.getGoalDistances(goalPos)
+        state = self.distances[:, stateId, None].astype(np.int64)
+        return int(np.abs(goal - state).max(axis=0).min())
+
+    def getDistances(self, stateIds, goalPos):
+        """
+        The lower bounds of getDistance for many states at once.
+        :param stateIds: NumPy array of state ids
+        :param goalPos: tuple ( x-coordinate, y-coordinate ) of the goal
+        :return: NumPy array of int64
+        """
+        if not self.landmarks:
+            return np.zeros(len(stateIds), dtype=np.int64)
+        goal = self.getGoalDistances(goalPos)
+        states = self.distances[:, stateIds].astype(np.int64)
+        bounds = None
+        # One goal orientation at a time keeps the temporary arrays to the
+        # size of the distances of the states
+        for column in range(goal.shape[1]):
+            bound = np.abs(goal[:, column, None] - states).max(axis=0)
+            bounds = bound if bounds is None else np.minimum(bounds, bound)
+        return bounds
+
+    def getLandmarkStates(self):
+        """
+        The landmarks as tuples ( x-coordinate, y-coordinate, orientation
+        index ).
+        :return: list of landmark states
+        """
+        return [((landmark // NUM_ORIENTATIONS) // self.height,
+                 (landmark // NUM_ORIENTATIONS) % self.height,
+                 landmark % NUM_ORIENTATIONS) for landmark in self.landmarks]
@@ -0,0 +1,428 @@
+"""
+File: maze.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy ( axk8776@rit.edu )
+        Deepak Sharma ( ds5930@rit.edu )
+        Karan Jariwala( kkj1811@rit.edu )
+Description: Representation of the maze configuration and
+             methods to operate on it
+"""
+
+import copy
+
+from .orientation import ALL_ORIENTATIONS, ORIENTATION_BITS, ORIENTATION_INDEX, \
+    ORIENTATIONS, ROLL_LIST, TOP_MASKS, topMask
+
+__author__ = "Deepak Sharma, Karan Jariwala, Aravindh Kuppusamy"
+
+# Start of the lines of a maze file constraining the faces on top at a
+# location, e.g. "@ 3,2 allow 1 2", "@ 3,2 forbid 5" or "@ 3,2 mask 0xff00ff"
+CONSTRAINT_PREFIX = '@'
+
+# Orientations allowed on every location: never 6 on top
+OPEN_MASK = ALL_ORIENTATIONS & ~TOP_MASKS[6]
+
+# Orientations allowed on the goal location: 1 on top
+GOAL_MASK = TOP_MASKS[1]
+
+class Maze:
+    """
+    The class Maze represents the maze configuration. The maze is
+    represented as a 2-D matrix. It includes starting position and goal
+    position as tuple (x-coordinate, y-coordinate), and width and height of
+    the maze. A maze is never modified once loaded, apart from the caches of
+    its contraction, landmarks, state graph and waypoint leg costs, so any
+    number of searches can share it; the state of a search lives in its
+    Problem.
+    Every location holds a mask of the orientations the dice may have on it,
+    a 24-bit integer with the bit of the orientation index set when allowed.
+    The obstacles allow none, the other locations all but those with 6 on
+    top, the goal location only those with 1 on top, and the constraint
+    lines of the maze file narrow them further.
+    """
+    def __init__(self, layoutText):
+        """
+        The parameterized constructor which initializes the maze
+        configuration
+        :param layoutText: The 2-D array of the maze, followed by any
+                           constraint lines starting with '@'
+        """
+        rows = [line for line in layoutText if not line.startswith(CONSTRAINT_PREFIX)]
+        self.width = len(rows[0])
+        self.height = len(rows)
+        self.obstacles = [[False for y in range(self.height)] for x in range(self.width)]
+        self.mazeOrientation = [[None for y in range(self.height)] for x in range(self.width)]
+        self.startingPos = (None, None)
+        self.goalPos = (None, None)
+        self.processLayout(rows)
+        # ( x-coordinate, y-coordinate ) -> mask of the constraint lines
+        self.constraints = {}
+        for line in layoutText:
+            if line.startswith(CONSTRAINT_PREFIX):
+                self.processConstraint(line)
+        self.goalMask = GOAL_MASK
+        # x-coordinate -> y-coordinate -> mask of the allowed orientations
+        self.masks = [[self.getBaseMask(x, y) for y in range(self.height)]
+                      for x in range(self.width)]
+        if self.goalPos != (None, None):
+            x, y = self.goalPos
+            self.masks[x][y] &= self.goalMask
+        self.contraction = None
+        self.landmarks = {}
+        # The compiled StateGraph, in a list shared with the mazes of
+        # withEndpoints so that it is compiled once for all of them
+        self.stateGraph = [None]
+        # ( x-coordinate, y-coordinate, orientation index ) -> dictionary
+        # ( x-coordinate, y-coordinate ) -> dictionary orientation index ->
+        # number of rolls, filled by the WaypointPlanner
+        self.legCosts = {}
+
+    def __getstate__(self):
+        """
+        The maze sent to another process, without the caches which the other
+        process can rebuild.
+        :return: dictionary of the attributes
+        """
+        state = dict(self.__dict__)
+        state['contraction'] = None
+        state['landmarks'] = {}
+        state['stateGraph'] = [None]
+        state['legCosts'] = {}
+        return state
+
+    def processLayout(self, layoutText):
+        """
+        Processing each character in the 2-D array and append that to the
+        maze orientation where top left location is (0,0).
+        :param layoutText: The 2-D array of the maze
+        :return: None
+        """
+        maxY = self.height - 1
+        for y in range(self.height):
+            for x in range(self.width):
+                layoutChar = layoutText[maxY - y][x]
+                self.mazeOrientation[x][y] = layoutChar
+                self.processLayoutChar(x, y, layoutChar)
+
+    def processLayoutChar(self, x, y, layoutChar):
+        """
+        Process each character where obstacles represent as boolean True and
+        store the starting position and goal location based on the maze
+        configuration
+        :param x: x-coordinate of maze
+        :param y: y-coordinate of maze
+        :param layoutChar: The 2-D array of the maze
+        :return: None
+        """
+        if layoutChar == '*':
+            self.obstacles[x][y] = True
+        elif layoutChar == 'S':
+            self.startingPos = (x, y)
+        elif layoutChar == 'G':
+            self.goalPos = (x, y)
+
+    def processConstraint(self, line):
+        """
+        Process a constraint line of the maze file, "@ x,y rule values" where
+        ( x, y ) is the location ( 0,0 being bottom left ) and the rule one of
+        "allow" followed by the faces allowed on top, "forbid" followed by the
+        faces not allowed on top, both with at least one face from 1 to 6, or
+        "mask" followed by a mask of the allowed orientation indexes. The
+        rules of a location add up.
+        :param line: The constraint line
+        :return: None
+        """
+        try:
+            cell, rule, *values = line[len(CONSTRAINT_PREFIX):].split()
+            x, y = (int(coordinate) for coordinate in cell.split(','))
+            if not self.isPosInMaze((x, y)):
+                raise ValueError
+            if rule in ('allow', 'forbid'):
+                faces = [int(value) for value in values]
+                if not faces or any(not 1 <= face <= 6 for face in faces):
+                    raise ValueError
+                mask = topMask(faces)
+                if rule == 'forbid':
+                    mask = ALL_ORIENTATIONS & ~mask
+            elif rule == 'mask' and len(values) == 1:
+                mask = int(values[0], 0) & ALL_ORIENTATIONS
+            else:
+                raise ValueError
+        except ValueError:
+            raise ValueError("invalid constraint line '%s'" % line)
+        self.constraints[(x, y)] = self.constraints.get((x, y), ALL_ORIENTATIONS) & mask
+
+    def getBaseMask(self, x, y):
+        """
+        The mask of the orientations allowed on a location without the goal
+        rule: none on an obstacle, otherwise those without 6 on top that the
+        constraint lines allow.
+        :param x: x-coordinate
+        :param y: y-coordinate
+        :return: mask of orientations
+        """
+        if self.obstacles[x][y]:
+            return 0
+        return OPEN_MASK & self.constraints.get((x, y), ALL_ORIENTATIONS)
+
+    def isObstacle(self, pos):
+        """
+        This method will check whether there is an obstacles or not at the
+        provided position
+        :param pos: Tuple ( x-coordinate, y-coordinate )
+        :return: True if an obstacles else otherwise
+        """
+        if self.isPosInMaze(pos):
+            x, y = pos
+            return self.obstacles[x][y]
+
+    def isPosInMaze(self, pos):
+        """
+        The method will check whether the coordinates provided is a valid
+        coordinate in the maze
+        :param pos: Tuple ( x-coordinate, y-coordinate )
+        :return: True if it is a valid position else otherwise
+        """
+        x, y = pos
+        return 0 <= x <= self.width - 1 and 0 <= y <= self.height - 1
+
+    def getValidNeighbors(self, x, y, dice):
+        """
+        This method will return the list of valid neighbors from the current
+        node which excludes the obstacles neighbors
+        :param x: current object x-coordinate
+        :param y: current object y-coordinate
+        :param dice: current dice configuration
+        :return: List of valid neighbors
+        """
+        neighbors = list()
+        if self.isPosInMaze((x - 1, y)) and not self.obstacles[x - 1][y]:
+            dice.moveLeft()
+            top = dice.top
+            right = dice.right
+            north = dice.north
+            dice.moveRight()
+            neighbors.append((x - 1, y, top, right, north))
+
+        if self.isPosInMaze((x + 1, y)) and not self.obstacles[x + 1][y]:
+            dice.moveRight()
+            top = dice.top
+            right = dice.right
+            north = dice.north
+            dice.moveLeft()
+            neighbors.append((x + 1, y, top, right, north))
+
+        if self.isPosInMaze((x, y - 1)) and not self.obstacles[x][y - 1]:
+            dice.moveSouth()
+            top = dice.top
+            right = dice.right
+            north = dice.north
+            dice.moveNorth()
+            neighbors.append((x, y - 1, top, right, north))
+
+        if self.isPosInMaze((x, y + 1)) and not self.obstacles[x][y + 1]:
+            dice.moveNorth()
+            top = dice.top
+            right = dice.right
+            north = dice.north
+            dice.moveSouth()
+            neighbors.append((x, y + 1, top, right, north))
+
+        return neighbors
+
+    def getLegalNeighbors(self, x, y, dice):
+        """
+        This method will return the neighbors the dice may legally roll to
+        from the current node, those whose mask allows the orientation the
+        dice rolls into. It excludes the obstacles, the neighbors with 6 on
+        top, the goal location reached without 1 on top and the orientations
+        the constraint lines forbid.
+        :param x: current object x-coordinate
+        :param y: current object y-coordinate
+        :param dice: current dice configuration
+        :return: List of legal neighbors as tuples ( x-coordinate,
+                 y-coordinate, dice top, dice right, dice north )
+        """
+        orientation = ORIENTATION_INDEX[(dice.top, dice.right, dice.north)]
+        masks = self.masks
+        neighbors = list()
+        for dx, dy, roll in ROLL_LIST:
+            nextX = x + dx
+            nextY = y + dy
+            if 0 <= nextX < self.width and 0 <= nextY < self.height:
+                nextOrientation = roll[orientation]
+                if masks[nextX][nextY] & ORIENTATION_BITS[nextOrientation]:
+                    neighbors.append((nextX, nextY) + ORIENTATIONS[nextOrientation])
+        return neighbors
+
+    def isLegalState(self, x, y, orientation):
+        """
+        It checks whether the dice may stand on a location in an orientation,
+        applying the same rules as getLegalNeighbors.
+        :param x: x-coordinate
+        :param y: y-coordinate
+        :param orientation: orientation index of the dice
+        :return: True if legal else False
+        """
+        return 0 <= x < self.width and 0 <= y < self.height and \
+            self.masks[x][y] & ORIENTATION_BITS[orientation] != 0
+
+    def getMask(self, x, y):
+        """
+        The mask of the orientations the dice may have on a location.
+        :param x: x-coordinate
+        :param y: y-coordinate
+        :return: mask of orientations
+        """
+        return self.masks[x][y]
+
+    def isGoal(self, x, y, diceTop):
+        """
+        It checks whether the current node is a goal node by checking the
+        x-coordinate and y-coordinate and dice top position against the mask
+        of the goal orientations
+        :param x: current x-coordinate
+        :param y: current y-coordinate
+        :param diceTop: The dice top position
+        :return: True if it's goal else False
+        """
+        return self.goalPos == (x, y) and self.goalMask & TOP_MASKS[diceTop] != 0
+
+    def isGoalLocation(self, x, y):
+        """
+        It checks whether the current node location is a goal node location
+        :param x: current x-coordinate
+        :param y: current y-coordinate
+        :return: True if it's the goal location else False
+        """
+        return self.goalPos == (x, y)
+
+    def getContraction(self):
+        """
+        The contracted graph of the maze, with dead ends pruned and corridors
+        collapsed. It is computed on the first call and cached afterwards.
+        :return: MazeContraction of this maze
+        """
+        if self.contraction is None:
+            from .contraction import MazeContraction
+            # Concurrent searches may both build it, they build the same one
+            self.contraction = MazeContraction(self)
+        return self.contraction
+
+    def getLandmarks(self, count=None):
+        """
+        The landmark distance table of the maze. It only depends on the
+        obstacles and the constraint lines, so it is computed on the first call for a number of
+        landmarks and shared by the mazes returned by withEndpoints.
+        :param count: Number of landmarks, None for the default
+        :return: LandmarkTable of this maze
+        """
+        from .landmarks import DEFAULT_LANDMARKS, LandmarkTable
+        if count is None:
+            count = DEFAULT_LANDMARKS
+        if count not in self.landmarks:
+            # Concurrent searches may both build it, the first one is kept
+            self.landmarks.setdefault(count, LandmarkTable(self, count))
+        return self.landmarks[count]
+
+    def getStateGraph(self):
+        """
+        The legal states of the maze and the rolls between them compiled into
+        a StateGraph. Like the landmarks it leaves out the goal rule, so it is
+        compiled on the first call and shared by the mazes returned by
+        withEndpoints.
+        :return: StateGraph of this maze
+        """
+        if self.stateGraph[0] is None:
+            from .stateGraph import StateGraph
+            # Concurrent searches may both compile it, they compile the same one
+            self.stateGraph[0] = StateGraph(self)
+        return self.stateGraph[0]
+
+    def withEndpoints(self, startPos, goalPos):
+        """
+        The same maze with another starting and goal position, for the
+        queries between arbitrary cells. The grid, the landmark tables and the
+        state graph are shared with this maze, only the columns of masks
+        holding the goal locations are copied.
+        :param startPos: tuple ( x-coordinate, y-coordinate ) of the start
+        :param goalPos: tuple ( x-coordinate, y-coordinate ) of the goal
+        :return: Maze
+        """
+        aMaze = copy.copy(self)
+        # copy goes through __getstate__, which leaves out the caches
+        aMaze.landmarks = self.landmarks
+        aMaze.stateGraph = self.stateGraph
+        aMaze.startingPos = startPos
+        aMaze.goalPos = goalPos
+        aMaze.masks = list(self.masks)
+        goals = [pos for pos in (self.goalPos, goalPos) if pos != (None, None)]
+        for x in {pos[0] for pos in goals}:
+            aMaze.masks[x] = list(self.masks[x])
+        if self.goalPos != (None, None):
+            x, y = self.goalPos
+            aMaze.masks[x][y] = self.getBaseMask(x, y)
+        if goalPos != (None, None):
+            x, y = goalPos
+            aMaze.masks[x][y] = self.getBaseMask(x, y) & self.goalMask
+        aMaze.contraction = None
+        aMaze.legCosts = {}
+        return aMaze
+
+    def getStartPos(self):
+        """
+        A getter method to get the starting position
+        :return: starting position as tuple ( x-coordinate, y-coordinate )
+        """
+        return self.startingPos
+
+    def getGoalPos(self):
+        """
+        A getter method to get the goal position
+        :return: goal position as tuple ( x-coordinate, y-coordinate )
+        """
+        return self.goalPos
+
+    def printMaze(self, marks=None):
+        """
+        It prints the maze configuration.
+        :param marks: dictionary ( x-coordinate, y-coordinate ) -> symbol
+                      printed in place of the maze character, e.g. to track
+                      the path
+        :return: None
+        """
+        for i in range(self.height - 1, -1, -1):
+            for j in range(self.width):
+                print(self.getSymbol(j, i, marks), end=" ")
+            print()
+
+    def getSymbol(self, x, y, marks=None):
+        """
+        The character printed for a location, the starting and goal positions
+        being shown where they are even for the mazes of withEndpoints.
+        :param x: x-coordinate
+        :param y: y-coordinate
+        :param marks: dictionary ( x-coordinate, y-coordinate ) -> symbol
+        :return: a character
+        """
+        if marks is not None and (x, y) in marks:
+            return marks[(x, y)]
+        if (x, y) == self.startingPos:
+            return 'S'
+        if (x, y) == self.goalPos:
+            return 'G'
+        symbol = self.mazeOrientation[x][y]
+        return '.' if symbol in ('S', 'G') else symbol
+
+
+def loadMaze(fileName):
+    """
+    It reads the maze text file and return the 2-D array
+    :param fileName: A maze text file
+    :return: A 2-D array
+    """
+    layout = open(fileName)
+    try:
+        return [line.strip() for line in layout]
+    finally:
+        layout.close()
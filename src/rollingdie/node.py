@@ -8,7 +8,7 @@ Description: Representation of the state configuration and methods
              to operate on it.
 """
 
-from dice import Dice
+from .dice import Dice
 
 __author__ = "Karan Jariwala, Aravindh Kuppusamy, Deepak Sharma"
 
@@ -19,7 +19,8 @@ class Node:
     x-coordinate, y-coordinate, g cost, f cost, parent reference,
     current dice configuration, and maze configuration
     """
-    __slots__ = ('maze', 'dice', '__name', '__gCost', '__fCost', '__x', '__y', 'parent')
+    __slots__ = ('maze', 'dice', '__name', '__gCost', '__fCost', '__x', '__y', 'parent', 'sortKey',
+                 'stateId')
 
     def __init__(self, maze, dice, name, gCost, fCost, x, y, parent):
         """
@@ -41,6 +42,10 @@ class Node:
         self.parent = parent
         self.maze = maze
         self.dice = dice
+        # Ordering key in the fringe, maintained by the PriorityQueue
+        self.sortKey = None
+        # State id of the node, computed on first use by the TraceRecorder
+        self.stateId = None
 
     def getName(self):
         """
@@ -146,30 +151,33 @@ class Node:
         """
         self.__gCost = cost
 
-    def getSuccessorState(self):
+    def getSuccessorState(self, nodeMap):
         """
         This method returns the list of valid neighbors. Below are the steps
         it performed:
         1. Extracts the current node neighbors which excludes the obstacles
-           neighbors
+           neighbors, the neighbors with dice top position 6 and the goal
+           location with a dice top position other than 1, as given by the
+           masks of allowed orientations of the maze
         2. If the neighbor is already in the dictionary, then return the
            reference node point instead of creating a new node.
         3. Otherwise, create a new node with the current configurations and
-           add it to the list of neighbors if current dice top position is
-           not 6.
+           add it to the list of neighbors.
+        :param nodeMap: The nodes of the search, keyed by ( x-coordinate,
+                        y-coordinate, dice top, dice right, dice north )
         :return: List of valid neighbors which excludes obstacles and current
         dice top position 6.
         """
         successors = list()
-        neighbors = self.maze.getValidNeighbors(self.__x, self.__y, self.dice)
+        neighbors = self.maze.getLegalNeighbors(self.__x, self.__y, self.dice)
 
         for neighbor in neighbors:
-            if neighbor in self.maze.nodeMap.keys():
-                if self.maze.nodeMap[neighbor].getName() == 'G':
-                    goal_parent = self.maze.nodeMap[neighbor].getParent()
+            if neighbor in nodeMap.keys():
+                if nodeMap[neighbor].getName() == 'G':
+                    goal_parent = nodeMap[neighbor].getParent()
                     if goal_parent is None:
-                        self.maze.nodeMap[neighbor].setParent(self)
-                successors.append(self.maze.nodeMap[neighbor])
+                        nodeMap[neighbor].setParent(self)
+                successors.append(nodeMap[neighbor])
             else:
                 x, y = neighbor[0], neighbor[1]
                 neighborDice = Dice(neighbor[2], neighbor[3], neighbor[4])
@@ -178,13 +186,8 @@ class Node:
                 elif self.maze.getStartPos == (x, y):
                     name = 'S'
                 else: name = '.'
-                if neighborDice.top != 6:
-                    # Avoiding the goal location with wrong configuration
-                    if self.maze.isGoalLocation(x, y) and \
-                            not self.maze.isGoal(x, y, neighborDice.top):
-                        continue
-                    aNode = Node(self.maze, neighborDice, name, None, None, x, y, self)
-                    self.maze.nodeMap[neighbor] = aNode
-                    successors.append(aNode)
+                aNode = Node(self.maze, neighborDice, name, None, None, x, y, self)
+                nodeMap[neighbor] = aNode
+                successors.append(aNode)
 
         return successors
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+File: orientation.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Numbering of the 24 orientations of a dice and the tables to
+             roll them, so that orientations can be used as array indexes.
+"""
+
+from .dice import Dice, MOVES
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+
+def _enumerateOrientations():
+    """
+    Enumerates the orientations reachable by rolling the starting dice.
+    :return: list of tuples ( top, right, north ), the starting orientation
+             first
+    """
+    start = Dice()
+    orientations = [(start.top, start.right, start.north)]
+    seen = set(orientations)
+    for top, right, north in orientations:
+        for moveName in MOVES.values():
+            aDice = Dice(top, right, north)
+            aDice.move(moveName)
+            orientation = (aDice.top, aDice.right, aDice.north)
+            if orientation not in seen:
+                seen.add(orientation)
+                orientations.append(orientation)
+    return orientations
+
+
+# All the orientations as tuples ( top, right, north ), index 0 being the
+# starting orientation ( 1, 3, 2 )
+ORIENTATIONS = _enumerateOrientations()
+
+NUM_ORIENTATIONS = len(ORIENTATIONS)
+
+# ( top, right, north ) -> orientation index
+ORIENTATION_INDEX = {orientation: index for index, orientation in enumerate(ORIENTATIONS)}
+
+
+def _facesIndex():
+    """
+    The orientation indexes by top and right face, which decide the north
+    face. A list lookup needs no tuple, for the hot paths.
+    :return: list indexed by top * 7 + right, None for impossible pairs
+    """
+    table = [None] * 49
+    for index, (top, right, north) in enumerate(ORIENTATIONS):
+        table[top * 7 + right] = index
+    return table
+
+
+# top * 7 + right -> orientation index
+FACES_INDEX = _facesIndex()
+
+# orientation index -> dice top
+TOPS = [orientation[0] for orientation in ORIENTATIONS]
+
+# orientation index -> bit of the orientation in a mask of orientations, a
+# 24-bit integer with a bit set for every orientation allowed
+ORIENTATION_BITS = [1 << index for index in range(NUM_ORIENTATIONS)]
+
+# Mask allowing every orientation
+ALL_ORIENTATIONS = (1 << NUM_ORIENTATIONS) - 1
+
+
+def topMask(tops):
+    """
+    The mask of the orientations showing one of the given faces on top.
+    :param tops: iterable of dice faces
+    :return: mask of orientations
+    """
+    tops = set(tops)
+    mask = 0
+    for index, top in enumerate(TOPS):
+        if top in tops:
+            mask |= ORIENTATION_BITS[index]
+    return mask
+
+
+# dice top -> mask of the orientations with that face on top
+TOP_MASKS = {top: topMask([top]) for top in range(1, 7)}
+
+
+def _rollTable(moveName):
+    """
+    The orientation reached by a move from every orientation.
+    :param moveName: dice move name
+    :return: list indexed by orientation index
+    """
+    table = list()
+    for top, right, north in ORIENTATIONS:
+        aDice = Dice(top, right, north)
+        aDice.move(moveName)
+        table.append(ORIENTATION_INDEX[(aDice.top, aDice.right, aDice.north)])
+    return table
+
+
+# ( dx, dy ) of a roll -> list mapping orientation index to the orientation
+# index after the roll
+ROLLS = {delta: _rollTable(moveName) for delta, moveName in MOVES.items()}
+
+# The rolls as tuples ( dx, dy, roll table ), in the order of MOVES
+ROLL_LIST = [(dx, dy, ROLLS[(dx, dy)]) for dx, dy in MOVES]
+
+
+def getIndex(dice):
+    """
+    The orientation index of a dice.
+    :param dice: dice configuration
+    :return: orientation index
+    """
+    return FACES_INDEX[dice.top * 7 + dice.right]
+
+
+def getStateId(node, height):
+    """
+    The integer identifying the state of a node in a maze, ( x-coordinate *
+    height + y-coordinate ) * 24 + orientation index. The ids of a maze are
+    0 to width * height * 24 - 1.
+    :param node: A node object
+    :param height: height of the maze
+    :return: state id
+    """
+    dice = node.dice
+    return (node.getxCoordinate() * height + node.getyCoordinate()) * \
+        NUM_ORIENTATIONS + FACES_INDEX[dice.top * 7 + dice.right]
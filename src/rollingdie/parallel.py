@@ -0,0 +1,67 @@
+"""
+File: parallel.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Concurrent searches for many start and goal queries on one
+             loaded maze. The maze is shared by all the searches, every
+             search keeping its state in its own Problem.
+"""
+
+from .fringeSearch import FringeList, fringeSearch
+from .priorityQueue import PriorityQueue
+from .search import Problem, aStarSearch
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+
+def solveQuery(maze, startPos, goalPos, heuristicName='manhattan', engine='astar'):
+    """
+    Searches the path between two positions of a maze.
+    :param maze: The maze, only read by the search
+    :param startPos: tuple ( x-coordinate, y-coordinate ) of the start, None
+                     for the starting position of the maze
+    :param goalPos: tuple ( x-coordinate, y-coordinate ) of the goal, None
+                    for the goal position of the maze
+    :param heuristicName: Name of a Heuristic method or a heuristic function,
+                          cached per search
+    :param engine: 'astar' for the A* search on a priority queue, 'fringe' for
+                   the Fringe Search on a linked list, 'graph' for the A*
+                   search on the state graph compiled once for the maze
+    :return: list of the nodes on the path, empty if there is no path
+    """
+    if startPos is not None or goalPos is not None:
+        maze = maze.withEndpoints(startPos or maze.getStartPos(), goalPos or maze.getGoalPos())
+    aProblem = Problem(maze)
+    if engine == 'fringe':
+        goal = fringeSearch(aProblem, heuristicName, FringeList(), set())
+    elif engine == 'graph':
+        from .stateGraph import GraphFringe, graphSearch
+        goal = graphSearch(aProblem, heuristicName, GraphFringe(), set())
+    else:
+        goal = aStarSearch(aProblem, heuristicName, PriorityQueue(), set())
+    return aProblem.getPath(goal)
+
+
+def solveAll(maze, queries, heuristicName='manhattan', workers=None, engine='astar'):
+    """
+    Searches the paths of many queries at once from a thread pool. On builds
+    of Python with a global interpreter lock the searches take turns, on
+    free-threaded builds they run in parallel.
+    :param maze: The maze shared by all the searches
+    :param queries: iterable of tuples ( start position, goal position )
+    :param heuristicName: Name of a Heuristic method or a heuristic function,
+                          cached per search
+    :param workers: Number of threads, None for the ThreadPoolExecutor
+                    default
+    :param engine: 'astar', 'fringe' or 'graph'
+    :return: list of the paths, in the order of the queries
+    """
+    # Imported here so that importing the package does not start up threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(solveQuery, maze, startPos, goalPos, heuristicName, engine)
+                   for startPos, goalPos in queries]
+        return [future.result() for future in futures]
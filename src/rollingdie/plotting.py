@@ -0,0 +1,48 @@
+"""
+File: plotting.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Optional plotting of the search performance. numpy and
+             matplotlib are only imported when a plot is actually drawn, so
+             the solver itself starts without them.
+"""
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+
+def plots(results):
+    """
+    Plot the graph with y-axis as number of nodes generated and visited vs
+    x-axis as type of heuristics
+    :param results: a list which contains heuristic name, number of moves
+                    it took, number of node generated and visited
+    :return: True if the graph was drawn, False if numpy or matplotlib is
+             not installed
+    """
+    try:
+        import numpy as np
+        import matplotlib.pyplot as plot
+    except ImportError:
+        print("numpy and matplotlib are required for plotting, skipping the graph")
+        return False
+
+    bars = len(results)
+    heuristic = [results[counter][0] for counter in range(len(results))]
+    nodesPutOnQueue = [results[counter][2] for counter in range(len(results))]
+    visitedNodes = [results[counter][3] for counter in range(len(results))]
+
+    plot.subplots()
+    index = np.arange(bars)
+    bars_width = 0.25
+    opacity = 1
+    plot.bar(index, nodesPutOnQueue, bars_width, alpha=opacity, color='g', label = 'Nodes Generated')
+    plot.bar(index + bars_width, visitedNodes, bars_width, alpha=opacity, color='y', label='Nodes Visited')
+    plot.xlabel('Heuristic')
+    plot.ylabel('Number of Nodes')
+    plot.title('Heuristic Performance')
+    plot.xticks(index + bars_width, heuristic )
+    plot.legend( loc="upper left" )
+    plot.show()
+    return True
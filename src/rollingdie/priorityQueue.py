@@ -0,0 +1,256 @@
+"""
+File: priorityQueue.py
+Language: Python 3.5.1
+Author: Deepak Sharma ( ds5930@rit.edu )
+        Karan Jariwala( kkj1811@rit.edu )
+        Aravindh Kupusamy ( axk8776@rit.edu )
+
+Description: The priorityQueue.py file represents the priority queue as a list
+             and methods to operate on it
+"""
+
+__author__ = "Deepak Sharma, Karan Jariwala, Aravindh Kuppusamy"
+
+
+class TieBreaking:
+    """
+    The class TieBreaking contains the policies used to order nodes that have
+    the same F cost in the fringe. Every policy returns the complete sort key
+    of a node, a tuple starting with its F cost, which is stored on the node
+    when it is put on the queue so comparisons in the heap stay plain tuple
+    comparisons.
+    """
+
+    @staticmethod
+    def none(node, counter):
+        """
+        Ties are broken by the position in the heap.
+        :param node: A node object
+        :param counter: Number of nodes put on the queue so far
+        :return: sort key
+        """
+        return (node.getFCost(),)
+
+    @staticmethod
+    def highG(node, counter):
+        """
+        Prefer the node deeper in the search, i.e. with the higher G cost.
+        :param node: A node object
+        :param counter: Number of nodes put on the queue so far
+        :return: sort key
+        """
+        return node.getFCost(), -node.getGCost()
+
+    @staticmethod
+    def lowH(node, counter):
+        """
+        Prefer the node with the lower heuristic distance.
+        :param node: A node object
+        :param counter: Number of nodes put on the queue so far
+        :return: sort key
+        """
+        return node.getFCost(), node.getFCost() - node.getGCost()
+
+    @staticmethod
+    def lifo(node, counter):
+        """
+        Prefer the node put on the queue last.
+        :param node: A node object
+        :param counter: Number of nodes put on the queue so far
+        :return: sort key
+        """
+        return node.getFCost(), -counter
+
+    @staticmethod
+    def fifo(node, counter):
+        """
+        Prefer the node put on the queue first.
+        :param node: A node object
+        :param counter: Number of nodes put on the queue so far
+        :return: sort key
+        """
+        return node.getFCost(), counter
+
+    @staticmethod
+    def goalOrientation(node, counter):
+        """
+        Prefer the node with the lower heuristic distance and, among those,
+        the dice which needs the fewest rolls to bring 1 on top.
+        :param node: A node object
+        :param counter: Number of nodes put on the queue so far
+        :return: sort key
+        """
+        top = node.dice.top
+        rolls = 0 if top == 1 else 2 if top == 6 else 1
+        return node.getFCost(), node.getFCost() - node.getGCost(), rolls
+
+    @staticmethod
+    def names():
+        """
+        The names of all the tie-breaking policies.
+        :return: list of policy names
+        """
+        return ['none', 'highG', 'lowH', 'lifo', 'fifo', 'goalOrientation']
+
+
+class PriorityQueue:
+    """
+    This class represents a priority queue as a list. Nodes are ordered by
+    the sort key computed by the tie-breaking policy when they are inserted
+    or updated.
+    """
+    __slots__ = 'queue', 'nodesPutOnQueue', 'nodesTakenOff', 'tieBreaking', 'counter'
+
+    def __init__(self, tieBreaking='none'):
+        """
+        A constructor which initializes the queue, number of nodes added into
+        the queue, number of nodes remove from the queue and the tie-breaking
+        policy.
+        :param tieBreaking: Name of a TieBreaking policy or a function taking
+                            ( node, counter ) and returning its sort key
+        """
+        self.queue = list()
+        self.nodesPutOnQueue = 0
+        self.nodesTakenOff = 0
+        self.counter = 0
+        if not callable(tieBreaking):
+            tieBreaking = getattr(TieBreaking, tieBreaking)
+        self.tieBreaking = tieBreaking
+
+    def insert(self, node):
+        """
+        It will insert a node in a queue at the end location and call the
+        heapify method to bubbleUp the value in the queue.
+        :param node: A node object
+        :return:
+        """
+        self.counter += 1
+        node.sortKey = self.tieBreaking(node, self.counter)
+        self.queue.append(node)
+        self.nodesPutOnQueue += 1
+        self.__heapify(len(self.queue) - 1)
+
+    def replace(self, node, location):
+        """
+        It will replace the old node with the current node object at the
+        location provided and calls the heapify method to bubbleUp the value
+        in the queue.
+        :param node: A node object
+        :param location: The location for which to swap the node object
+        :return: None
+        """
+        self.queue.insert(node, location)
+        self.__heapify(location - 1)
+
+    def pop(self):
+        """
+        Remove the zero index location node from the queue, insert the last
+        index location node to the zero index location and calls the
+        bubbleDown method to rearrange the node in ascending order
+        :return: Zero index location node which we removed first
+        """
+        if len(self.queue) > 0:
+            node = self.queue[0]
+            last = self.queue.pop()
+            self.nodesTakenOff += 1
+            if len(self.queue) > 0:
+                self.queue[0] = last
+                self.__bubble_down(0)
+            return node
+
+    def __heapify(self, loc):
+        """
+        It compares the value from that location to up the tree or till front
+        of the tree unless a property is satisfy which says the parent node F
+        cost value should be less than the child node F cost value, ties
+        being broken by the rest of the sort key
+        :param loc: location from which heapify operation perform
+        :return: None
+        """
+        while loc > 0:
+            parent_loc = self.getParent(loc)
+            if self.queue[loc].sortKey < self.queue[parent_loc].sortKey:
+                self.queue[loc], self.queue[parent_loc] = self.queue[parent_loc], self.queue[loc]
+                loc = parent_loc
+            else:
+                break
+
+    def __bubble_down(self, loc):
+        """
+        It compares the value from that location down the tree or queue unless
+        a property is satisfy which says the parent node F cost value should
+        be less than the child node F cost value
+        :param loc: location from which bubble down operation perform
+        :return: None
+        """
+        while 2 * loc + 1 <= len(self.queue) - 1:
+            swap_loc = self.__get_min_neighbour(loc)
+            if swap_loc == loc:
+                break
+            else:
+                self.queue[loc], self.queue[swap_loc] = self.queue[swap_loc], self.queue[loc]
+                loc = swap_loc
+
+    def __get_min_neighbour(self, loc):
+        """
+        It returns the location of the child which is having minimum sort key
+        if it founds one.
+        :param loc: Location of parent in a queue
+        :return: minimum sort key location of a node
+        """
+        parentKey = self.queue[loc].sortKey
+        child1Key = self.queue[2 * loc + 1].sortKey
+        if len(self.queue) - 1 < 2 * loc + 2:
+            min_val = min(parentKey, child1Key)
+            if parentKey == min_val:
+                return loc
+            elif child1Key == min_val:
+                return 2 * loc + 1
+
+        else:
+            child2Key = self.queue[2 * loc + 2].sortKey
+            min_val = min(parentKey, child1Key, child2Key)
+            if parentKey == min_val:
+                return loc
+            elif child1Key == min_val:
+                return 2 * loc + 1
+            else:
+                return 2 * loc + 2
+
+    def find(self, node):
+        """
+        It finds the location of the node inside the queue
+        :param node: A node object
+        :return: returns the location of the node if found else None
+        """
+        for loc in range(len(self.queue)):
+            if node is self.queue[loc]:
+                return loc
+        return None
+
+    def update(self, node):
+        """
+        It finds the location of the node inside the queue and bubbleUp
+        the value in the queue to satisfy the heap property
+        :param node: A node object
+        :return: None
+        """
+        loc = self.find(node)
+        self.counter += 1
+        node.sortKey = self.tieBreaking(node, self.counter)
+        self.__heapify(loc)
+
+    def isEmpty(self):
+        """
+        It checkts whether the queue is empty or not
+        :return: True if empty else False
+        """
+        return len(self.queue) == 0
+
+    def getParent(self, loc):
+        """
+        It returns the parent location from the queue
+        :param loc: location of child
+        :return: location of parent
+        """
+        return (loc - 1) // 2
\ No newline at end of file
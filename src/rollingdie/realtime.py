@@ -0,0 +1,209 @@
+"""
+File: realtime.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Real-time agent for the Rolling Die Maze using Learning
+             Real-Time A* (LRTA*). Instead of planning the whole path up
+             front, the agent looks a bounded number of rolls ahead, commits
+             to the next roll and learns better heuristic values for the
+             states it leaves behind.
+"""
+
+import time
+
+from .dice import Dice, MOVES
+from .node import Node
+from .heuristic import HeuristicCache
+from .orientation import NUM_ORIENTATIONS
+from .search import Problem
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+# Moves of a trial per state of the maze ( location, orientation ) before the
+# trial gives up. On a maze without solution the agent would roll forever.
+STEPS_PER_STATE = 4
+
+
+def getMaxSteps(maze):
+    """
+    The default limit of the moves of a trial on a maze.
+    :param maze: The maze
+    :return: STEPS_PER_STATE moves per state of the maze
+    """
+    return STEPS_PER_STATE * maze.width * maze.height * NUM_ORIENTATIONS
+
+
+class LRTAStar:
+    """
+    The class LRTAStar is a real-time search agent. The learned heuristic
+    values are kept in a table keyed by ( x-coordinate, y-coordinate, dice
+    top, dice right, dice north ) and survive from one trial to the next, so
+    repeated trials on the same maze converge to an optimal path. States not
+    in the table are estimated with one of the Heuristic functions.
+    """
+    __slots__ = 'maze', 'problem', 'heuristic', 'lookahead', 'timeBudget', 'table'
+
+    def __init__(self, maze, heuristicName='manhattan', lookahead=1, timeBudget=None, table=None):
+        """
+        Initializes the agent.
+        :param maze: The maze the agent rolls the dice in
+        :param heuristicName: The initial estimate, either the name of a
+               Heuristic method, a heuristic function or a HeuristicCache
+        :param lookahead: Maximum number of rolls looked ahead before a move
+        :param timeBudget: Time in seconds after which the lookahead stops
+               deepening, None to always look lookahead rolls ahead. A
+               lookahead of one roll is always completed.
+        :param table: Learned heuristic values to start from, e.g. the table
+               of another agent on the same maze
+        """
+        self.maze = maze
+        self.problem = Problem(maze)
+        self.heuristic = HeuristicCache.create(heuristicName)
+        self.lookahead = max(1, lookahead)
+        self.timeBudget = timeBudget
+        self.table = table if table is not None else {}
+
+    def getH(self, state):
+        """
+        The current heuristic estimate of a state, learned if available.
+        :param state: tuple ( x-coordinate, y-coordinate, dice top, dice right,
+                      dice north )
+        :return: heuristic estimate
+        """
+        if state in self.table:
+            return self.table[state]
+        x, y, top, right, north = state
+        if self.maze.isGoal(x, y, top):
+            return 0
+        aNode = Node(self.maze, Dice(top, right, north), '.', None, None, x, y, None)
+        return self.heuristic(aNode, self.problem)
+
+    def getSuccessors(self, state):
+        """
+        The states the dice may legally roll to from the given state.
+        :param state: tuple ( x-coordinate, y-coordinate, dice top, dice right,
+                      dice north )
+        :return: list of successor states
+        """
+        x, y, top, right, north = state
+        return self.maze.getLegalNeighbors(x, y, Dice(top, right, north))
+
+    def lookaheadValue(self, state, depth, deadline):
+        """
+        The minimum over all roll sequences of at most depth rolls from the
+        state of the rolls made plus the heuristic estimate of the last state.
+        It never drops below the estimate of the state itself, which keeps the
+        learned values from decreasing.
+        :param state: the state to evaluate
+        :param depth: number of rolls still to look ahead
+        :param deadline: time.perf_counter() value after which the search
+               gives up, None for no deadline
+        :return: the lookahead value, None if the deadline passed
+        """
+        x, y, top = state[0], state[1], state[2]
+        if depth == 0 or self.maze.isGoal(x, y, top):
+            return self.getH(state)
+        if deadline is not None and time.perf_counter() > deadline:
+            return None
+        best = float('inf')
+        for successor in self.getSuccessors(state):
+            value = self.lookaheadValue(successor, depth - 1, deadline)
+            if value is None:
+                return None
+            best = min(best, 1 + value)
+        return max(self.getH(state), best)
+
+    def selectMove(self, state):
+        """
+        Looks ahead from the state, updates its learned value and selects the
+        next roll.
+        :param state: the current state
+        :return: the successor state to roll to, None if there is none
+        """
+        successors = self.getSuccessors(state)
+        if not successors:
+            return None
+        deadline = None
+        if self.timeBudget is not None:
+            deadline = time.perf_counter() + self.timeBudget
+
+        values = [1 + self.getH(successor) for successor in successors]
+        for depth in range(2, self.lookahead + 1):
+            deeper = list()
+            for successor in successors:
+                value = self.lookaheadValue(successor, depth - 1, deadline)
+                if value is None:
+                    break
+                deeper.append(1 + value)
+            if len(deeper) < len(successors):
+                break
+            values = deeper
+
+        best = min(range(len(successors)), key=values.__getitem__)
+        self.table[state] = max(self.getH(state), values[best])
+        return successors[best]
+
+    def steps(self, maxSteps=None):
+        """
+        Rolls the dice from the start position, one move at a time.
+        :param maxSteps: Maximum number of moves, None for the getMaxSteps
+                         limit of the maze
+        :return: generator of ( move name, Node ) for every roll, the node
+                 being the state of the dice after the roll. It stops at the
+                 goal, at maxSteps or when the dice is stuck.
+        """
+        x, y = self.maze.getStartPos()
+        dice = Dice()
+        state = (x, y, dice.top, dice.right, dice.north)
+        if maxSteps is None:
+            maxSteps = getMaxSteps(self.maze)
+        steps = 0
+        while not self.maze.isGoal(state[0], state[1], state[2]):
+            if steps >= maxSteps:
+                return
+            successor = self.selectMove(state)
+            if successor is None:
+                return
+            moveName = MOVES[(successor[0] - state[0], successor[1] - state[1])]
+            state = successor
+            steps += 1
+            x, y, top, right, north = state
+            name = 'G' if self.maze.isGoal(x, y, top) else '.'
+            yield moveName, Node(self.maze, Dice(top, right, north), name, steps, None, x, y, None)
+
+    def trial(self, maxSteps=None):
+        """
+        Runs one trial from the start position.
+        :param maxSteps: Maximum number of moves, None for the getMaxSteps
+                         limit of the maze
+        :return: tuple of the list of ( move name, Node ) and whether the goal
+                 was reached
+        """
+        path = list(self.steps(maxSteps))
+        reached = len(path) > 0 and path[-1][1].getName() == 'G'
+        if not path:
+            x, y = self.maze.getStartPos()
+            reached = self.maze.isGoal(x, y, Dice().top)
+        return path, reached
+
+    def train(self, maxTrials, maxSteps=None):
+        """
+        Repeats trials until the learned values stop changing, at which point
+        the agent follows an optimal path if the initial estimate was
+        admissible.
+        :param maxTrials: Maximum number of trials
+        :param maxSteps: Maximum number of moves per trial, None for the
+                         getMaxSteps limit of the maze
+        :return: list with the number of moves of every trial, None for the
+                 trials which did not reach the goal
+        """
+        lengths = list()
+        for counter in range(maxTrials):
+            before = dict(self.table)
+            path, reached = self.trial(maxSteps)
+            lengths.append(len(path) if reached else None)
+            if reached and before == self.table:
+                break
+        return lengths
@@ -0,0 +1,199 @@
+"""
+File: search.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: The A* search algorithm for the Rolling Die Maze along with its
+             problem representation
+"""
+
+from .dice import Dice
+from .node import Node
+from .heuristic import HeuristicCache
+from .trace import PUSH, EXPAND, UPDATE, GOAL
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+
+class Problem:
+    """
+    A search problem defines the state space, start state, goal state, goal test,
+    successor function and cost function. This search problem can be used to find
+    paths to a particular point on the maze.
+    The problem is the context of one search: it owns the nodes of the search
+    in a nodeMap which contain key as ( x-coordinate, y-coordinate, dice top,
+    dice right, dice north ) and value as node object, while the maze is only
+    read. Several problems, each searched by one thread, can share a maze.
+    """
+
+    __slots__ = 'maze', 'nodeMap'
+
+    def __init__(self, maze):
+        """
+        Initializes the problem with state space as a representation of the maze.
+        :param maze: Default Maze representation.
+        """
+        self.maze = maze
+        self.nodeMap = {}
+
+    def getStartState(self):
+        """
+        Returns the start state for the search problem.
+        """
+        x, y = self.maze.getStartPos()
+        if (x, y, 1, 3, 2) not in self.nodeMap.keys():
+            aDice = Dice()
+            aNode = Node(self.maze, aDice, 'S', 0, None, x, y, None)
+            self.nodeMap[(x, y, 1, 3, 2)] = aNode
+        return self.nodeMap[(x, y, 1, 3, 2)]
+
+    def getSuccessors(self, state):
+        """
+        :param state: Search state
+
+        For a given state, this should return a Node object which has maze,
+        current position, dice orientation at that position, gCost, fCost and
+        its parent.
+        """
+        return state.getSuccessorState(self.nodeMap)
+
+    def isGoalState(self, state):
+        """
+        Returns whether the state is a goal state or not!
+        :param state: Search state
+        :return : Boolean
+        """
+        return state.getName() == 'G' and state.dice.top == 1
+
+    def getGoalState(self):
+        """
+        Returns the goal state for the search problem.
+        """
+        x, y = self.maze.getGoalPos()
+        if (x, y, 1) not in self.nodeMap.keys():
+            aDice = Dice()
+            aNode = Node(self.maze, aDice, 'G', None, None, x, y, None)
+            self.nodeMap[(x, y, 1)] = aNode
+        return self.nodeMap[(x, y, 1)]
+
+    def getStartPosition(self):
+        """
+        Returns the start position in the maze for the search problem.
+        """
+        return self.maze.getStartPos()
+
+    def getGoalPosition(self):
+        """
+        Returns the goal position in the maze for the search problem.
+        """
+        return self.maze.getGoalPos()
+
+    def getCostOfActions(self, actions = None):
+        """
+        Returns the gCost of a sequence of legal actions.
+        :param actions: tuple ( state, successor state ) of the roll taken
+        """
+        return 1
+
+    def getPath(self, goal):
+        """
+        Returns the path from the start state to the given state.
+        :param goal: Search state reached by the search, may be None
+        :return: list of the states on the path, empty if goal is None
+        """
+        path = list()
+        while goal is not None:
+            path.insert(0, goal)
+            goal = goal.getParent()
+        return path
+
+
+def aStarSearch(problem, heuristicName, fringe, visitedNodes, trace=None, checkpoint=None):
+    """
+    Search the nodes which is having the lowest fCost which is equal to the
+    actual cost (gCost) and the heuristic cost(hCost) which is provided by
+    the heuristics.
+    :param visitedNodes: States that has been visited once. i.e., states whose
+           children have been generated
+    :param fringe: Priority Queue in which the nodes have been put up
+    :param heuristicName: The heuristic which is to be used in helping A*
+           search algorithm, either the name of a Heuristic method, a
+           heuristic function or a HeuristicCache. Names and functions are
+           wrapped in a fresh unbounded HeuristicCache for this search.
+    :param problem: A problem consist of initial state, goal test, successor
+                    functions and a path cost
+    :param trace: TraceRecorder receiving a record for every node expanded,
+                  and pushed or updated if it records pushes, None for no trace
+    :param checkpoint: SearchCheckpoint the search is resumed from and
+                       snapshots its state to, None for no snapshots. The
+                       snapshot file is deleted once the search is over.
+    """
+    tracePushes = trace is not None and trace.pushes
+
+    heuristic = HeuristicCache.create(heuristicName)
+    if checkpoint is None or not checkpoint.resume(problem, fringe, visitedNodes, heuristic):
+        startState = problem.getStartState()
+        startState.setFCost(0 + heuristic(startState, problem))
+        fringe.insert(startState)
+        if tracePushes:
+            trace.record(PUSH, startState, 0, startState.getFCost())
+
+    while not fringe.isEmpty():
+        if checkpoint is not None:
+            checkpoint.tick(problem, fringe, visitedNodes)
+        curState = fringe.pop()
+
+        if problem.isGoalState(curState):
+            print('SUCCESS')
+            visitedNodes.add(curState)
+            if trace is not None:
+                trace.record(GOAL, curState, curState.getGCost(), curState.getFCost(),
+                             curState.getParent())
+            if checkpoint is not None:
+                checkpoint.finish()
+            return curState
+
+        if curState not in visitedNodes:
+            visitedNodes.add(curState)
+            curStateGCost = curState.getGCost()
+            if trace is not None:
+                trace.record(EXPAND, curState, curStateGCost, curState.getFCost(),
+                             curState.getParent())
+
+            for childState in problem.getSuccessors(curState):
+                # Check whether the node is in fringe
+                # If it is in fringe and new cost is less than the previously estimated one
+                #   then change its cost and parent
+                # Rearrange the nodes in heap
+
+                if childState not in visitedNodes:
+                    childStateGCost = curStateGCost + \
+                        problem.getCostOfActions((curState, childState))
+                    hDist = heuristic(childState, problem)
+
+                    if childState in fringe.queue:
+
+                        location = fringe.find(childState)
+                        tempNode = fringe.queue[location]
+
+                        if childStateGCost + hDist < tempNode.getFCost():
+                            childState.setGCost(childStateGCost)
+                            childState.setFCost(childStateGCost + hDist)
+                            childState.setParent(curState)
+                            fringe.update(childState)
+                            if tracePushes:
+                                trace.record(UPDATE, childState, childStateGCost,
+                                             childStateGCost + hDist, curState)
+                    else:
+                        childState.setGCost(childStateGCost)
+                        childState.setFCost(childStateGCost + hDist)
+                        fringe.insert(childState)
+                        if tracePushes:
+                            trace.record(PUSH, childState, childStateGCost,
+                                         childStateGCost + hDist, curState)
+
+    print("FAILURE")
+    if checkpoint is not None:
+        checkpoint.finish()
+    return None
@@ -0,0 +1,196 @@
+"""
+File: selector.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Choice of the heuristic and search engine for a maze from a few
+             features that are cheap to compute, by comparison with the mazes
+             of a calibration table written by
+             "python -m rollingdie.benchmark calibrate".
+"""
+
+import importlib.util
+import json
+import math
+import os
+
+from .dieDistance import MARGIN, RADIUS, getTable
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+# The calibration table shipped with the package
+CALIBRATION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'calibration.json')
+
+# Features of a maze, in the order of the feature vectors
+FEATURES = ['openCells', 'density', 'corridorRatio', 'distance', 'parityRolls']
+
+# Number of calibration mazes the search time is predicted from
+NEIGHBORS = 5
+
+# Shortest time in milliseconds, shorter measures are mostly noise
+MIN_TIME = 1e-3
+
+# The heuristics and engines that need numpy
+NUMPY_HEURISTICS = ('alt',)
+NUMPY_ENGINES = ('graph',)
+
+
+def getFeatures(maze):
+    """
+    The features of a maze, computed in one pass over its locations.
+    openCells is the number of locations without obstacle, density the
+    fraction of obstacles, corridorRatio the fraction of open locations with
+    exactly two open neighbours, distance the Manhattan distance between the
+    starting and goal position and parityRolls the rolls on top of it that
+    the dice needs on an open grid to reach the goal with 1 on top.
+    :param maze: The maze
+    :return: dictionary feature name -> value
+    """
+    openCells = corridors = 0
+    for x in range(maze.width):
+        for y in range(maze.height):
+            if maze.obstacles[x][y]:
+                continue
+            openCells += 1
+            neighbors = 0
+            for nextX, nextY in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+                if 0 <= nextX < maze.width and 0 <= nextY < maze.height and \
+                        not maze.obstacles[nextX][nextY]:
+                    neighbors += 1
+            if neighbors == 2:
+                corridors += 1
+    (startX, startY), (goalX, goalY) = maze.getStartPos(), maze.getGoalPos()
+    dx, dy = startX - goalX, startY - goalY
+    # The extra rolls over the Manhattan distance stop changing a few cells
+    # away from the goal, so the offset is clamped to where the table holds
+    # them exactly, MARGIN cells inside its border
+    limit = RADIUS - MARGIN
+    tableX, tableY = max(-limit, min(limit, dx)), max(-limit, min(limit, dy))
+    return {'openCells': openCells,
+            'density': 1 - openCells / (maze.width * maze.height),
+            'corridorRatio': corridors / openCells if openCells else 0.0,
+            'distance': abs(dx) + abs(dy),
+            'parityRolls': getTable().getDistance(tableX, tableY, 0) - abs(tableX) - abs(tableY)}
+
+
+def getFeatureVector(features):
+    """
+    The features as compared between mazes, sizes and distances on a
+    logarithmic scale.
+    :param features: dictionary feature name -> value
+    :return: list of numbers in the order of FEATURES
+    """
+    return [math.log2(1 + features['openCells']), features['density'],
+            features['corridorRatio'], math.log2(1 + features['distance']),
+            features['parityRolls']]
+
+
+class HeuristicSelector:
+    """
+    The class HeuristicSelector predicts the search time of every heuristic
+    and engine on a maze from the times measured on the calibration mazes
+    with the nearest features, each feature being scaled by its standard
+    deviation over the table, and selects the fastest. The times of the
+    calibration mazes are first brought to the number of open locations of
+    the maze by a power law fitted over the whole table for every heuristic
+    and engine, so that mazes larger than those of the table are predicted
+    with the growth of each engine.
+    The table holds the candidates as "heuristic/engine" strings and for every
+    calibration maze its features and the search times in milliseconds.
+    """
+    __slots__ = 'candidates', 'samples', 'scales', 'exponents', 'neighbors'
+
+    def __init__(self, table, neighbors=NEIGHBORS):
+        """
+        Initializes the selector with a calibration table.
+        :param table: dictionary with the "candidates" and the "samples",
+                      each a dictionary with the "features" and the "times"
+        :param neighbors: Number of calibration mazes a prediction is made of
+        """
+        self.candidates = table['candidates']
+        self.samples = [(getFeatureVector(sample['features']), sample['times'])
+                        for sample in table['samples']]
+        if not self.samples:
+            raise ValueError('the calibration table has no maze')
+        self.neighbors = neighbors
+        self.scales = list()
+        for column in zip(*(vector for vector, times in self.samples)):
+            mean = sum(column) / len(column)
+            deviation = math.sqrt(sum((value - mean) ** 2 for value in column) / len(column))
+            self.scales.append(deviation or 1.0)
+
+        # candidate -> exponent of the number of open locations in the time,
+        # the least squares slope of log time over log size
+        self.exponents = {}
+        for candidate in self.candidates:
+            points = [(vector[0], math.log2(max(times[candidate], MIN_TIME)))
+                      for vector, times in self.samples if candidate in times]
+            meanSize = sum(size for size, time in points) / max(len(points), 1)
+            meanTime = sum(time for size, time in points) / max(len(points), 1)
+            spread = sum((size - meanSize) ** 2 for size, time in points)
+            self.exponents[candidate] = sum((size - meanSize) * (time - meanTime)
+                                            for size, time in points) / spread if spread else 1.0
+
+    @staticmethod
+    def load(fileName=CALIBRATION_FILE, neighbors=NEIGHBORS):
+        """
+        Reads a calibration table.
+        :param fileName: JSON file written by the calibrate benchmark
+        :param neighbors: Number of calibration mazes a prediction is made of
+        :return: HeuristicSelector
+        """
+        with open(fileName) as tableFile:
+            return HeuristicSelector(json.load(tableFile), neighbors)
+
+    def predict(self, features, candidates=None):
+        """
+        The predicted search times on a maze.
+        :param features: dictionary feature name -> value of the maze
+        :param candidates: "heuristic/engine" strings to predict, None for
+                           all the candidates of the table
+        :return: list of tuples ( predicted time in milliseconds, heuristic,
+                 engine ), fastest first
+        """
+        vector = getFeatureVector(features)
+        nearest = sorted(self.samples, key=lambda sample: sum(
+            ((value - other) / scale) ** 2
+            for value, other, scale in zip(vector, sample[0], self.scales)))[:self.neighbors]
+        predictions = list()
+        for candidate in self.candidates if candidates is None else candidates:
+            exponent = self.exponents[candidate]
+            # log2 of the times brought to the size of the maze
+            times = [math.log2(max(times[candidate], MIN_TIME)) + exponent * (vector[0] - other[0])
+                     for other, times in nearest if candidate in times]
+            if times:
+                heuristic, engine = candidate.split('/')
+                # Geometric mean, the times of the nearest mazes can be
+                # orders of magnitude apart
+                predictions.append((2 ** (sum(times) / len(times)), heuristic, engine))
+        return sorted(predictions)
+
+    def select(self, maze, engines=None, heuristics=None):
+        """
+        Selects the heuristic and engine expected to be the fastest on a maze.
+        :param maze: The maze
+        :param engines: engines allowed, None for all
+        :param heuristics: heuristics allowed, None for all
+        :return: tuple ( heuristic, engine, predicted time in milliseconds,
+                 features of the maze )
+        """
+        features = getFeatures(maze)
+        hasNumpy = importlib.util.find_spec('numpy') is not None
+        candidates = list()
+        for candidate in self.candidates:
+            heuristic, engine = candidate.split('/')
+            if engines is not None and engine not in engines or \
+                    heuristics is not None and heuristic not in heuristics:
+                continue
+            if not hasNumpy and (heuristic in NUMPY_HEURISTICS or engine in NUMPY_ENGINES):
+                continue
+            candidates.append(candidate)
+        predictions = self.predict(features, candidates)
+        if not predictions:
+            raise ValueError('no calibrated heuristic and engine to select from')
+        predicted, heuristic, engine = predictions[0]
+        return heuristic, engine, predicted, features
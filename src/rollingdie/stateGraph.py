@@ -0,0 +1,322 @@
+"""
+File: stateGraph.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: The legal states of a maze compiled once into a graph in
+             compressed sparse row ( CSR ) form, and an A* search driven by
+             its arrays. Searches on a compiled maze never roll a dice, look
+             up a node map or check a mask: the successors of a state are a
+             slice of the indices array.
+"""
+
+import heapq
+
+import numpy as np
+
+from .dice import Dice
+from .heuristic import Heuristic, HeuristicCache
+from .node import Node
+from .orientation import NUM_ORIENTATIONS, ORIENTATION_BITS, ORIENTATION_INDEX, ORIENTATIONS, \
+    ROLL_LIST, ROLLS
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+
+class StateGraph:
+    """
+    The class StateGraph holds the states ( cell, orientation ) a maze allows
+    without the goal rule, numbered 0 to size - 1, and the rolls between
+    them. The successors of vertex v are indices[ indptr[ v ] : indptr[ v + 1 ]
+    ], in the order of the moves of getLegalNeighbors. As the goal rule is
+    left out, one graph serves every start and goal on the maze; the searches
+    close the states of the goal location that the goal rule forbids.
+    """
+    __slots__ = 'width', 'height', 'stateIds', 'vertices', 'indptr', 'indices', \
+                'xs', 'ys', 'orientations'
+
+    def __init__(self, maze):
+        """
+        Compiles the graph of a maze.
+        :param maze: The maze
+        """
+        from .landmarks import LandmarkTable
+
+        self.width = maze.width
+        self.height = maze.height
+        numStates = maze.width * maze.height * NUM_ORIENTATIONS
+        # ( states, 4 ) successor state ids in the order of sorted( ROLLS ),
+        # -1 where the roll is not allowed
+        successors = LandmarkTable.buildSuccessors(maze)
+        moves = sorted(ROLLS)
+        successors = successors[:, [moves.index((dx, dy)) for dx, dy, roll in ROLL_LIST]]
+
+        masks = np.array([[maze.getBaseMask(x, y) for y in range(self.height)]
+                          for x in range(self.width)], dtype=np.int64).reshape(-1)
+        allowed = ((masks[:, None] >> np.arange(NUM_ORIENTATIONS)) & 1 == 1).reshape(-1)
+
+        # vertex -> state id and state id -> vertex, -1 for the states not
+        # allowed
+        self.stateIds = np.flatnonzero(allowed)
+        self.vertices = np.full(numStates, -1, dtype=np.int64)
+        self.vertices[self.stateIds] = np.arange(len(self.stateIds))
+
+        rows = successors[self.stateIds]
+        rolls = rows >= 0
+        self.indptr = np.zeros(len(self.stateIds) + 1, dtype=np.int64)
+        np.cumsum(rolls.sum(axis=1), out=self.indptr[1:])
+        self.indices = self.vertices[rows[rolls]]
+
+        cells = self.stateIds // NUM_ORIENTATIONS
+        self.xs = cells // self.height
+        self.ys = cells % self.height
+        self.orientations = self.stateIds % NUM_ORIENTATIONS
+
+    def __len__(self):
+        """
+        The number of vertices, i.e. of states the maze allows.
+        :return: number of vertices
+        """
+        return len(self.stateIds)
+
+    def getEdgeCount(self):
+        """
+        The number of rolls between the states.
+        :return: number of edges
+        """
+        return len(self.indices)
+
+    def getVertex(self, x, y, orientation):
+        """
+        The vertex of a state.
+        :param x: x-coordinate
+        :param y: y-coordinate
+        :param orientation: orientation index of the dice
+        :return: vertex, -1 if the maze does not allow the state
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return -1
+        return int(self.vertices[(x * self.height + y) * NUM_ORIENTATIONS + orientation])
+
+    def getState(self, vertex):
+        """
+        The state of a vertex.
+        :param vertex: vertex
+        :return: tuple ( x-coordinate, y-coordinate, orientation index )
+        """
+        return int(self.xs[vertex]), int(self.ys[vertex]), int(self.orientations[vertex])
+
+    def getHeuristics(self, heuristic, goalPos, maze):
+        """
+        The heuristic values of all the vertices, computed with array
+        operations for the heuristics of the Heuristic class that have an
+        array form.
+        :param heuristic: A heuristic function or a HeuristicCache
+        :param goalPos: tuple ( x-coordinate, y-coordinate ) of the goal
+        :param maze: The maze, for the landmarks of the alt heuristic
+        :return: list of the values by vertex, None if the heuristic has no
+                 array form
+        """
+        function = heuristic.heuristic if isinstance(heuristic, HeuristicCache) else heuristic
+        dx = np.abs(self.xs - goalPos[0])
+        dy = np.abs(self.ys - goalPos[1])
+        if function is Heuristic.manhattan:
+            values = dx + dy
+        elif function is Heuristic.euclidean:
+            values = np.sqrt(dx * dx + dy * dy)
+        elif function is Heuristic.diagonal:
+            values = np.minimum(dx, dy) * np.sqrt(2) + np.abs(dx - dy)
+        elif function in (Heuristic.die_distance, Heuristic.alt):
+            from .dieDistance import getTable
+            values = getTable().getDistances(self.xs - goalPos[0], self.ys - goalPos[1],
+                                             self.orientations)
+            if function is Heuristic.alt:
+                values = np.maximum(values, maze.getLandmarks().getDistances(self.stateIds,
+                                                                             goalPos))
+        else:
+            return None
+        return values.tolist()
+
+
+class GraphFringe:
+    """
+    The open list of the graph search, a binary heap of tuples ( sort key,
+    vertex ) kept by heapq. A vertex reached again with a lower g cost is
+    pushed once more and the outdated entry is skipped when it is popped.
+    Ties of the f cost are broken as by the TieBreaking policies of the
+    PriorityQueue.
+    """
+    __slots__ = 'heap', 'nodesPutOnQueue', 'nodesTakenOff', 'counter', 'sortKey'
+
+    # Tie-breaking policy -> function ( f cost, g cost, h cost, dice top,
+    # counter ) -> sort key
+    SORT_KEYS = {
+        'none': lambda f, g, h, top, counter: (f, counter),
+        'highG': lambda f, g, h, top, counter: (f, -g, counter),
+        'lowH': lambda f, g, h, top, counter: (f, h, counter),
+        'lifo': lambda f, g, h, top, counter: (f, -counter),
+        'fifo': lambda f, g, h, top, counter: (f, counter),
+        'goalOrientation': lambda f, g, h, top, counter:
+            (f, h, 0 if top == 1 else 2 if top == 6 else 1, counter),
+    }
+
+    def __init__(self, tieBreaking='none'):
+        """
+        Initializes the empty open list.
+        :param tieBreaking: Name of a TieBreaking policy
+        """
+        self.heap = list()
+        self.nodesPutOnQueue = 0
+        self.nodesTakenOff = 0
+        self.counter = 0
+        self.sortKey = GraphFringe.SORT_KEYS[tieBreaking]
+
+    def push(self, vertex, gCost, hCost, top, isNew):
+        """
+        Puts a vertex on the open list.
+        :param vertex: vertex
+        :param gCost: g cost of the vertex
+        :param hCost: h cost of the vertex
+        :param top: dice top of the vertex
+        :param isNew: False if the vertex is already on the open list with a
+                      higher g cost
+        :return: None
+        """
+        self.counter += 1
+        if isNew:
+            self.nodesPutOnQueue += 1
+        heapq.heappush(self.heap, (self.sortKey(gCost + hCost, gCost, hCost, top, self.counter),
+                                   vertex))
+
+    def pop(self):
+        """
+        Takes the entry with the lowest sort key off the open list.
+        :return: vertex
+        """
+        return heapq.heappop(self.heap)[1]
+
+    def isEmpty(self):
+        """
+        It checks whether the open list is empty or not
+        :return: True if empty else False
+        """
+        return not self.heap
+
+
+def graphSearch(problem, heuristicName, fringe, visitedNodes, trace=None):
+    """
+    The A* search of aStarSearch run on the compiled StateGraph of the maze
+    of the problem. Only the nodes of the path are built, the states of the
+    search are vertices and their costs and parents live in lists indexed by
+    vertex.
+    :param problem: A Problem on the maze to search, whose start and goal
+                    position are used
+    :param heuristicName: Name of a Heuristic method, a heuristic function or
+                          a HeuristicCache. Heuristics without array form are
+                          evaluated on nodes built for the states they reach.
+    :param fringe: GraphFringe in which the vertices are put up
+    :param visitedNodes: set receiving the state ids of the expanded states
+    :param trace: not supported, must be None
+    :return: goal node with its parents up to the start, None if there is no
+             path
+    """
+    if trace is not None:
+        raise ValueError('the graph engine does not record traces')
+    maze = problem.maze
+    graph = maze.getStateGraph()
+    size = len(graph)
+    indptr = memoryview(graph.indptr)
+    indices = memoryview(graph.indices)
+    stateIds = memoryview(graph.stateIds)
+    tops = [ORIENTATIONS[orientation][0] for orientation in graph.orientations.tolist()]
+
+    goalX, goalY = maze.getGoalPos()
+    heuristic = HeuristicCache.create(heuristicName)
+    hCosts = graph.getHeuristics(heuristic, (goalX, goalY), maze)
+    if hCosts is None:
+        hCosts = [None] * size
+
+    def getHCost(vertex):
+        if hCosts[vertex] is None:
+            x, y, orientation = graph.getState(vertex)
+            top, right, north = ORIENTATIONS[orientation]
+            hCosts[vertex] = heuristic(Node(maze, Dice(top, right, north), '.', None, None,
+                                            x, y, None), problem)
+        return hCosts[vertex]
+
+    gCosts = [None] * size
+    parents = [-1] * size
+    closed = bytearray(size)
+    # The goal rule: on the goal location only the orientations of the goal
+    # mask, the others are closed before the search starts
+    goals = set()
+    if goalX is not None:
+        goalMask = maze.getMask(goalX, goalY)
+        for orientation in range(NUM_ORIENTATIONS):
+            vertex = graph.getVertex(goalX, goalY, orientation)
+            if vertex >= 0:
+                if goalMask & ORIENTATION_BITS[orientation]:
+                    goals.add(vertex)
+                else:
+                    closed[vertex] = 1
+
+    startX, startY = maze.getStartPos()
+    start = graph.getVertex(startX, startY, 0)
+    if start >= 0 and not closed[start]:
+        gCosts[start] = 0
+        fringe.push(start, 0, getHCost(start), tops[start], True)
+    else:
+        # A start the maze does not allow is left once and never entered
+        # again, its successors are rolled the usual way
+        aDice = Dice()
+        for x, y, top, right, north in maze.getLegalNeighbors(startX, startY, aDice):
+            vertex = graph.getVertex(x, y, ORIENTATION_INDEX[(top, right, north)])
+            if gCosts[vertex] is None:
+                gCosts[vertex] = 1
+                fringe.push(vertex, 1, getHCost(vertex), top, True)
+
+    goal = None
+    while not fringe.isEmpty():
+        vertex = fringe.pop()
+        if closed[vertex]:
+            continue
+        closed[vertex] = 1
+        fringe.nodesTakenOff += 1
+        visitedNodes.add(stateIds[vertex])
+        if vertex in goals:
+            goal = vertex
+            break
+
+        gCost = gCosts[vertex] + 1
+        for child in indices[indptr[vertex]:indptr[vertex + 1]]:
+            if closed[child]:
+                continue
+            childGCost = gCosts[child]
+            if childGCost is None or gCost < childGCost:
+                gCosts[child] = gCost
+                parents[child] = vertex
+                fringe.push(child, gCost, getHCost(child), tops[child], childGCost is None)
+
+    if goal is None:
+        print("FAILURE")
+        return None
+    print('SUCCESS')
+
+    vertices = list()
+    vertex = goal
+    while vertex >= 0:
+        vertices.append(vertex)
+        vertex = parents[vertex]
+    vertices.reverse()
+    path = list()
+    if start < 0 or vertices[0] != start:
+        path.append(Node(maze, Dice(), 'S', 0, None, startX, startY, None))
+    for vertex in vertices:
+        x, y, orientation = graph.getState(vertex)
+        top, right, north = ORIENTATIONS[orientation]
+        name = 'G' if vertex == goal else 'S' if not path else '.'
+        gCost = gCosts[vertex]
+        path.append(Node(maze, Dice(top, right, north), name, gCost, gCost + getHCost(vertex),
+                         x, y, path[-1] if path else None))
+    return path[-1]
@@ -0,0 +1,220 @@
+"""
+File: stream.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Streams of mazes solved as they are read. A stream holds maze
+             records separated by blank lines, each optionally headed by a
+             line "> id", and every record gives one result line, written in
+             the order of the records while the later records are still
+             being read and solved.
+"""
+
+import contextlib
+import io
+import os
+
+from .maze import CONSTRAINT_PREFIX, Maze
+from .parallel import solveQuery
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+# First character of the id line of a record
+HEADER_PREFIX = '>'
+
+# Columns of a result line, separated by tabs. The path is the locations of
+# the dice with the number on top, "(x,y)top" separated by spaces, or the
+# error message of a record that could not be solved.
+RESULT_COLUMNS = ['id', 'status', 'moves', 'heuristic', 'engine', 'path']
+
+# Records read ahead of the result being waited for, per worker
+WINDOW_PER_WORKER = 2
+
+
+def readRecords(lines):
+    """
+    Splits a stream of lines into maze records, reading only the lines of
+    the records taken so far. A record ends at a blank line, at the id line
+    of the next record or at the end of the stream.
+    :param lines: iterable of lines, e.g. a file opened for reading
+    :return: generator of tuples ( id, the 2-D array of the maze followed by
+             its constraint lines ), the id being the one of the id line or
+             else the number of the record counted from 1
+    """
+    count = 0
+    recordId, layout = None, list()
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith(HEADER_PREFIX):
+            layout.append(line)
+            continue
+        if layout or recordId is not None and line:
+            # An id line right after another one gives an empty record
+            count += 1
+            yield recordId if recordId is not None else str(count), layout
+            recordId, layout = None, list()
+        if line:
+            recordId = line[len(HEADER_PREFIX):].strip()
+    if layout or recordId is not None:
+        count += 1
+        yield recordId if recordId is not None else str(count), layout
+
+
+def parseMaze(layout):
+    """
+    Builds the maze of a record, checking what the maze files are trusted
+    with: rows of equal length, a starting and a goal position.
+    :param layout: The 2-D array of the maze followed by its constraint lines
+    :return: Maze
+    """
+    rows = [line for line in layout if not line.startswith(CONSTRAINT_PREFIX)]
+    if not rows:
+        raise ValueError('the record holds no maze')
+    if any(len(row) != len(rows[0]) for row in rows):
+        raise ValueError('the rows of the maze have different lengths')
+    aMaze = Maze(layout)
+    if None in aMaze.getStartPos() or None in aMaze.getGoalPos():
+        raise ValueError('the maze has no starting or goal position')
+    return aMaze
+
+
+_selector = None
+
+
+def getSelector():
+    """
+    The HeuristicSelector of the auto heuristic, read on first use and then
+    shared by the records solved in this process.
+    :return: HeuristicSelector
+    """
+    global _selector
+    if _selector is None:
+        from .selector import HeuristicSelector
+        _selector = HeuristicSelector.load()
+    return _selector
+
+
+def solveRecord(record, heuristicName='die_distance', engine=None):
+    """
+    Solves the maze of a record without printing anything.
+    :param record: tuple ( id, the 2-D array of the maze followed by its
+                   constraint lines )
+    :param heuristicName: Name of a Heuristic method, or 'auto' for the
+                          heuristic and engine selected for every maze
+    :param engine: 'astar', 'fringe' or 'graph', None for 'astar' or, with
+                   the auto heuristic, for the engine selected
+    :return: tuple of the RESULT_COLUMNS, as strings
+    """
+    recordId, layout = record
+    heuristic = heuristicName
+    try:
+        aMaze = parseMaze(layout)
+        if heuristicName == 'auto':
+            heuristic, engine, predicted, features = getSelector().select(
+                aMaze, [engine] if engine is not None else None)
+        engine = engine or 'astar'
+        with contextlib.redirect_stdout(io.StringIO()):
+            path = solveQuery(aMaze, None, None, heuristic, engine)
+    except ValueError as error:
+        return recordId, 'ERROR', '-', heuristic, engine or '-', str(error)
+    if not path:
+        return recordId, 'FAILURE', '-', heuristic, engine, ''
+    return recordId, 'SUCCESS', str(len(path) - 1), heuristic, engine, ' '.join(
+        "(%d,%d)%d" % (node.getxCoordinate(), node.getyCoordinate(), node.getDice().top)
+        for node in path)
+
+
+def solveRecords(records, heuristicName='die_distance', engine=None, workers=1, window=None):
+    """
+    Solves records as they come from a process pool, yielding the results in
+    the order of the records as soon as they are known. The records are read
+    and handed to the pool by a thread, which waits while window results are
+    yet to be taken: the memory stays bounded whatever the length of the
+    stream, and a slow reader of the results slows down the reading of the
+    records.
+    :param records: iterable of records, e.g. the generator of readRecords
+    :param heuristicName: Name of a Heuristic method, or 'auto'
+    :param engine: 'astar', 'fringe' or 'graph', None for the default of
+                   solveRecord
+    :param workers: Number of processes, None for the number of CPUs and 1
+                    to solve in this process
+    :param window: Results yet to be taken before the reading waits, None for
+                   WINDOW_PER_WORKER per worker
+    :return: generator of the results of solveRecord
+    """
+    if workers == 1:
+        for record in records:
+            yield solveRecord(record, heuristicName, engine)
+        return
+
+    # Imported here so that importing the package does not start up
+    # multiprocessing and threading
+    import queue
+    import threading
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    slots = threading.Semaphore(window or WINDOW_PER_WORKER * workers)
+    # Futures of the results in the order of the records, then None at the
+    # end of the stream or the error raised by the reading
+    futures = queue.Queue()
+    stopped = threading.Event()
+
+    def submitRecords(executor):
+        try:
+            for record in records:
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                futures.put(executor.submit(solveRecord, record, heuristicName, engine))
+        except Exception as error:
+            futures.put(error)
+            return
+        futures.put(None)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        reader = threading.Thread(target=submitRecords, args=(executor,), daemon=True)
+        reader.start()
+        try:
+            while True:
+                future = futures.get()
+                if future is None:
+                    return
+                if isinstance(future, Exception):
+                    raise future
+                yield future.result()
+                slots.release()
+        finally:
+            # The reader stops at its next record, and the results nobody
+            # will take any more are not computed
+            stopped.set()
+            slots.release()
+            while not futures.empty():
+                future = futures.get()
+                if future is not None and not isinstance(future, Exception):
+                    future.cancel()
+
+
+def runStream(inputFile, outputFile, heuristicName='die_distance', engine=None, workers=1,
+              window=None):
+    """
+    Solves the maze records of a stream and writes a result line per record,
+    flushed as soon as it is known.
+    :param inputFile: File of maze records opened for reading, e.g. sys.stdin
+    :param outputFile: File opened for writing, e.g. sys.stdout
+    :param heuristicName: Name of a Heuristic method, or 'auto'
+    :param engine: 'astar', 'fringe' or 'graph', None for the default of
+                   solveRecord
+    :param workers: Number of processes, None for the number of CPUs and 1
+                    to solve in this process
+    :param window: Records handed to the pool ahead, None for the default of
+                   solveRecords
+    :return: number of records solved
+    """
+    count = 0
+    for result in solveRecords(readRecords(inputFile), heuristicName, engine, workers, window):
+        outputFile.write('\t'.join(result) + '\n')
+        outputFile.flush()
+        count += 1
+    return count
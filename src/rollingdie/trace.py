@@ -0,0 +1,260 @@
+"""
+File: trace.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Low overhead binary trace of the A* search. The recorder
+             collects fixed-width records in chunks copied at once into a
+             preallocated ring buffer, either an array in memory or a
+             memory-mapped file, and the reader turns a trace into NumPy
+             arrays for offline analysis.
+"""
+
+import mmap
+import struct
+
+from .orientation import FACES_INDEX, NUM_ORIENTATIONS, getStateId
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+# Event types
+PUSH = 0
+EXPAND = 1
+UPDATE = 2
+GOAL = 3
+
+EVENT_NAMES = ['push', 'expand', 'update', 'goal']
+
+# A record is ( state id, g cost, h cost, parent state id, event type ), all
+# stored as float64 so that one buffer format serves memory and files
+RECORD_SIZE = 5
+
+# The header is ( magic, version, width, height, capacity, records written,
+# unused, unused )
+HEADER_SIZE = 8
+MAGIC = 0x52444d54
+VERSION = 1
+
+RECORD = struct.Struct('<%dd' % RECORD_SIZE)
+HEADER = struct.Struct('<%dd' % HEADER_SIZE)
+
+# Records collected before they are copied into the ring buffer
+CHUNK_RECORDS = 1024
+CHUNK_SIZE = CHUNK_RECORDS * RECORD_SIZE
+
+
+class TraceRecorder:
+    """
+    The class TraceRecorder records search events into a ring buffer of
+    capacity records, so the oldest records are overwritten once the search
+    outgrows it. States are identified by ( x-coordinate * height +
+    y-coordinate ) * 24 + orientation index, -1 standing for no parent.
+    A record only appends its values to a list, and every CHUNK_RECORDS
+    records the list is packed into the buffer by a single struct call.
+    Only expansions are recorded unless pushes is set, as a record costs
+    several percent of an expansion while every expansion pushes several
+    nodes.
+    """
+    __slots__ = 'width', 'height', 'capacity', 'pushes', 'count', 'chunk', 'buffer', 'file'
+
+    def __init__(self, maze, capacity=1 << 16, fileName=None, pushes=False):
+        """
+        Preallocates the buffer.
+        :param maze: The maze being searched
+        :param capacity: Number of records kept, at least 1
+        :param fileName: File to memory-map the buffer to, None to keep it in
+                         memory
+        :param pushes: Also record the PUSH and UPDATE events
+        """
+        if capacity < 1:
+            raise ValueError('the trace capacity must be at least 1 record')
+        self.width = maze.width
+        self.height = maze.height
+        self.capacity = capacity
+        self.pushes = pushes
+        # Number of records copied into the buffer
+        self.count = 0
+        # Values of the records yet to be copied
+        self.chunk = list()
+        self.file = None
+        size = HEADER.size + capacity * RECORD.size
+        if fileName is None:
+            self.buffer = bytearray(size)
+        else:
+            self.file = open(fileName, 'w+b')
+            self.file.truncate(size)
+            self.buffer = mmap.mmap(self.file.fileno(), size)
+        self.flush()
+
+    def getStateId(self, node):
+        """
+        The integer identifying the state of a node, cached on the node. The
+        parent of a node was expanded and recorded before it, so record finds
+        its id cached but after a search resumed from a checkpoint.
+        :param node: A node object
+        :return: state id
+        """
+        stateId = node.stateId = getStateId(node, self.height)
+        return stateId
+
+    def record(self, event, node, gCost, fCost, parent=None):
+        """
+        Appends a record. The costs are passed by the search, which has them
+        at hand, rather than read back from the node.
+        :param event: Event type, one of PUSH, EXPAND, UPDATE and GOAL
+        :param node: The node the event happened to
+        :param gCost: g cost of the node
+        :param fCost: f cost of the node
+        :param parent: The parent of the node, None for no parent
+        :return: None
+        """
+        stateId = node.stateId
+        if stateId is None:
+            # getStateId inlined, the node being recorded for the first time
+            # on most records
+            x, y = node.getPos()
+            dice = node.dice
+            stateId = node.stateId = (x * self.height + y) * NUM_ORIENTATIONS + \
+                FACES_INDEX[dice.top * 7 + dice.right]
+        if parent is None:
+            parentId = -1
+        else:
+            parentId = parent.stateId
+            if parentId is None:
+                parentId = self.getStateId(parent)
+        chunk = self.chunk
+        chunk += stateId, gCost, fCost - gCost, parentId, event
+        if len(chunk) >= CHUNK_SIZE:
+            self.flushChunk()
+
+    def flushChunk(self):
+        """
+        Copies the records collected so far into the ring buffer, in one or
+        two pieces when the chunk wraps around the end of the buffer.
+        :return: None
+        """
+        chunk = self.chunk
+        records = len(chunk) // RECORD_SIZE
+        if not records:
+            return
+        data = memoryview(struct.pack('<%dd' % len(chunk), *chunk))
+        del chunk[:]
+
+        start = self.count
+        self.count += records
+        if records > self.capacity:
+            # Only the last capacity records of the chunk are kept
+            skipped = records - self.capacity
+            data = data[skipped * RECORD.size:]
+            start += skipped
+            records = self.capacity
+        while records:
+            position = start % self.capacity
+            length = min(records, self.capacity - position)
+            offset = HEADER.size + position * RECORD.size
+            self.buffer[offset:offset + length * RECORD.size] = data[:length * RECORD.size]
+            data = data[length * RECORD.size:]
+            start += length
+            records -= length
+
+    def flush(self):
+        """
+        Copies the records collected into the buffer, writes their number to
+        the header and flushes a memory-mapped buffer to its file.
+        :return: None
+        """
+        self.flushChunk()
+        HEADER.pack_into(self.buffer, 0, MAGIC, VERSION, self.width, self.height,
+                         self.capacity, self.count, 0, 0)
+        if self.file is not None:
+            self.buffer.flush()
+
+    def save(self, fileName):
+        """
+        Writes the trace to a file readable by loadTrace.
+        :param fileName: The file to write
+        :return: None
+        """
+        self.flush()
+        with open(fileName, 'wb') as traceFile:
+            traceFile.write(self.buffer[:])
+
+    def close(self):
+        """
+        Flushes and releases a memory-mapped buffer.
+        :return: None
+        """
+        self.flush()
+        if self.file is not None:
+            self.buffer.close()
+            self.file.close()
+            self.buffer = self.file = None
+
+
+def loadTrace(source):
+    """
+    Reads a trace into a NumPy structured array in chronological order.
+    :param source: A trace file name or a TraceRecorder
+    :return: tuple of the records, with the fields state, g, h, parent,
+             event, x, y and orientation, and the ( width, height ) of the maze
+    """
+    import numpy as np
+
+    if isinstance(source, TraceRecorder):
+        source.flush()
+        raw = np.frombuffer(bytes(source.buffer[:]), dtype='<f8')
+    else:
+        raw = np.fromfile(source, dtype='<f8')
+    if raw.size < HEADER_SIZE or raw[0] != MAGIC:
+        raise ValueError('not a search trace')
+    width, height, capacity, count = (int(value) for value in raw[2:6])
+
+    records = raw[HEADER_SIZE:HEADER_SIZE + capacity * RECORD_SIZE].reshape(capacity, RECORD_SIZE)
+    if count > capacity:
+        start = count % capacity
+        records = np.concatenate((records[start:], records[:start]))
+    else:
+        records = records[:count]
+
+    trace = np.zeros(len(records), dtype=[('state', 'i8'), ('g', 'f8'), ('h', 'f8'),
+                                          ('parent', 'i8'), ('event', 'i1'), ('x', 'i4'),
+                                          ('y', 'i4'), ('orientation', 'i1')])
+    trace['state'] = records[:, 0]
+    trace['g'] = records[:, 1]
+    trace['h'] = records[:, 2]
+    trace['parent'] = records[:, 3]
+    trace['event'] = records[:, 4]
+    cells = trace['state'] // NUM_ORIENTATIONS
+    trace['x'] = cells // height
+    trace['y'] = cells % height
+    trace['orientation'] = trace['state'] % NUM_ORIENTATIONS
+    return trace, (width, height)
+
+
+def expansionsPerFLayer(trace):
+    """
+    Counts the expansions for every f cost.
+    :param trace: records returned by loadTrace
+    :return: tuple of the sorted f costs and the number of expansions
+    """
+    import numpy as np
+
+    expanded = trace[trace['event'] == EXPAND]
+    return np.unique(expanded['g'] + expanded['h'], return_counts=True)
+
+
+def expansionHeatmap(trace, size):
+    """
+    Counts the expansions of every cell of the maze.
+    :param trace: records returned by loadTrace
+    :param size: tuple ( width, height ) of the maze
+    :return: 2-D array indexed by [ y-coordinate, x-coordinate ]
+    """
+    import numpy as np
+
+    width, height = size
+    expanded = trace[trace['event'] == EXPAND]
+    heatmap = np.zeros((height, width), dtype=np.int64)
+    np.add.at(heatmap, (expanded['y'], expanded['x']), 1)
+    return heatmap
@@ -0,0 +1,353 @@
+"""
+File: waypoints.py
+Language: Python 3.5.1
+Author: Aravindh Kuppusamy (axk8776@g.rit.edu)
+        Deepak Sharma (ds5930@g.rit.edu)
+        Karan Jariwala (kkj1811@g.rit.edu)
+Description: Route planning through several waypoints of the Rolling Die
+             Maze before the goal. The rolls between the waypoints are
+             counted for every orientation of the dice, on a process pool,
+             and the visiting order is chosen exactly for a few waypoints
+             and by local search for many.
+"""
+
+from collections import deque
+from itertools import repeat
+
+from .dice import Dice
+from .node import Node
+from .orientation import NUM_ORIENTATIONS, ORIENTATIONS, ROLLS, getIndex
+
+__author__ = 'Aravindh Kuppusamy, Deepak Sharma, Karan Jariwala'
+
+# Largest number of waypoints whose best order is searched exhaustively
+EXACT_LIMIT = 7
+
+
+def rollDistances(maze, source, targetCells):
+    """
+    Breadth first search from one state counting the rolls to every
+    orientation of some cells. Rolls cost the same, so it is a one-to-many
+    shortest path search.
+    :param maze: The maze
+    :param source: tuple ( x-coordinate, y-coordinate, orientation index )
+    :param targetCells: list of tuples ( x-coordinate, y-coordinate )
+    :return: dictionary target cell -> dictionary orientation index ->
+             number of rolls, for the orientations that can be reached
+    """
+    targets = {cell: dict() for cell in targetCells}
+    remaining = sum(len([orientation for orientation in range(NUM_ORIENTATIONS)
+                         if maze.isLegalState(cell[0], cell[1], orientation)])
+                    for cell in targets)
+    distances = {source: 0}
+    frontier = deque([source])
+    rolls = list(ROLLS.items())
+    while frontier and remaining:
+        state = frontier.popleft()
+        x, y, orientation = state
+        distance = distances[state]
+        if (x, y) in targets:
+            targets[(x, y)][orientation] = distance
+            remaining -= 1
+        for (dx, dy), roll in rolls:
+            nextState = (x + dx, y + dy, roll[orientation])
+            if nextState not in distances and maze.isLegalState(*nextState):
+                distances[nextState] = distance + 1
+                frontier.append(nextState)
+    return targets
+
+
+def rollPath(maze, source, target):
+    """
+    Breadth first search of the shortest sequence of rolls between two
+    states.
+    :param maze: The maze
+    :param source: tuple ( x-coordinate, y-coordinate, orientation index )
+    :param target: tuple ( x-coordinate, y-coordinate, orientation index )
+    :return: list of the states from source to target, None if there is no
+             path
+    """
+    parents = {source: None}
+    frontier = deque([source])
+    rolls = list(ROLLS.items())
+    while frontier:
+        state = frontier.popleft()
+        if state == target:
+            path = list()
+            while state is not None:
+                path.insert(0, state)
+                state = parents[state]
+            return path
+        x, y, orientation = state
+        for (dx, dy), roll in rolls:
+            nextState = (x + dx, y + dy, roll[orientation])
+            if nextState not in parents and maze.isLegalState(*nextState):
+                parents[nextState] = state
+                frontier.append(nextState)
+    return None
+
+
+def _legCosts(maze, source, targetCells):
+    """
+    The task run by the process pool.
+    :param maze: The maze
+    :param source: tuple ( x-coordinate, y-coordinate, orientation index )
+    :param targetCells: list of tuples ( x-coordinate, y-coordinate )
+    :return: tuple of source and its rollDistances
+    """
+    return source, rollDistances(maze, source, targetCells)
+
+
+class WaypointPlanner:
+    """
+    The class WaypointPlanner plans the route of the dice from the starting
+    position through waypoints to the goal with 1 on top. The dice reaches a
+    waypoint in some orientation and leaves it in the same one, so the cost
+    of a leg depends on the orientation at both ends. The rolls from every
+    orientation of every waypoint to the other waypoints and the goal are
+    counted by one search per state, on a process pool, and cached in the
+    maze for later plans.
+    """
+    __slots__ = 'maze', 'workers', 'searches'
+
+    def __init__(self, maze, workers=None):
+        """
+        Initializes the planner.
+        :param maze: The maze, which must be picklable for the process pool
+        :param workers: Number of processes, None for the number of CPUs and
+                        1 to search in this process
+        """
+        self.maze = maze
+        self.workers = workers
+        # Number of one-to-many searches run by this planner
+        self.searches = 0
+
+    def computeLegCosts(self, sources, targetCells):
+        """
+        Counts the rolls from states to every orientation of cells, skipping
+        the ones already cached in the maze.
+        :param sources: list of tuples ( x-coordinate, y-coordinate,
+                        orientation index )
+        :param targetCells: list of tuples ( x-coordinate, y-coordinate )
+        :return: None
+        """
+        cache = self.maze.legCosts
+        tasks = [source for source in sources
+                 if any(cell not in cache.get(source, ()) for cell in targetCells)]
+        if self.workers == 1 or len(tasks) < 2:
+            results = map(_legCosts, repeat(self.maze), tasks, repeat(targetCells))
+        else:
+            # Imported here so that importing the package does not start up
+            # multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(_legCosts, repeat(self.maze), tasks,
+                                            repeat(targetCells),
+                                            chunksize=max(1, len(tasks) // (4 * (self.workers or 4)))))
+        for source, distances in results:
+            cache.setdefault(source, dict()).update(distances)
+        self.searches += len(tasks)
+
+    def getLegCosts(self, source, cell):
+        """
+        The rolls from a state to every orientation of a cell.
+        :param source: tuple ( x-coordinate, y-coordinate, orientation index )
+        :param cell: tuple ( x-coordinate, y-coordinate )
+        :return: dictionary orientation index -> number of rolls
+        """
+        return self.maze.legCosts[source][cell]
+
+    def getRouteCost(self, start, cells):
+        """
+        The fewest rolls visiting cells in a given order, whatever the
+        orientations on them.
+        :param start: tuple ( x-coordinate, y-coordinate, orientation index )
+        :param cells: list of tuples ( x-coordinate, y-coordinate ), the goal
+                      last
+        :return: tuple of the number of rolls and the list of the states on
+                 the cells, None if the cells cannot be visited in that order
+        """
+        # state -> ( rolls, previous state ) for every cell of the route
+        layers = [{start: (0, None)}]
+        for cell in cells:
+            layer = dict()
+            for state, (cost, previous) in layers[-1].items():
+                for orientation, rolls in self.getLegCosts(state, cell).items():
+                    nextState = cell + (orientation,)
+                    if nextState not in layer or cost + rolls < layer[nextState][0]:
+                        layer[nextState] = (cost + rolls, state)
+            if not layer:
+                return None
+            layers.append(layer)
+
+        state = min(layers[-1], key=lambda aState: layers[-1][aState][0])
+        cost = layers[-1][state][0]
+        states = list()
+        for layer in reversed(layers[1:]):
+            states.insert(0, state)
+            state = layer[state][1]
+        return cost, states
+
+    def getExactOrder(self, start, waypoints, goal):
+        """
+        The best visiting order by dynamic programming over the subsets of
+        waypoints visited and the state the dice is in.
+        :param start: tuple ( x-coordinate, y-coordinate, orientation index )
+        :param waypoints: list of tuples ( x-coordinate, y-coordinate )
+        :param goal: tuple ( x-coordinate, y-coordinate )
+        :return: list of waypoint indexes, None if there is no route
+        """
+        count = len(waypoints)
+        # subset -> ( waypoint index, orientation index ) -> ( rolls, previous key )
+        best = [dict() for subset in range(1 << count)]
+        for index, cell in enumerate(waypoints):
+            for orientation, rolls in self.getLegCosts(start, cell).items():
+                best[1 << index][(index, orientation)] = (rolls, None)
+
+        for subset in range(1, 1 << count):
+            for key, (cost, previous) in best[subset].items():
+                state = waypoints[key[0]] + (key[1],)
+                for index, cell in enumerate(waypoints):
+                    if subset & (1 << index):
+                        continue
+                    nextSubset = subset | (1 << index)
+                    for orientation, rolls in self.getLegCosts(state, cell).items():
+                        nextKey = (index, orientation)
+                        entry = best[nextSubset].get(nextKey)
+                        if entry is None or cost + rolls < entry[0]:
+                            best[nextSubset][nextKey] = (cost + rolls, key)
+
+        full = (1 << count) - 1
+        finish = None
+        for key, (cost, previous) in best[full].items():
+            toGoal = self.getLegCosts(waypoints[key[0]] + (key[1],), goal)
+            if toGoal and (finish is None or cost + min(toGoal.values()) < finish[0]):
+                finish = (cost + min(toGoal.values()), key)
+        if finish is None:
+            return None
+
+        order = list()
+        key, subset = finish[1], full
+        while key is not None:
+            order.insert(0, key[0])
+            key, subset = best[subset][key][1], subset & ~(1 << key[0])
+        return order
+
+    def getLocalSearchOrder(self, start, waypoints, goal):
+        """
+        A good visiting order for many waypoints: the nearest waypoint is
+        visited next, then single waypoints are moved to other places of the
+        order and parts of the order are reversed as long as the route gets
+        shorter.
+        :param start: tuple ( x-coordinate, y-coordinate, orientation index )
+        :param waypoints: list of tuples ( x-coordinate, y-coordinate )
+        :param goal: tuple ( x-coordinate, y-coordinate )
+        :return: list of waypoint indexes, None if there is no route
+        """
+        order = list()
+        layer = {start: 0}
+        remaining = list(range(len(waypoints)))
+        while remaining:
+            nearest = None
+            for index in remaining:
+                nextLayer = dict()
+                for state, cost in layer.items():
+                    for orientation, rolls in self.getLegCosts(state, waypoints[index]).items():
+                        nextState = waypoints[index] + (orientation,)
+                        nextLayer[nextState] = min(nextLayer.get(nextState, cost + rolls),
+                                                   cost + rolls)
+                if nextLayer and (nearest is None or min(nextLayer.values()) < nearest[0]):
+                    nearest = (min(nextLayer.values()), index, nextLayer)
+            if nearest is None:
+                return None
+            order.append(nearest[1])
+            remaining.remove(nearest[1])
+            layer = nearest[2]
+
+        def routeCost(anOrder):
+            route = self.getRouteCost(start, [waypoints[index] for index in anOrder] + [goal])
+            return route[0] if route is not None else None
+
+        cost = routeCost(order)
+        if cost is None:
+            return None
+        improved = True
+        while improved:
+            improved = False
+            # Moves of a single waypoint, then reversals of a part of the order
+            candidates = [order[:position] + order[position + 1:] for position in range(len(order))]
+            candidates = [candidate[:newPosition] + [order[position]] + candidate[newPosition:]
+                          for position, candidate in enumerate(candidates)
+                          for newPosition in range(len(order)) if newPosition != position]
+            candidates += [order[:first] + order[first:last + 1][::-1] + order[last + 1:]
+                           for first in range(len(order)) for last in range(first + 2, len(order))]
+            for candidate in candidates:
+                candidateCost = routeCost(candidate)
+                if candidateCost is not None and candidateCost < cost:
+                    order, cost, improved = candidate, candidateCost, True
+                    break
+        return order
+
+    def plan(self, waypoints, ordered=True):
+        """
+        Plans the route through the waypoints to the goal.
+        :param waypoints: list of tuples ( x-coordinate, y-coordinate )
+        :param ordered: True to visit the waypoints in the given order, False
+                        to choose the order with the fewest rolls
+        :return: tuple of the visiting order as waypoint indexes, the number of
+                 rolls and the list of the states on the waypoints and the
+                 goal, None if there is no route
+        """
+        maze = self.maze
+        start = maze.getStartPos() + (getIndex(Dice()),)
+        goal = maze.getGoalPos()
+        waypoints = [tuple(cell) for cell in waypoints]
+        for cell in waypoints:
+            if not maze.isPosInMaze(cell) or maze.isObstacle(cell):
+                raise ValueError('waypoint %s is not a free location of the maze' % (cell,))
+        cells = waypoints + [goal]
+
+        self.computeLegCosts([start], cells)
+        # Only the orientations reachable from the start matter on the waypoints
+        sources = [cell + (orientation,) for cell in waypoints
+                   for orientation in self.getLegCosts(start, cell)]
+        self.computeLegCosts(sources, cells)
+
+        if ordered or len(waypoints) < 2:
+            order = list(range(len(waypoints)))
+        elif len(waypoints) <= EXACT_LIMIT:
+            order = self.getExactOrder(start, waypoints, goal)
+        else:
+            order = self.getLocalSearchOrder(start, waypoints, goal)
+        if order is None:
+            return None
+        route = self.getRouteCost(start, [waypoints[index] for index in order] + [goal])
+        if route is None:
+            return None
+        return order, route[0], route[1]
+
+    def getPath(self, states):
+        """
+        Stitches the legs between the states of a plan into one path.
+        :param states: the states on the waypoints and the goal returned by
+                       plan
+        :return: list of the nodes on the path from the starting position
+        """
+        maze = self.maze
+        start = maze.getStartPos() + (getIndex(Dice()),)
+        cells = [start]
+        for source, target in zip([start] + states, states):
+            cells.extend(rollPath(maze, source, target)[1:])
+
+        path = list()
+        for gCost, (x, y, orientation) in enumerate(cells):
+            if gCost == 0:
+                name = 'S'
+            elif gCost == len(cells) - 1:
+                name = 'G'
+            else:
+                name = '.'
+            parent = path[-1] if path else None
+            path.append(Node(maze, Dice(*ORIENTATIONS[orientation]), name, gCost, None, x, y,
+                             parent))
+        return path